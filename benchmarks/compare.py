@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Save and check benchmark baselines produced by pytest-benchmark.
+
+Usage (from repo root):
+  pytest benchmarks --benchmark-only --benchmark-json .benchmarks/current.json
+  python benchmarks/compare.py save .benchmarks/current.json benchmarks/baselines/baseline.json
+  python benchmarks/compare.py check benchmarks/baselines/baseline.json .benchmarks/current.json
+
+`check` exits with status 1 if any benchmark's --stat (median or min, default median) is
+slower than the baseline by more than --tolerance (a fraction, default 0.30). Baselines are machine-specific:
+refresh them with `save` when the reference machine changes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+
+def load_run(path: Path) -> Dict[str, Dict[str, float]]:
+    """Return {fullname: {"median": s, "min": s}} from a pytest-benchmark JSON or a baseline."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    benchmarks = data["benchmarks"]
+    if isinstance(benchmarks, dict):  # already a compact baseline
+        return benchmarks
+    return {
+        b["fullname"]: {"median": b["stats"]["median"], "min": b["stats"]["min"]}
+        for b in benchmarks
+    }
+
+
+def save(run_path: Path, baseline_path: Path) -> int:
+    raw: Dict[str, Any] = json.loads(run_path.read_text(encoding="utf-8"))
+    info = raw.get("machine_info", {})
+    baseline = {
+        "machine": {
+            "python": info.get("python_version"),
+            "implementation": info.get("python_implementation"),
+            "machine": info.get("machine"),
+            "cpu": (info.get("cpu") or {}).get("brand_raw"),
+        },
+        "benchmarks": dict(sorted(load_run(run_path).items())),
+    }
+    baseline_path.parent.mkdir(parents=True, exist_ok=True)
+    baseline_path.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+    print(f"[write] {baseline_path} ({len(baseline['benchmarks'])} benchmarks)")
+    return 0
+
+
+def check(baseline_path: Path, run_path: Path, tolerance: float, stat: str = "median") -> int:
+    baseline, current = load_run(baseline_path), load_run(run_path)
+    regressions = 0
+    for name, stats in sorted(current.items()):
+        ref = baseline.get(name)
+        if ref is None:
+            print(f"  new        {name}")
+            continue
+        ratio = stats[stat] / ref[stat] if ref[stat] else 1.0
+        slow = ratio > 1 + tolerance
+        regressions += slow
+        print(f"{'REGRESSION' if slow else 'ok':>10} {ratio:6.2f}x {name}")
+    for name in sorted(set(baseline) - set(current)):
+        print(f"  missing    {name}")
+    if regressions:
+        print(f"{regressions} benchmark(s) slower than baseline by more than {tolerance:.0%}")
+        return 1
+    return 0
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Save/check pytest-benchmark baselines")
+    sub = p.add_subparsers(dest="command", required=True)
+    s = sub.add_parser("save", help="Distill a pytest-benchmark JSON into a baseline")
+    s.add_argument("run", type=Path)
+    s.add_argument("baseline", type=Path)
+    c = sub.add_parser("check", help="Compare a pytest-benchmark JSON against a baseline")
+    c.add_argument("baseline", type=Path)
+    c.add_argument("run", type=Path)
+    c.add_argument("--tolerance", type=float, default=0.30)
+    c.add_argument("--stat", choices=("median", "min"), default="median")
+    args = p.parse_args()
+    if args.command == "save":
+        return save(args.run, args.baseline)
+    return check(args.baseline, args.run, args.tolerance, args.stat)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+# Shared payloads for the benchmark suite; run with `nox -s bench` or
+# `pytest benchmarks --benchmark-only`.
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for sub in ("elementals", "configfuncs"):
+    p = os.path.join(ROOT, "packages", sub, "src")
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from elementals.params import ElementalParams, Environment, Meta, ProcessInfo  # noqa: E402
+
+
+def deep_savepoint(depth: int = 12, width: int = 20) -> dict:
+    """A savepoint with `width` steps, each nested `depth` levels deep."""
+    savepoint = {}
+    for step in range(width):
+        node = {"value": step, "items": list(range(10))}
+        for level in range(depth):
+            node = {f"l{level}": node, "tag": f"step{step}-{level}"}
+        savepoint[f"step{step}"] = node
+    return savepoint
+
+
+def wide_template(width: int = 200) -> dict:
+    """A response-mapping template with `width` dynamic leaves and static padding."""
+    tpl = {f"f{i}": f"$params.items[{i % 50}].val" for i in range(width)}
+    tpl["deep"] = "$savepoint.step3" + "".join(f".l{level}" for level in reversed(range(12))) + ".value"
+    tpl["static"] = {"kind": "mapping", "labels": [f"label{i}" for i in range(50)]}
+    tpl["process"] = "$process.process_id"
+    return tpl
+
+
+@pytest.fixture(scope="session")
+def payload() -> dict:
+    return {
+        "params": {"a": 12345, "b": 67890, "items": [{"val": i} for i in range(50)]},
+        "savepoint": deep_savepoint(),
+        "process": ProcessInfo(process_id="proc-1", run_id="run-1"),
+        "environment": Environment(name="bench", max_retries=3),
+        "meta": Meta(call_id="bench"),
+    }
+
+
+@pytest.fixture(scope="session")
+def params(payload) -> ElementalParams:
+    return ElementalParams(**payload)
+
+
+@pytest.fixture(scope="session")
+def template() -> dict:
+    return wide_template()
@@ -0,0 +1,32 @@
+import pytest
+
+from elementals.examples.concat import ConcatFunction
+from elementals.examples.echo import EchoFunction
+from elementals.examples.lcm import LCMFunction
+from elementals.examples.multiply import MultiplyFunction
+from elementals.params import ElementalParams, Meta
+
+META = Meta(call_id="bench")
+
+
+@pytest.mark.parametrize(
+    "fn_cls,params",
+    [
+        (EchoFunction, {"msg": "hello", "items": list(range(20))}),
+        (ConcatFunction, {"text1": "x" * 1000, "text2": "y" * 1000}),
+        (MultiplyFunction, {"a": 12345, "b": 67890}),
+        (LCMFunction, {"a": 2**61 - 1, "b": 2**31 - 1}),
+    ],
+    ids=["echo", "concat", "multiply", "lcm"],
+)
+def test_example_run(benchmark, fn_cls, params):
+    fn = fn_cls()
+    out = benchmark(fn.run, ElementalParams(params=params, meta=META))
+    assert out["status"] == "success"
+
+
+@pytest.mark.parametrize("fn_cls", [MultiplyFunction, LCMFunction], ids=["multiply", "lcm"])
+def test_example_run_batch_columnar_10k(benchmark, fn_cls):
+    fn = fn_cls()
+    columns = {"a": list(range(1, 10001)), "b": list(range(10001, 20001))}
+    assert len(benchmark(fn.run_batch, columns, meta=META)) == 10000
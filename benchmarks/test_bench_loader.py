@@ -0,0 +1,52 @@
+import pytest
+
+from configfuncs.dispatch import FunctionDispatcher
+from configfuncs.loader import get_function_instance, load_config, run_function
+from configfuncs.registry import ConfigRegistry
+
+ENTRY = """{name}:
+  name: {name}
+  class: EchoFunction
+  classModule: elementals.examples.echo
+  description: Generated entry {i}
+  role: business_action
+  sync: sync
+  resource_type: cpu
+  duration: short
+"""
+
+
+@pytest.fixture(scope="module")
+def big_config(tmp_path_factory):
+    path = tmp_path_factory.mktemp("cfg") / "configFunctions.yaml"
+    path.write_text("".join(ENTRY.format(name=f"Fn{i}", i=i) for i in range(300)), encoding="utf-8")
+    return path
+
+
+def test_registry_cold_parse_300_entries(benchmark, big_config):
+    reg = ConfigRegistry(big_config)
+    benchmark(reg.refresh, force=True)
+    assert len(reg.data) == 300
+
+
+def test_load_config_cached(benchmark):
+    assert "Multiply" in benchmark(load_config)
+
+
+def test_get_function_instance(benchmark):
+    benchmark(get_function_instance, "Multiply")
+
+
+def test_dispatcher_runner(benchmark):
+    dispatcher = FunctionDispatcher()
+    benchmark(dispatcher.runner, "Multiply")
+
+
+def test_run_function(benchmark):
+    out = benchmark(run_function, "Multiply", params={"a": 3, "b": 4})
+    assert out["data"]["product"] == 12
+
+
+def test_run_function_trusted(benchmark):
+    out = benchmark(run_function, "Multiply", params={"a": 3, "b": 4}, trusted=True)
+    assert out["data"]["product"] == 12
@@ -0,0 +1,16 @@
+from elementals.params import ElementalParams
+
+
+def test_params_small(benchmark):
+    benchmark(ElementalParams, params={"a": 1, "b": 2})
+
+
+def test_params_deep_savepoint(benchmark, payload):
+    benchmark(lambda: ElementalParams(**payload))
+
+
+def test_params_deep_savepoint_trusted(benchmark, payload):
+    benchmark(
+        ElementalParams.trusted,
+        payload["params"], payload["savepoint"], payload["process"], payload["environment"], payload["meta"],
+    )
@@ -0,0 +1,25 @@
+from elementals.utils import param_paths, pathmap
+
+DEEP = "$savepoint.step3" + "".join(f".l{level}" for level in reversed(range(12))) + ".value"
+
+
+def test_param_paths_resolve_path_deep(benchmark, params):
+    assert benchmark(param_paths.resolve_path, params, DEEP) == 3
+
+
+def test_pathmap_resolve_path_deep(benchmark, params):
+    assert benchmark(pathmap.resolve_path, params, DEEP) == 3
+
+
+def test_resolve_template_wide(benchmark, params, template):
+    out = benchmark(param_paths.resolve_template, template, params)
+    assert out["f1"] == 1
+
+
+def test_compiled_template_wide(benchmark, params, template):
+    plan = param_paths.compile_template(template)
+    assert benchmark(plan.render, params)["deep"] == 3
+
+
+def test_pathmap_render_template_wide(benchmark, params, template):
+    assert benchmark(pathmap.render_template, params, template)["process"] == "proc-1"
@@ -0,0 +1,51 @@
+import pytest
+
+from elementals import serialize
+from elementals.params import ElementalParams, Meta
+from elementals.responses import CompactResponse, ElementalResponse, meta_dump
+
+META = Meta(call_id="bench")
+DATA = {"product": 838102050, "items": list(range(20))}
+
+
+def _model(p):
+    return ElementalResponse(status="success", data=DATA, meta=meta_dump(p.meta)).model_dump()
+
+
+def _dict(p):
+    return {"status": "success", "data": DATA, "meta": meta_dump(p.meta)}
+
+
+def _compact(p):
+    return CompactResponse("success", DATA, None, p.meta)
+
+
+@pytest.mark.parametrize("build", [_model, _dict, _compact], ids=["model", "dict", "compact"])
+def test_response_build(benchmark, build):
+    p = ElementalParams(params={}, meta=META)
+    assert benchmark(build, p)["status"] == "success"
+
+
+@pytest.mark.parametrize("build", [_dict, _compact], ids=["dict", "compact"])
+def test_response_build_and_encode(benchmark, build):
+    p = ElementalParams(params={}, meta=META)
+
+    def encode():
+        out = build(p)
+        return serialize.dumps(out)
+
+    assert benchmark(encode).startswith(b'{"status":"success"')
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_echo_run_bytes(benchmark, backend):
+    from elementals.examples.echo import EchoFunction
+
+    pytest.importorskip(backend)
+    previous = serialize.set_backend(backend)
+    try:
+        fn = EchoFunction()
+        p = ElementalParams(params={"msg": "hello", "items": list(range(20))}, meta=META)
+        assert benchmark(fn.run_bytes, p).startswith(b'{"status":"success"')
+    finally:
+        serialize.set_backend(previous)
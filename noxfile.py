@@ -7,6 +7,7 @@ def tests(session):
     session.install("-r", "requirements-dev.txt")
     session.install("-e", "packages/actionformats[dev]")
     session.install("-e", "packages/elementals[dev]")
+    session.install("-e", "packages/configfuncs")
     session.run("pytest", "-q")
 
 @nox.session
@@ -20,6 +21,23 @@ def type(session):
     session.install("mypy>=1.10", "typing-extensions>=4.7")
     session.run("mypy", "packages")
 
+@nox.session
+def bench(session):
+    """Run the benchmark suite and compare it against benchmarks/baselines/baseline.json.
+
+    `nox -s bench -- save` refreshes the baseline instead of checking against it.
+    """
+    session.install("-r", "requirements-dev.txt", "pytest-benchmark>=4.0")
+    session.install("-e", "packages/elementals[dev]")
+    session.install("-e", "packages/configfuncs")
+    current = ".benchmarks/current.json"
+    session.run("pytest", "benchmarks", "--benchmark-only", f"--benchmark-json={current}")
+    baseline = "benchmarks/baselines/baseline.json"
+    if session.posargs[:1] == ["save"]:
+        session.run("python", "benchmarks/compare.py", "save", current, baseline)
+    else:
+        session.run("python", "benchmarks/compare.py", "check", baseline, current)
+
 @nox.session
 def build_all(session):
     session.install("build>=1.2")
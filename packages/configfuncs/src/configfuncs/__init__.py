@@ -1 +1,40 @@
-# Config package for elemental functions
+"""Config package for elemental functions.
+
+Public names are resolved lazily (PEP 562) to keep `import configfuncs` cheap.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .characteristics import get_characteristics
+    from .dispatch import FunctionDispatcher, get_dispatcher
+    from .loader import get_function_class, get_function_instance, load_config, run_function
+    from .registry import ConfigRegistry, get_registry
+
+_LAZY = {
+    "ConfigRegistry": ".registry",
+    "get_registry": ".registry",
+    "FunctionDispatcher": ".dispatch",
+    "get_dispatcher": ".dispatch",
+    "get_characteristics": ".characteristics",
+    "load_config": ".loader",
+    "get_function_class": ".loader",
+    "get_function_instance": ".loader",
+    "run_function": ".loader",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,155 @@
+"""FunctionCharacteristics built once per config entry, with role/resource/duration indexes.
+
+ConfigRegistry.characteristics returns a CharacteristicsIndex for the loaded config. The
+index is rebuilt only when the registry version changes. Each entry's enum fields (role,
+sync, resource_type, duration) are validated once, and the resulting frozen
+FunctionCharacteristics is interned: equal characteristics are the same object, even
+across reloads. A function constructor then needs a single lookup:
+
+    super().__init__(get_characteristics("Multiply", description="..."))
+
+The index answers which functions have a given role, resource type or duration in
+O(1), without scanning the entries.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+# defaults for fields an entry leaves out (same as the example constructors used)
+ENTRY_DEFAULTS = {"role": "business_action", "sync": "sync", "resource_type": "cpu", "duration": "short"}
+
+_interned: Dict[Any, Any] = {}
+
+
+def enum_fields() -> Dict[str, Any]:
+    """Config key -> elementals enum for the validated fields."""
+    from elementals.enums import DurationClass, ResourceType, RoleInProcess, SyncType  # lazy import to avoid cycles
+
+    return {"role": RoleInProcess, "sync": SyncType, "resource_type": ResourceType, "duration": DurationClass}
+
+
+def resolve_enum(enum: Any, value: Any) -> Any:
+    """Member of `enum` for a value or (case-insensitive) member name; ValueError otherwise."""
+    if isinstance(value, enum):
+        return value
+    try:
+        return enum(value)
+    except ValueError:
+        pass
+    member = enum.__members__.get(value.strip().upper()) if isinstance(value, str) else None
+    if member is None:
+        raise ValueError(f"{value!r} is not a valid {enum.__name__} (expected one of {[m.value for m in enum]})")
+    return member
+
+
+def intern(characteristics: Any) -> Any:
+    """Return the canonical instance equal to `characteristics`."""
+    return _interned.setdefault(characteristics, characteristics)
+
+
+def build_characteristics(name: str, entry: Mapping[str, Any]) -> Any:
+    """Interned FunctionCharacteristics for a config entry (missing fields use ENTRY_DEFAULTS)."""
+    from elementals.base import FunctionCharacteristics  # lazy import to avoid cycles
+
+    if not isinstance(entry, Mapping):
+        raise ValueError(f"{name}: entry must be a mapping")
+    fields = {
+        key: resolve_enum(enum, entry.get(key) or ENTRY_DEFAULTS[key])
+        for key, enum in enum_fields().items()
+    }
+    return intern(FunctionCharacteristics(
+        name=entry.get("name") or name,
+        description=entry.get("description") or "",
+        **fields,
+    ))
+
+
+class CharacteristicsIndex(Mapping[str, Any]):
+    """Config name -> FunctionCharacteristics, plus names grouped by role/resource_type/duration.
+
+    Entries that fail validation are left out of the indexes; looking one up raises
+    ValueError with the reason, so a bad entry only breaks its own function.
+    """
+
+    def __init__(self, data: Mapping[str, Any], version: int = 0):
+        self.version = version
+        self.errors: Dict[str, str] = {}
+        self._by_name: Dict[str, Any] = {}
+        groups: Dict[str, Dict[Any, List[str]]] = {"role": {}, "resource_type": {}, "duration": {}}
+        for name, entry in data.items():
+            try:
+                fc = build_characteristics(name, entry)
+            except ValueError as e:
+                self.errors[name] = str(e)
+                continue
+            self._by_name[name] = fc
+            for field, index in groups.items():
+                index.setdefault(getattr(fc, field), []).append(name)
+        self._groups: Dict[str, Dict[Any, Tuple[str, ...]]] = {
+            field: {value: tuple(names) for value, names in index.items()}
+            for field, index in groups.items()
+        }
+
+    def __getitem__(self, name: str) -> Any:
+        fc = self._by_name.get(name)
+        if fc is None:
+            if name in self.errors:
+                raise ValueError(f"Invalid configuration for '{name}': {self.errors[name]}")
+            raise KeyError(name)
+        return fc
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._by_name)
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def _names(self, field: str, value: Any) -> Tuple[str, ...]:
+        if value is None:
+            return tuple(self._by_name)
+        return self._groups[field].get(resolve_enum(enum_fields()[field], value), ())
+
+    def by_role(self, role: Any) -> Tuple[str, ...]:
+        return self._names("role", role)
+
+    def by_resource_type(self, resource_type: Any) -> Tuple[str, ...]:
+        return self._names("resource_type", resource_type)
+
+    def by_duration(self, duration: Any) -> Tuple[str, ...]:
+        return self._names("duration", duration)
+
+    def select(self, *, role: Any = None, resource_type: Any = None, duration: Any = None) -> Tuple[str, ...]:
+        """Names matching every given criterion, in config order."""
+        groups = [
+            self._names(field, value)
+            for field, value in (("role", role), ("resource_type", resource_type), ("duration", duration))
+            if value is not None
+        ]
+        if not groups:
+            return tuple(self._by_name)
+        smallest = min(groups, key=len)
+        others = [set(g) for g in groups if g is not smallest]
+        return tuple(n for n in smallest if all(n in g for g in others))
+
+
+def get_characteristics(name: str, *, registry: Optional[Any] = None, **defaults: Any) -> Any:
+    """FunctionCharacteristics for config entry `name` from the registry's index.
+
+    If `name` is not configured, one is built (and interned) from `defaults`
+    (description, role, sync, resource_type, duration), like the constructors' fallbacks.
+    """
+    from .registry import get_registry
+
+    index = (registry or get_registry()).characteristics
+    try:
+        fc = index[name]
+    except KeyError:
+        return build_characteristics(name, defaults)
+    if not fc.description and defaults.get("description"):
+        fc = intern(replace(fc, description=defaults["description"]))
+    return fc
@@ -0,0 +1,126 @@
+"""Name -> bound `run` dispatch table over warm function instances.
+
+Elemental functions are stateless, so one instance per configured name can serve
+every call. The dispatcher resolves a name to its class once, keeps the instance
+warm and caches its bound `run`. Entries marked `pure: true` get a result cache on
+their instance (see elementals.cache). The table is dropped whenever the ConfigRegistry
+version changes, so a config reload picks up new classes and characteristics.
+"""
+
+from __future__ import annotations
+
+import threading
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .registry import ConfigRegistry, get_registry
+
+
+Runner = Callable[[Any], Dict[str, Any]]
+
+
+class FunctionDispatcher:
+    """Resolve configured function names to warm instances and bound `run` methods."""
+
+    def __init__(self, registry: Optional[ConfigRegistry] = None):
+        self._registry = registry
+        self._version = -1
+        self._classes: Dict[Tuple[str, str], type] = {}
+        self._instances: Dict[str, Any] = {}
+        self._table: Dict[str, Runner] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def registry(self) -> ConfigRegistry:
+        if self._registry is None:
+            self._registry = get_registry()
+        return self._registry
+
+    def _config(self) -> Dict[str, Any]:
+        reg = self.registry
+        cfg = reg.data  # honours the registry's check_interval
+        if reg.version != self._version:
+            with self._lock:
+                if reg.version != self._version:
+                    self._instances = {}
+                    self._table = {}
+                    self._version = reg.version
+        return cfg
+
+    def get_class(self, name: str) -> type:
+        """Return the class configured for `name`, importing its module at most once."""
+        cfg = self._config()
+        if name not in cfg:
+            raise KeyError(f"Function '{name}' not found in configuration")
+        entry = cfg[name]
+        key = (entry["classModule"], entry["class"])
+        cls = self._classes.get(key)
+        if cls is None:
+            cls = getattr(import_module(key[0]), key[1])
+            self._classes[key] = cls
+        return cls
+
+    def instance(self, name: str) -> Any:
+        """Return the warm instance for `name`, creating it on first use."""
+        self._config()
+        fn = self._instances.get(name)
+        if fn is None:
+            with self._lock:
+                fn = self._instances.get(name)
+                if fn is None:
+                    fn = self.get_class(name)()
+                    self._enable_cache(name, fn)
+                    self._instances[name] = fn
+        return fn
+
+    def _enable_cache(self, name: str, fn: Any) -> None:
+        """Attach the result cache declared by `pure: true` in the config entry, if any."""
+        entry = self._config().get(name) or {}
+        if not entry.get("pure") or not hasattr(fn, "enable_cache"):
+            return
+        from elementals.cache import cache_from_config  # lazy import to avoid cycles
+        fn.enable_cache(cache_from_config(entry))
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss counters of every warm instance that has a result cache."""
+        return {
+            name: fn.cache.stats()
+            for name, fn in list(self._instances.items())
+            if getattr(fn, "cache", None) is not None
+        }
+
+    def runner(self, name: str) -> Runner:
+        """Return the bound `run` of the warm instance for `name`."""
+        self._config()
+        run = self._table.get(name)
+        if run is None:
+            run = self._table[name] = self.instance(name).run
+        return run
+
+    def run(self, name: str, params: Any) -> Dict[str, Any]:
+        """Run the configured function `name` with prepared ElementalParams."""
+        return self.runner(name)(params)
+
+    def warm(self, names: Optional[Iterable[str]] = None) -> None:
+        """Eagerly build instances for `names` (default: every configured function)."""
+        for name in list(names if names is not None else self._config()):
+            self.runner(name)
+
+
+_dispatchers: Dict[Optional[Path], FunctionDispatcher] = {}
+
+
+def get_dispatcher(path: str | Path | None = None) -> FunctionDispatcher:
+    """Return the process-wide dispatcher for the registry at `path` (default registry if None)."""
+    key = Path(path).resolve() if path is not None else None
+    dispatcher = _dispatchers.get(key)
+    if dispatcher is None:
+        registry = get_registry(key) if key is not None else None
+        dispatcher = _dispatchers.setdefault(key, FunctionDispatcher(registry))
+    return dispatcher
+
+
+def reset_dispatcher() -> None:
+    """Drop the process-wide dispatchers (mainly for tests)."""
+    _dispatchers.clear()
@@ -2,26 +2,20 @@
 from importlib import import_module
 from pathlib import Path
 from typing import Any, Dict
-import yaml
-import os
+
+from .characteristics import get_characteristics  # noqa: F401  (re-exported for function constructors)
+from .dispatch import get_dispatcher
+from .registry import get_registry
 
 
 def load_config(path: str | Path | None = None) -> Dict[str, Any]:
     """Load the configFunctions.yaml as a dict.
 
-    If path is None, loads from the customerfunctions package directory.
+    If path is None, loads from the customerfunctions directory found in a parent folder.
+    The parsed mapping is cached by the shared ConfigRegistry and only reparsed when the
+    file changes, so the returned dict is shared and must not be mutated.
     """
-    # Always load configFunctions.yaml from the root of the customerfunctions package (sibling to tasksFormats)
-    current = Path(__file__).resolve()
-    # Traverse up until we find the workspace root (contains both tasksFormats and customerfunctions)
-    for parent in current.parents:
-        if (parent / "customerfunctions" / "configFunctions.yaml").exists():
-            yaml_path = parent / "customerfunctions" / "configFunctions.yaml"
-            break
-    else:
-        raise FileNotFoundError("configFunctions.yaml not found in any parent directory's customerfunctions folder")
-    with open(yaml_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return get_registry(path).data
 
 
 def resolve_callable(entry: Dict[str, Any]):
@@ -32,10 +26,7 @@ def resolve_callable(entry: Dict[str, Any]):
 
 def get_function_class(name: str):
     """Return the function class for a given config name (e.g., 'Multiply')."""
-    cfg = load_config()
-    if name not in cfg:
-        raise KeyError(f"Function '{name}' not found in configuration")
-    return resolve_callable(cfg[name])
+    return get_dispatcher().get_class(name)
 
 
 def get_function_instance(name: str):
@@ -48,16 +39,75 @@ def run_function(name: str, *, params: Dict[str, Any] | None = None,
                  savepoint: Dict[str, Any] | None = None,
                  process: Any | None = None,
                  environment: Any | None = None,
-                 meta: Any | None = None) -> Dict[str, Any]:
-    """Instantiate a configured function by name and run it, returning a dict.
+                 meta: Any | None = None,
+                 trusted: bool = False) -> Dict[str, Any]:
+    """Run a configured function by name, returning a dict.
+
+    Calls go through the shared FunctionDispatcher, which keeps one warm instance per
+    configured name. This imports ElementalParams lazily to avoid hard dependency at
+    import time.
 
-    This imports ElementalParams lazily to avoid hard dependency at import time.
+    trusted=True skips Pydantic validation of params/savepoint (ElementalParams.trusted);
+    use it only from internal code that already holds validated data.
     """
-    fn = get_function_instance(name)
-    from elementals.params import ElementalParams  # lazy import to avoid cycles
+    from elementals import instrument  # lazy import to avoid cycles
+    if instrument.hooks:
+        return _run_function_traced(name, params, savepoint, process, environment, meta, trusted)
+    run = get_dispatcher().runner(name)
+    from elementals.params import ElementalParams
+    if trusted:
+        return run(ElementalParams.trusted(params, savepoint, process, environment, meta))
     ep = ElementalParams(
         params=params or {}, savepoint=savepoint or {},
         process=process, environment=environment, meta=meta
     )
     # All functions return dicts in this project
-    return fn.run(ep)  # type: ignore[no-any-return]
+    return run(ep)
+
+
+def _run_function_traced(name: str, params: Dict[str, Any] | None, savepoint: Dict[str, Any] | None,
+                         process: Any, environment: Any, meta: Any, trusted: bool) -> Dict[str, Any]:
+    """run_function() split into "config", "params" and "run" spans under "run_function"."""
+    from elementals import instrument
+    from elementals.params import ElementalParams
+    with instrument.span("run_function", name=name):
+        with instrument.span("config"):
+            dispatcher = get_dispatcher()
+            run = dispatcher.runner(name)
+            tags = instrument.function_tags(dispatcher.instance(name).characteristics)
+        with instrument.span("params", **tags):
+            if trusted:
+                ep = ElementalParams.trusted(params, savepoint, process, environment, meta)
+            else:
+                ep = ElementalParams(
+                    params=params or {}, savepoint=savepoint or {},
+                    process=process, environment=environment, meta=meta
+                )
+        with instrument.span("run", **tags):
+            return run(ep)
+
+
+async def arun_function(name: str, *, params: Dict[str, Any] | None = None,
+                        savepoint: Dict[str, Any] | None = None,
+                        process: Any | None = None,
+                        environment: Any | None = None,
+                        meta: Any | None = None,
+                        executor: Any | None = None,
+                        retry: Any | None = None) -> Dict[str, Any]:
+    """Async counterpart of run_function().
+
+    Native-async functions are awaited directly; sync ones run on the bounded thread
+    pool of `executor` (default: elementals.aio.get_executor()). With a `retry`
+    (elementals.retry.RetryExecutor), retryable errors are retried in-process; every
+    attempt still runs on `executor` when one is given.
+    """
+    fn = get_dispatcher().instance(name)
+    from elementals.aio import get_executor  # lazy import to avoid cycles
+    from elementals.params import ElementalParams
+    ep = ElementalParams(
+        params=params or {}, savepoint=savepoint or {},
+        process=process, environment=environment, meta=meta
+    )
+    if retry is not None:
+        return await retry.arun(fn, ep, executor)
+    return await (executor or get_executor()).run(fn, ep)
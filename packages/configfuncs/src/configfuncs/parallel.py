@@ -0,0 +1,150 @@
+"""Fan (function_name, params) work items across a pre-forked process pool.
+
+CPU-bound elementals (big-integer Multiply/LCM) run under the GIL on the caller's
+thread; ParallelRunner spreads them across cores. Each worker resolves function
+classes once through the dispatcher when it starts, items travel in chunks to
+amortize pickling, and results come back in input order. Within a chunk, items
+for the same function go through a single run_batch() call.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .dispatch import get_dispatcher
+
+
+WorkItem = Tuple[str, Any]  # (function_name, params dict or ElementalParams)
+
+
+# seconds prefork() waits for every worker to start and warm up
+PREFORK_TIMEOUT = 60.0
+
+# the pool's prefork barrier, handed to each worker by its initializer
+_barrier: Any = None
+
+
+def _warm(config_path: Optional[str], names: Optional[Sequence[str]], barrier: Any = None) -> None:
+    """Worker initializer: build the dispatcher and warm instances before the first call."""
+    global _barrier
+    _barrier = barrier
+    get_dispatcher(config_path).warm(names)
+
+
+def _pid(timeout: float) -> int:
+    # a ping blocks its worker until one ping has reached every worker
+    _barrier.wait(timeout)
+    return os.getpid()
+
+
+def _run_chunk(config_path: Optional[str], chunk: List[WorkItem]) -> List[Dict[str, Any]]:
+    """Run a chunk in a worker, batching items per function, and return results in order."""
+    from elementals.params import ElementalParams  # lazy import to avoid cycles
+
+    dispatcher = get_dispatcher(config_path)
+    groups: Dict[str, List[int]] = {}
+    inputs: List[Any] = []
+    for i, (name, params) in enumerate(chunk):
+        groups.setdefault(name, []).append(i)
+        inputs.append(params if isinstance(params, ElementalParams) else ElementalParams(params=params or {}))
+    results: List[Any] = [None] * len(chunk)
+    for name, rows in groups.items():
+        outs = dispatcher.instance(name).run_batch([inputs[i] for i in rows])
+        for i, out in zip(rows, outs):
+            results[i] = out
+    return results
+
+
+def _chunks(items: Iterable[WorkItem], size: int) -> Iterator[List[WorkItem]]:
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class ParallelRunner:
+    """Process pool runner for configured functions.
+
+    - workers: process count (default os.cpu_count())
+    - chunksize: work items per pickled task
+    - warm: function names to instantiate in every worker at start (default: all configured)
+    - prefork: start every worker (and run the warm-up) in __init__ instead of on first use
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        *,
+        chunksize: int = 256,
+        warm: Optional[Sequence[str]] = None,
+        prefork: bool = True,
+        config_path: str | Path | None = None,
+        mp_context: Any = None,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self._config_path = str(Path(config_path).resolve()) if config_path is not None else None
+        ctx = mp_context or multiprocessing.get_context()
+        self._pool = ProcessPoolExecutor(
+            self.workers,
+            mp_context=ctx,
+            initializer=_warm,
+            initargs=(self._config_path, list(warm) if warm is not None else None, ctx.Barrier(self.workers)),
+        )
+        self.worker_pids: List[int] = []
+        if prefork:
+            self.prefork()
+
+    def prefork(self) -> List[int]:
+        """Start all worker processes now and wait until each finished its warm-up.
+
+        Every worker takes one ping and waits on a shared barrier, so the pings cannot
+        pile up on one process. Raises RuntimeError if the workers do not all report in
+        within PREFORK_TIMEOUT seconds.
+        """
+        pings = [self._pool.submit(_pid, PREFORK_TIMEOUT) for _ in range(self.workers)]
+        try:
+            pids = {f.result() for f in pings}
+        except threading.BrokenBarrierError as e:
+            raise RuntimeError(f"prefork: not all {self.workers} workers started within {PREFORK_TIMEOUT}s") from e
+        if len(pids) != self.workers:  # pragma: no cover - the barrier makes this unreachable
+            raise RuntimeError(f"prefork: {len(pids)} of {self.workers} workers reported in")
+        self.worker_pids = sorted(pids)
+        return self.worker_pids
+
+    def map(self, items: Iterable[WorkItem], *, chunksize: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield one response per work item, in input order.
+
+        `items` is consumed lazily; at most 2 * workers chunks are in flight at a time,
+        so arbitrarily long streams run in bounded memory.
+        """
+        window = self.workers * 2
+        pending: Deque["Future[List[Dict[str, Any]]]"] = deque()
+        for chunk in _chunks(items, chunksize or self.chunksize):
+            pending.append(self._pool.submit(_run_chunk, self._config_path, chunk))
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+    def run(self, items: Iterable[WorkItem], *, chunksize: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Like map(), but collect every response into a list."""
+        return list(self.map(items, chunksize=chunksize))
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "ParallelRunner":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.shutdown()
@@ -0,0 +1,194 @@
+"""Run configured functions as one in-process pipeline ordered by RoleInProcess.
+
+    pipeline = Pipeline({
+        "CheckInput": None,                                  # gets the caller's params
+        "Multiply": {"a": "$params.a", "b": "$params.b"},
+        "Rebuild": {"product": "$savepoint.stages.Multiply.product"},
+    })
+    result = pipeline.run(ElementalParams(params={"a": 2, "b": 3}))
+
+Stage order is taken from each function's configured role:
+
+1. SPECIAL_PARAM_VALIDATION, then BUSINESS_RULE_VALIDATION. The stages of each
+   validation role run concurrently, and the first error response stops the pipeline.
+2. BUSINESS_ACTION stages, in the order given.
+3. If every action succeeded, COMPLETE_INCOMPLETE_ACTION and then REBUILD_RESPONSE run.
+   If an action or a COMPLETE_INCOMPLETE_ACTION stage failed, RETRY_ANALYSIS and then
+   ROLLBACK run instead, and the result carries the failing stage's error.
+
+The caller's ElementalParams is validated once; every stage gets it (or, with an input
+template, a trusted copy whose params are the rendered template) without re-validation.
+Each stage's `data` (or {"error": ...} for an error response) is written to a
+copy-on-write LayeredSavepoint under savepoint["stages"][<name>], so later templates
+can read "$savepoint.stages.<name>...".
+Templates are compiled once, when the pipeline is built.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .dispatch import FunctionDispatcher, get_dispatcher
+
+
+OUTPUTS_KEY = "stages"
+
+StageSpec = Union[Mapping[str, Any], Sequence[Union[str, Tuple[str, Any]]]]
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    role: Any  # RoleInProcess
+    inputs: Any = None  # TemplatePlan rendering this stage's params, or None
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of Pipeline.run().
+
+    `response` is the error response that stopped the pipeline, the last REBUILD_RESPONSE
+    response, or the last action's response (in that order of precedence).
+    """
+    response: Dict[str, Any]
+    responses: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    savepoint: Any = None  # LayeredSavepoint with every stage's data
+    failed_stage: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.failed_stage is None
+
+
+class Pipeline:
+    """Chain configured functions by role; see the module docstring for the stage order.
+
+    - stages: {name: input template or None} or a sequence of names / (name, template);
+      a template is a mapping that renders to the stage's params
+    - max_workers: thread pool size for concurrent validation stages
+    """
+
+    def __init__(self, stages: StageSpec, *, dispatcher: Optional[FunctionDispatcher] = None,
+                 config_path: str | Path | None = None, max_workers: int = 8):
+        from elementals.enums import RoleInProcess  # lazy import to avoid cycles
+        from elementals.utils.param_paths import compile_template
+
+        self._dispatcher = dispatcher or get_dispatcher(config_path)
+        items = stages.items() if isinstance(stages, Mapping) else (
+            (s, None) if isinstance(s, str) else s for s in stages
+        )
+        self.stages: List[Stage] = []
+        for name, template in items:
+            if template is not None and not isinstance(template, Mapping):
+                raise TypeError(f"{name}: the input template must be a mapping of params, "
+                                f"got {type(template).__name__}")
+            role = self._dispatcher.instance(name).characteristics.role
+            plan = compile_template(template) if template is not None else None
+            self.stages.append(Stage(name, RoleInProcess(role), plan))
+        self._by_role: Dict[Any, List[Stage]] = {}
+        for stage in self.stages:
+            self._by_role.setdefault(stage.role, []).append(stage)
+        self._max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(self._max_workers, thread_name_prefix="elementals-pipeline")
+        return self._pool
+
+    def _stages(self, role: Any) -> List[Stage]:
+        return self._by_role.get(role, [])
+
+    def _call(self, stage: Stage, work: Any) -> Dict[str, Any]:
+        from elementals.params import ElementalParams
+
+        ep = work
+        if stage.inputs is not None:
+            ep = ElementalParams.trusted(stage.inputs.render(work), work.savepoint,
+                                         work.process, work.environment, work.meta)
+        return self._dispatcher.instance(stage.name).run_dict(ep)
+
+    def _record(self, result: PipelineResult, stage: Stage, response: Dict[str, Any]) -> bool:
+        """Store a stage's response and data; returns False if it is an error response."""
+        result.responses[stage.name] = response
+        failed = response.get("status") == "error"
+        output = {"error": response.get("error")} if failed else response.get("data")
+        sp = result.savepoint
+        sp[OUTPUTS_KEY] = {**sp.get(OUTPUTS_KEY, {}), stage.name: output}
+        if failed:
+            if result.failed_stage is None:
+                result.failed_stage = stage.name
+                result.response = response
+            return False
+        return True
+
+    def _run_sequential(self, stages: List[Stage], work: Any, result: PipelineResult) -> Optional[Dict[str, Any]]:
+        last = None
+        for stage in stages:
+            last = self._call(stage, work)
+            if not self._record(result, stage, last):
+                return None
+        return last
+
+    def _run_concurrent(self, stages: List[Stage], work: Any, result: PipelineResult) -> bool:
+        """Run independent stages together; stop at the first error response."""
+        if len(stages) <= 1:
+            return all(self._record(result, s, self._call(s, work)) for s in stages)
+        pool = self._executor()
+        pending: Dict[Future, Stage] = {pool.submit(self._call, s, work): s for s in stages}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = pending.pop(future)
+                if not self._record(result, stage, future.result()):
+                    for other in pending:
+                        other.cancel()
+                    return False
+        return True
+
+    def run(self, params: Any) -> PipelineResult:
+        """Run every stage for `params` (ElementalParams, validated once by the caller)."""
+        from elementals.enums import RoleInProcess as R
+        from elementals.params import ElementalParams
+        from elementals.savepoint import LayeredSavepoint
+
+        sp = params.savepoint
+        sp = sp.next_step() if isinstance(sp, LayeredSavepoint) else LayeredSavepoint(sp)
+        work = ElementalParams.trusted(params.params, sp, params.process, params.environment, params.meta)
+        result = PipelineResult(response={}, savepoint=sp)
+
+        for role in (R.SPECIAL_PARAM_VALIDATION, R.BUSINESS_RULE_VALIDATION):
+            if not self._run_concurrent(self._stages(role), work, result):
+                return result
+        last = self._run_sequential(self._stages(R.BUSINESS_ACTION), work, result)
+        if result.failed_stage is None:
+            self._run_sequential(self._stages(R.COMPLETE_INCOMPLETE_ACTION), work, result)
+        if result.failed_stage is not None:
+            for role in (R.RETRY_ANALYSIS, R.ROLLBACK):
+                for stage in self._stages(role):
+                    # failure-path stages all run; their errors do not replace the action's
+                    self._record(result, stage, self._call(stage, work))
+            return result
+        rebuilt = self._run_sequential(self._stages(R.REBUILD_RESPONSE), work, result)
+        if result.failed_stage is None:
+            result.response = rebuilt or last or {}
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "Pipeline":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.shutdown()
@@ -0,0 +1,148 @@
+"""Process-wide, file-watching cache for configFunctions.yaml.
+
+`load_config()` used to locate and re-parse the YAML on every call. The registry
+resolves the path once, keeps the parsed mapping in memory and only reparses when
+the file's mtime/size stamp changes *and* its content hash differs. Every
+effective reload bumps `version`, so dependants can drop their own caches.
+When a current snapshot (see configfuncs.snapshot) sits next to the YAML, it is
+loaded instead, and PyYAML is not imported at all.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .characteristics import CharacteristicsIndex
+from .snapshot import read_snapshot
+
+
+CONFIG_DIR = "customerfunctions"
+CONFIG_FILE = "configFunctions.yaml"
+
+
+def find_config_path(start: str | Path | None = None) -> Path:
+    """Walk up from `start` (default: this file) to find customerfunctions/configFunctions.yaml."""
+    current = Path(start or __file__).resolve()
+    for parent in current.parents:
+        candidate = parent / CONFIG_DIR / CONFIG_FILE
+        if candidate.exists():
+            return candidate
+    raise FileNotFoundError("configFunctions.yaml not found in any parent directory's customerfunctions folder")
+
+
+class ConfigRegistry:
+    """In-memory view of a configFunctions.yaml file.
+
+    - `data` returns the parsed mapping, reloading it if the file changed.
+    - `check_interval` throttles the stat() call (seconds); 0 checks on every access.
+    - `version` starts at 0 and increments on each load that changed the content.
+    - `snapshot` loads a matching configFunctions.snapshot.json instead of parsing.
+    - `characteristics` indexes the entries' FunctionCharacteristics.
+
+    The mapping returned by `data` is shared; callers must treat it as read-only.
+    """
+
+    def __init__(self, path: str | Path | None = None, *, check_interval: float = 1.0,
+                 snapshot: bool = True):
+        self.path = Path(path).resolve() if path is not None else find_config_path()
+        self.check_interval = check_interval
+        self.snapshot = snapshot
+        self.version = 0
+        self._data: Dict[str, Any] = {}
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._digest: Optional[bytes] = None
+        self._next_check = 0.0
+        self._index: Optional[CharacteristicsIndex] = None
+        self._lock = threading.Lock()
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        if self._stamp is None or time.monotonic() >= self._next_check:
+            self.refresh()
+        return self._data
+
+    @property
+    def characteristics(self) -> CharacteristicsIndex:
+        """FunctionCharacteristics per entry, with role/resource/duration indexes.
+
+        Built once per loaded version (see configfuncs.characteristics).
+        """
+        data = self.data
+        index = self._index
+        if index is None or index.version != self.version:
+            index = self._index = CharacteristicsIndex(data, self.version)
+        return index
+
+    def refresh(self, *, force: bool = False) -> bool:
+        """Reload the file if it changed on disk. Returns True if `version` was bumped."""
+        with self._lock:
+            self._next_check = time.monotonic() + self.check_interval
+            st = os.stat(self.path)
+            stamp = (st.st_mtime_ns, st.st_size)
+            if not force and stamp == self._stamp:
+                return False
+            snap = read_snapshot(self.path, stamp) if self.snapshot else None
+            if snap is not None:
+                digest, data = snap
+            else:
+                raw = self.path.read_bytes()
+                digest = hashlib.blake2b(raw, digest_size=16).digest()
+                data = None
+            if not force and digest == self._digest:
+                # touched but unchanged: keep the parsed mapping and version
+                self._stamp = stamp
+                return False
+            # a failed parse (e.g. a half-written file) leaves the stamp alone, so the
+            # next check retries instead of serving the old mapping until the next edit
+            self._data = data if data is not None else self._parse(raw)
+            self._stamp = stamp
+            self._digest = digest
+            self.version += 1
+            return True
+
+    @staticmethod
+    def _parse(raw: bytes) -> Dict[str, Any]:
+        import yaml  # deferred: startup cost is only paid when there is no snapshot
+
+        data = yaml.safe_load(raw) or {}
+        if not isinstance(data, dict):
+            raise ValueError("configFunctions.yaml must contain a mapping at the top level")
+        return data
+
+
+_registries: Dict[Path, ConfigRegistry] = {}
+_default: Optional[ConfigRegistry] = None
+_registries_lock = threading.Lock()
+
+
+def get_registry(path: str | Path | None = None) -> ConfigRegistry:
+    """Return the shared registry for `path` (default: the discovered customerfunctions YAML)."""
+    global _default
+    if path is None:
+        if _default is None:
+            with _registries_lock:
+                if _default is None:
+                    _default = _registry_for(find_config_path())
+        return _default
+    with _registries_lock:
+        return _registry_for(Path(path).resolve())
+
+
+def _registry_for(path: Path) -> ConfigRegistry:
+    reg = _registries.get(path)
+    if reg is None:
+        reg = _registries[path] = ConfigRegistry(path)
+    return reg
+
+
+def reset_registries() -> None:
+    """Forget all shared registries (mainly for tests)."""
+    global _default
+    with _registries_lock:
+        _registries.clear()
+        _default = None
@@ -0,0 +1,198 @@
+"""Route configured function calls to worker pools by their FunctionCharacteristics.
+
+Lanes:
+- "cpu": ProcessPoolExecutor sized to the number of cores (CPU work escapes the GIL)
+- "io": ThreadPoolExecutor shared by IO and NETWORK functions
+- "external_api": ThreadPoolExecutor whose size is the concurrency limit for third parties
+Functions with duration LONG go to a separate "<lane>_long" lane with its own pool, so
+they cannot starve SHORT/MEDIUM calls. Each lane keeps queue-depth and wait-time metrics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .dispatch import FunctionDispatcher, get_dispatcher
+
+
+CPU = "cpu"
+IO = "io"
+EXTERNAL_API = "external_api"
+LONG_SUFFIX = "_long"
+
+
+def lane_for(characteristics: Any) -> str:
+    """Return the lane name for a FunctionCharacteristics."""
+    from elementals.enums import DurationClass, ResourceType  # lazy import to avoid cycles
+
+    resource = characteristics.resource_type
+    if resource is ResourceType.CPU:
+        lane = CPU
+    elif resource is ResourceType.EXTERNAL_API:
+        lane = EXTERNAL_API
+    else:
+        lane = IO
+    if characteristics.duration is DurationClass.LONG:
+        lane += LONG_SUFFIX
+    return lane
+
+
+def _execute(config_path: Optional[str], name: str, kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
+    """Worker entry point (threads and child processes): run `name`, return (result, run_ns)."""
+    start = time.perf_counter_ns()
+    fn = get_dispatcher(config_path).instance(name)
+    from elementals.aio import is_native_async  # lazy import to avoid cycles
+    from elementals.params import ElementalParams
+    ep = ElementalParams(**kwargs)
+    if is_native_async(fn):
+        result = asyncio.run(fn.arun(ep))
+    else:
+        result = fn.run_dict(ep)
+    return result, time.perf_counter_ns() - start
+
+
+@dataclass
+class LaneMetrics:
+    workers: int
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    total_wait_ns: int = 0
+    max_wait_ns: int = 0
+    total_run_ns: int = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self.submitted - self.completed - self.failed
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls waiting for a free worker (in flight beyond the pool size)."""
+        return max(0, self.in_flight - self.workers)
+
+    @property
+    def mean_wait_ns(self) -> float:
+        return self.total_wait_ns / self.completed if self.completed else 0.0
+
+
+class Scheduler:
+    """Submit configured functions by name; each call runs in the lane its characteristics pick.
+
+    - cpu_workers: process pool size (default os.cpu_count())
+    - io_workers: thread pool size for IO/NETWORK functions
+    - external_api_limit: max concurrent EXTERNAL_API calls
+    - long_workers: pool size override for every "<lane>_long" lane
+    """
+
+    def __init__(
+        self,
+        *,
+        cpu_workers: Optional[int] = None,
+        io_workers: int = 32,
+        external_api_limit: int = 8,
+        long_workers: Optional[int] = None,
+        config_path: str | Path | None = None,
+    ):
+        cpu = cpu_workers or os.cpu_count() or 1
+        sizes = {CPU: cpu, IO: io_workers, EXTERNAL_API: external_api_limit}
+        for lane, size in list(sizes.items()):
+            sizes[lane + LONG_SUFFIX] = long_workers or size
+        self._sizes = sizes
+        self._config_path = str(Path(config_path).resolve()) if config_path is not None else None
+        self._dispatcher: FunctionDispatcher = get_dispatcher(self._config_path)
+        self._pools: Dict[str, Executor] = {}
+        self._metrics = {lane: LaneMetrics(workers=size) for lane, size in sizes.items()}
+        self._lock = threading.Lock()
+
+    def _pool(self, lane: str) -> Executor:
+        pool = self._pools.get(lane)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(lane)
+                if pool is None:
+                    size = self._sizes[lane]
+                    if lane.startswith(CPU):
+                        pool = ProcessPoolExecutor(size)
+                    else:
+                        pool = ThreadPoolExecutor(size, thread_name_prefix=f"elementals-{lane}")
+                    self._pools[lane] = pool
+        return pool
+
+    def lane(self, name: str) -> str:
+        """Return the lane the configured function `name` is routed to."""
+        return lane_for(self._dispatcher.instance(name).characteristics)
+
+    def submit(self, name: str, *, params: Dict[str, Any] | None = None,
+               savepoint: Dict[str, Any] | None = None,
+               process: Any | None = None,
+               environment: Any | None = None,
+               meta: Any | None = None) -> "Future[Dict[str, Any]]":
+        """Schedule a call to the configured function `name`; resolves to its response dict."""
+        lane = self.lane(name)
+        kwargs = {
+            "params": params or {}, "savepoint": savepoint or {},
+            "process": process, "environment": environment, "meta": meta,
+        }
+        stats = self._metrics[lane]
+        with self._lock:
+            stats.submitted += 1  # before submit: a fast call may finish before it returns
+        submitted = time.perf_counter_ns()
+        try:
+            inner = self._pool(lane).submit(_execute, self._config_path, name, kwargs)
+        except BaseException:
+            with self._lock:
+                stats.submitted -= 1
+            raise
+        outer: "Future[Dict[str, Any]]" = Future()
+
+        def _done(f: "Future[Tuple[Dict[str, Any], int]]") -> None:
+            total = time.perf_counter_ns() - submitted
+            try:
+                result, run_ns = f.result()
+            except BaseException as exc:
+                with self._lock:
+                    stats.failed += 1
+                outer.set_exception(exc)
+                return
+            wait = max(0, total - run_ns)
+            with self._lock:
+                stats.completed += 1
+                stats.total_wait_ns += wait
+                stats.total_run_ns += run_ns
+                stats.max_wait_ns = max(stats.max_wait_ns, wait)
+            outer.set_result(result)
+
+        inner.add_done_callback(_done)
+        return outer
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot per-lane counters, queue depth and wait times (nanoseconds)."""
+        with self._lock:
+            return {
+                lane: {
+                    **asdict(m),
+                    "in_flight": m.in_flight,
+                    "queue_depth": m.queue_depth,
+                    "mean_wait_ns": m.mean_wait_ns,
+                }
+                for lane, m in self._metrics.items()
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "Scheduler":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.shutdown()
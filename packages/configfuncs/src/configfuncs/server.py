@@ -0,0 +1,556 @@
+"""Serve configured functions over HTTP/1.1 on TCP and unix sockets (asyncio, stdlib only).
+
+    python -m configfuncs.server --port 8080 --unix /tmp/elementals.sock --workers 4
+
+Endpoints (JSON bodies):
+
+- POST /run/<name>: body {"params": {...}, "savepoint": {...}, ...}, the same record
+  fields as `elementals run`; responds with the function's response
+- POST /run: the same, with the name in the body's "function" field
+- POST /batch: a list of records, each with "function"; responds with a list of
+  responses, in order
+- GET /health: {"status": "ok", "pid": ..., "functions": [...], "stats": {...}}
+
+A function's error response is still HTTP 200; the body carries "status": "error".
+Malformed requests get a 4xx status with an error response body.
+
+Connections are keep-alive by default (HTTP/1.1) and may be pipelined. Each request
+is parsed as soon as its bytes arrive, and responses go back in request order. Calls
+that arrive together are grouped per function into one run_batch() call, so the
+vectorized Multiply/LCM kernels see the whole group. "Together" means the same event
+loop iteration, across every connection, or within `batch_window` seconds. Bodies are
+encoded by elementals.serialize (orjson when installed).
+
+serve() warms the dispatcher and then pre-forks `workers` processes, so every worker
+starts with warm instances. On TCP each worker binds its own SO_REUSEPORT socket, and
+the kernel spreads new connections across workers. The unix socket is bound once and
+shared by all workers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import json
+import os
+import signal
+import socket
+import sys
+from collections import deque
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import unquote
+
+from .dispatch import FunctionDispatcher, get_dispatcher
+
+MAX_HEADER = 64 * 1024
+DEFAULT_MAX_BODY = 16 * 1024 * 1024
+DEFAULT_PORT = 8080
+
+Reply = Tuple[int, bytes]  # (HTTP status, JSON body)
+
+
+# HTTP status for each elementals.cli.RecordError code
+RECORD_STATUS = {"invalid_record": 400, "unknown_function": 404, "invalid_params": 422}
+
+
+def _error(code: str, message: str) -> Dict[str, Any]:
+    from elementals.cli import record_error  # lazy import to avoid cycles
+
+    return record_error(code, message)
+
+
+def _encode(value: Any) -> bytes:
+    from elementals import serialize  # lazy import to avoid cycles
+
+    return serialize.dumps(value)
+
+
+def _http_response(status: int, body: bytes, keep_alive: bool) -> bytes:
+    head = (
+        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+    )
+    if not keep_alive:
+        head += "Connection: close\r\n"
+    return head.encode("latin-1") + b"\r\n" + body
+
+
+def _run_one(fn: Any, ep: Any) -> Any:
+    from elementals.responses import error_response  # lazy import to avoid cycles
+
+    try:
+        return fn.run_dict(ep)
+    except Exception as e:
+        return error_response(ep, "exception", str(e))
+
+
+def _run_group(fn: Any, batch: List[Any]) -> List[bytes]:
+    """Run one function over its batched calls; returns one JSON body per call."""
+    from elementals import responses, serialize  # lazy import to avoid cycles
+
+    with responses.compact_responses():
+        if len(batch) == 1:
+            outs = [_run_one(fn, batch[0])]
+        else:
+            try:
+                outs = fn.run_batch(batch)
+            except Exception:
+                # calls from other clients share the batch: rerun it row by row so
+                # only the failing rows answer "exception"
+                outs = [_run_one(fn, ep) for ep in batch]
+        bodies = []
+        for ep, out in zip(batch, outs, strict=False):  # Server._resolve answers missing rows
+            try:
+                bodies.append(serialize.dumps(out))
+            except Exception as e:  # TypeError, or ValueError for circular references
+                error = responses.error_response(ep, "unserializable", str(e))
+                bodies.append(serialize.dumps(error))
+        return bodies
+
+
+class _HttpProtocol(asyncio.Protocol):
+    """One connection: parses pipelined requests and writes replies in request order."""
+
+    def __init__(self, server: Server) -> None:
+        self._server = server
+        self._transport: Optional[asyncio.Transport] = None
+        self._buffer = bytearray()
+        self._pending: Deque[Tuple[asyncio.Future[Reply], bool]] = deque()  # (reply, keep_alive)
+        self._closing = False  # set after a "Connection: close" request or a protocol error
+        self._continued = False
+        self._write_paused = False
+        self._read_paused = False
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport  # type: ignore[assignment]
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._transport = None
+        self._pending.clear()
+
+    def pause_writing(self) -> None:
+        self._write_paused = True
+        self._throttle()
+
+    def resume_writing(self) -> None:
+        self._write_paused = False
+        self._throttle()
+
+    def data_received(self, data: bytes) -> None:
+        if self._closing:
+            return
+        self._buffer += data
+        while not self._closing:
+            request = self._parse()
+            if request is None:
+                break
+            reply, keep_alive = request
+            self._pending.append((reply, keep_alive))
+            reply.add_done_callback(self._write_ready)
+        self._throttle()
+
+    def _fail(self, status: int, code: str, message: str) -> Tuple[asyncio.Future[Reply], bool]:
+        self._closing = True
+        self._buffer.clear()
+        return self._server.reply(status, _error(code, message)), False
+
+    def _parse(self) -> Optional[Tuple[asyncio.Future[Reply], bool]]:
+        """Take one complete request off the buffer; None if more bytes are needed."""
+        buf = self._buffer
+        end = buf.find(b"\r\n\r\n")
+        if end < 0:
+            if len(buf) > MAX_HEADER:
+                return self._fail(431, "bad_request", "Request headers too large")
+            return None
+        try:
+            lines = bytes(buf[:end]).decode("latin-1").split("\r\n")
+            method, target, version = lines[0].split(" ")
+            headers = {}
+            for line in lines[1:]:
+                key, sep, value = line.partition(":")
+                if not sep:
+                    raise ValueError(line)
+                headers[key.strip().lower()] = value.strip()
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            return self._fail(400, "bad_request", "Malformed HTTP request")
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            return self._fail(501, "bad_request",
+                              "Chunked request bodies are not supported; send Content-Length")
+        if length < 0 or length > self._server.max_body:
+            return self._fail(413, "bad_request",
+                              f"Request body must be at most {self._server.max_body} bytes")
+        total = end + 4 + length
+        if len(buf) < total:
+            if (headers.get("expect", "").lower() == "100-continue" and not self._continued
+                    and not self._pending and self._transport is not None):
+                self._transport.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+                self._continued = True
+            return None
+        body = bytes(buf[end + 4:total])
+        del buf[:total]
+        self._continued = False
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        if not keep_alive:
+            self._closing = True
+        return self._server.handle(method, target, body), keep_alive
+
+    def _write_ready(self, _: Any = None) -> None:
+        while self._pending and self._pending[0][0].done():
+            reply, keep_alive = self._pending.popleft()
+            if self._transport is None:
+                return
+            if reply.cancelled():
+                status, body = 500, _encode(_error("exception", "request cancelled"))
+            else:
+                status, body = reply.result()
+            self._transport.write(_http_response(status, body, keep_alive))
+            if not keep_alive:
+                self._transport.close()
+                self._transport = None
+                return
+        self._throttle()
+
+    def _throttle(self) -> None:
+        """Stop reading while too many replies are outstanding or the peer is not reading."""
+        if self._transport is None:
+            return
+        busy = self._write_paused or len(self._pending) >= self._server.max_pipeline
+        if busy and not self._read_paused:
+            self._transport.pause_reading()
+            self._read_paused = True
+        elif not busy and self._read_paused:
+            self._transport.resume_reading()
+            self._read_paused = False
+
+
+class Server:
+    """asyncio HTTP front end over a FunctionDispatcher; see the module docstring.
+
+    - batch_window: seconds to collect calls before running a batch (0: one loop iteration)
+    - max_body: largest accepted request body, in bytes
+    - max_pipeline: replies in flight per connection before the server stops reading it
+    - offload: run batches in the loop's default executor instead of on the loop thread
+    """
+
+    def __init__(
+        self,
+        dispatcher: Optional[FunctionDispatcher] = None,
+        *,
+        config_path: str | Path | None = None,
+        batch_window: float = 0.0,
+        max_body: int = DEFAULT_MAX_BODY,
+        max_pipeline: int = 64,
+        offload: bool = False,
+    ) -> None:
+        self.dispatcher = dispatcher or get_dispatcher(config_path)
+        self.batch_window = batch_window
+        self.max_body = max_body
+        self.max_pipeline = max_pipeline
+        self.offload = offload
+        self.stats = {"requests": 0, "calls": 0, "batches": 0}
+        self._servers: List[asyncio.Server] = []
+        self._batch: Dict[str, Tuple[Any, List[Tuple[Any, asyncio.Future[Reply]]]]] = {}
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # -- listening -------------------------------------------------------------
+
+    async def start(self, host: Optional[str] = None, port: Optional[int] = None, *,
+                    unix_path: Optional[str] = None, sockets: Sequence[socket.socket] = (),
+                    reuse_port: bool = False) -> Server:
+        """Listen on host:port, on unix_path and/or on already-bound `sockets`."""
+        self._loop = loop = asyncio.get_running_loop()
+        factory = lambda: _HttpProtocol(self)  # noqa: E731
+        for sock in sockets:
+            if sock.family == getattr(socket, "AF_UNIX", None):
+                self._servers.append(await loop.create_unix_server(factory, sock=sock))
+            else:
+                self._servers.append(await loop.create_server(factory, sock=sock))
+        if port is not None:
+            self._servers.append(
+                await loop.create_server(factory, host, port, reuse_port=reuse_port or None))
+        if unix_path is not None:
+            self._servers.append(await loop.create_unix_server(factory, unix_path))
+        return self
+
+    @property
+    def addresses(self) -> List[str]:
+        """Listening addresses, as "http://host:port" or "unix:<path>"."""
+        out = []
+        for srv in self._servers:
+            for sock in srv.sockets:
+                name = sock.getsockname()
+                out.append(f"unix:{name}" if isinstance(name, str) else f"http://{name[0]}:{name[1]}")
+        return out
+
+    async def serve_forever(self) -> None:
+        await asyncio.gather(*(srv.serve_forever() for srv in self._servers))
+
+    def close(self) -> None:
+        for srv in self._servers:
+            srv.close()
+
+    async def wait_closed(self) -> None:
+        for srv in self._servers:
+            await srv.wait_closed()
+        self._servers = []
+
+    async def __aenter__(self) -> Server:
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self.close()
+        await self.wait_closed()
+
+    # -- requests --------------------------------------------------------------
+
+    def reply(self, status: int, payload: Any) -> asyncio.Future[Reply]:
+        fut = self._loop.create_future()  # type: ignore[union-attr]
+        fut.set_result((status, _encode(payload)))
+        return fut
+
+    def handle(self, method: str, target: str, body: bytes) -> asyncio.Future[Reply]:
+        """Route one request; the returned future resolves to (status, body)."""
+        self.stats["requests"] += 1
+        path = unquote(target.split("?", 1)[0])
+        if path == "/health":
+            cfg = self.dispatcher.registry.data
+            return self.reply(200, {"status": "ok", "pid": os.getpid(), "functions": list(cfg),
+                                    "stats": self.stats})
+        if method != "POST":
+            message = f"{method} {path} is not supported; use POST"
+            return self.reply(405, _error("bad_request", message))
+        if path != "/batch" and path != "/run" and not path.startswith("/run/"):
+            return self.reply(404, _error("not_found", f"No endpoint {path}"))
+        try:
+            doc = json.loads(body) if body else {}
+        except ValueError as e:
+            return self.reply(400, _error("invalid_json", f"Invalid JSON: {e}"))
+        if path != "/batch":
+            return self.call(doc, path[5:] or None)
+        if not isinstance(doc, list):
+            return self.reply(400, _error("invalid_record", "/batch expects a list of records."))
+        return self._join([self.call(record) for record in doc])
+
+    def _join(self, replies: List[asyncio.Future[Reply]]) -> asyncio.Future[Reply]:
+        out = self._loop.create_future()  # type: ignore[union-attr]
+
+        def done(gathered: asyncio.Future[List[Reply]]) -> None:
+            if not out.done():
+                bodies = b",".join(body for _, body in gathered.result())
+                out.set_result((200, b"[" + bodies + b"]"))
+
+        asyncio.gather(*replies).add_done_callback(done)
+        return out
+
+    def call(self, record: Any, name: Optional[str] = None) -> asyncio.Future[Reply]:
+        """Queue one call for the next batch of its function."""
+        from elementals.cli import RecordError, prepare_record  # lazy import to avoid cycles
+
+        try:
+            fn, ep = prepare_record(record, name=name, dispatcher=self.dispatcher)
+        except RecordError as e:
+            return self.reply(RECORD_STATUS[e.code], _error(e.code, str(e)))
+        name = name or record["function"]
+        loop = self._loop
+        fut = loop.create_future()  # type: ignore[union-attr]
+        self._batch.setdefault(name, (fn, []))[1].append((ep, fut))
+        if self._flush_handle is None:
+            if self.batch_window > 0:
+                self._flush_handle = loop.call_later(self.batch_window, self._flush)  # type: ignore[union-attr]
+            else:
+                self._flush_handle = loop.call_soon(self._flush)  # type: ignore[union-attr]
+        return fut
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        batch, self._batch = self._batch, {}
+        for fn, items in batch.values():
+            self.stats["batches"] += 1
+            self.stats["calls"] += len(items)
+            inputs = [ep for ep, _ in items]
+            if self.offload:
+                task = self._loop.run_in_executor(None, _run_group, fn, inputs)  # type: ignore[union-attr]
+                task.add_done_callback(functools.partial(self._settle, items))
+            else:
+                try:
+                    bodies = _run_group(fn, inputs)
+                except Exception as e:
+                    self._resolve(items, [], str(e))
+                else:
+                    self._resolve(items, bodies)
+
+    def _settle(self, items: List[Tuple[Any, asyncio.Future[Reply]]],
+                task: asyncio.Future[List[bytes]]) -> None:
+        try:
+            bodies = task.result()
+        except Exception as e:
+            self._resolve(items, [], str(e))
+        else:
+            self._resolve(items, bodies)
+
+    @staticmethod
+    def _resolve(items: List[Tuple[Any, asyncio.Future[Reply]]], bodies: List[bytes],
+                 failure: str = "no response for this call") -> None:
+        """Answer every call in `items`; calls without a body get a 500 "exception" error."""
+        for i, (_, fut) in enumerate(items):
+            if fut.done():
+                continue
+            if i < len(bodies):
+                fut.set_result((200, bodies[i]))
+            else:
+                fut.set_result((500, _encode(_error("exception", failure))))
+
+
+# -- pre-forked serving ----------------------------------------------------------
+
+
+async def _serve(server: Server, host: Optional[str], port: Optional[int],
+                 sockets: Sequence[socket.socket], reuse_port: bool) -> None:
+    await server.start(host, port, sockets=sockets, reuse_port=reuse_port)
+    loop = asyncio.get_running_loop()
+    stop: asyncio.Future[None] = loop.create_future()
+
+    def shutdown() -> None:
+        if not stop.done():
+            stop.set_result(None)
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, shutdown)
+    await stop
+    server.close()
+    await server.wait_closed()
+
+
+def _listen(family: int, address: Any, reuse_port: bool = False,
+            listen: bool = True) -> socket.socket:
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    if family != getattr(socket, "AF_UNIX", None):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind(address)
+    if listen:
+        sock.listen(socket.SOMAXCONN)
+    sock.setblocking(False)
+    return sock
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: Optional[int] = DEFAULT_PORT,
+    *,
+    unix_path: Optional[str] = None,
+    workers: int = 1,
+    config_path: str | Path | None = None,
+    ready: Optional[Callable[[List[str]], None]] = None,
+    **options: Any,
+) -> int:
+    """Serve until SIGTERM/SIGINT; returns an exit status.
+
+    `port=None` serves only the unix socket. `ready` is called with the bound addresses
+    before the workers start. `options` are passed to Server.
+    """
+    dispatcher = get_dispatcher(config_path)
+    dispatcher.warm()
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    reuse_port = workers > 1 and hasattr(socket, "SO_REUSEPORT")
+    shared: List[socket.socket] = []
+    reserved = None
+    addresses = []
+    if port is not None:
+        if reuse_port:
+            # bound but never listening: fixes the port (also for port=0) for every worker
+            reserved = _listen(family, (host, port), reuse_port=True, listen=False)
+            port = reserved.getsockname()[1]
+        else:
+            shared.append(_listen(family, (host, port)))
+            port = shared[-1].getsockname()[1]
+        addresses.append(f"http://{host}:{port}")
+    if unix_path is not None:
+        if os.path.exists(unix_path):
+            os.unlink(unix_path)
+        shared.append(_listen(socket.AF_UNIX, unix_path))
+        addresses.append(f"unix:{unix_path}")
+    tcp: Tuple[Optional[str], Optional[int]] = (None, None)
+    if reuse_port and port is not None:
+        tcp = (host, port)
+
+    def worker() -> None:
+        asyncio.run(_serve(Server(dispatcher, **options), *tcp, shared, reuse_port))
+
+    if ready is not None:
+        ready(addresses)
+    try:
+        if workers <= 1:
+            worker()
+            return 0
+        pids = []
+        for _ in range(workers):
+            pid = os.fork()
+            if pid == 0:  # pragma: no cover - runs in the forked worker
+                code = 0
+                try:
+                    if reserved is not None:
+                        reserved.close()
+                    worker()
+                except BaseException:
+                    code = 1
+                finally:
+                    os._exit(code)
+            pids.append(pid)
+
+        def terminate(signum: int, frame: Any) -> None:
+            for pid in pids:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+
+        signal.signal(signal.SIGTERM, terminate)
+        signal.signal(signal.SIGINT, terminate)
+        status = 0
+        for pid in pids:
+            _, code = os.waitpid(pid, 0)
+            status = status or os.waitstatus_to_exitcode(code)
+        return status
+    finally:
+        for sock in ([reserved] if reserved is not None else []) + shared:
+            sock.close()
+        if unix_path is not None and os.path.exists(unix_path):
+            os.unlink(unix_path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m configfuncs.server",
+                                description="Serve configured functions over HTTP")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=None,
+                   help=f"TCP port (default: {DEFAULT_PORT} unless --unix is given)")
+    p.add_argument("--unix", default=None, help="Also (or only) listen on this unix socket path")
+    p.add_argument("--workers", type=int, default=1,
+                   help="Pre-forked worker processes (default: 1)")
+    p.add_argument("--config", default=None,
+                   help="configFunctions.yaml path (default: the registry default)")
+    p.add_argument("--batch-window", type=float, default=0.0,
+                   help="Seconds to collect calls per batch")
+    p.add_argument("--offload", action="store_true",
+                   help="Run batches in a thread pool, off the event loop")
+    args = p.parse_args(argv)
+
+    port = args.port if args.port is not None or args.unix else DEFAULT_PORT
+    return serve(
+        args.host, port, unix_path=args.unix, workers=args.workers, config_path=args.config,
+        ready=lambda addrs: print(f"serving on {' '.join(addrs)} ({args.workers} workers)",
+                                  flush=True),
+        batch_window=args.batch_window, offload=args.offload,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""Precompiled snapshot of configFunctions.yaml so cold starts skip YAML parsing.
+
+  python -m configfuncs.snapshot [path/to/configFunctions.yaml]
+
+validates the entries and writes configFunctions.snapshot.json next to the YAML. The
+file is a one-line JSON header with the YAML's (mtime_ns, size) stamp and content
+hash, followed by the entries as compact JSON. The enum fields (role, sync,
+resource_type, duration) are checked against the elementals enums and normalized
+to their values, so a typo fails the build rather than a function constructor.
+
+ConfigRegistry maps the snapshot with mmap and checks the header first. It parses
+the body only while the stamp still matches. Any edit to the YAML makes the snapshot
+stale, and the registry falls back to the YAML.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .characteristics import enum_fields, resolve_enum
+
+SNAPSHOT_FILE = "configFunctions.snapshot.json"
+FORMAT = 2
+
+
+def snapshot_path(config_path: str | Path) -> Path:
+    """Snapshot location for the YAML at `config_path`."""
+    return Path(config_path).with_name(SNAPSHOT_FILE)
+
+
+def read_snapshot(config_path: str | Path, stamp: Tuple[int, int]) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+    """Return (digest, data) from the snapshot if it matches `stamp`, else None."""
+    try:
+        with open(snapshot_path(config_path), "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = mm.find(b"\n")
+            if end < 0:
+                return None
+            header = json.loads(mm[:end])
+            if header.get("format") != FORMAT or header.get("stamp") != list(stamp):
+                return None
+            data = json.loads(mm[end + 1:])
+            return bytes.fromhex(header["digest"]), data
+    except (OSError, ValueError, KeyError, AttributeError):
+        # missing, empty (mmap raises ValueError) or corrupt: use the YAML
+        return None
+
+
+def validate_config(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of `data` with enum fields normalized; raise ValueError listing every bad entry."""
+    fields = enum_fields()
+    errors: List[str] = []
+    out: Dict[str, Any] = {}
+    for name, entry in data.items():
+        if not isinstance(entry, dict):
+            errors.append(f"{name}: entry must be a mapping")
+            continue
+        entry = dict(entry)
+        for key, enum in fields.items():
+            if key in entry:
+                try:
+                    entry[key] = resolve_enum(enum, entry[key]).value
+                except ValueError as e:
+                    errors.append(f"{name}.{key}: {e}")
+        out[name] = entry
+    if errors:
+        raise ValueError("Invalid configFunctions.yaml:\n  " + "\n  ".join(errors))
+    return out
+
+
+def write_snapshot(config_path: str | Path | None = None) -> Path:
+    """Parse and validate the YAML at `config_path` (default: discovered); write its snapshot."""
+    from .registry import ConfigRegistry, find_config_path
+
+    path = Path(config_path).resolve() if config_path is not None else find_config_path()
+    st = os.stat(path)
+    raw = path.read_bytes()
+    header = {
+        "format": FORMAT,
+        "stamp": [st.st_mtime_ns, st.st_size],
+        "digest": hashlib.blake2b(raw, digest_size=16).hexdigest(),
+    }
+    body = validate_config(ConfigRegistry._parse(raw))
+    out = snapshot_path(path)
+    tmp = out.with_name(out.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(json.dumps(header, separators=(",", ":")).encode("utf-8") + b"\n")
+        f.write(json.dumps(body, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+    os.replace(tmp, out)
+    return out
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    try:
+        print(write_snapshot(args[0] if args else None))
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
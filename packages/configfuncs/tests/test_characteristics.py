@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+from configfuncs.characteristics import CharacteristicsIndex, get_characteristics
+from configfuncs.registry import ConfigRegistry
+from elementals.enums import DurationClass, ResourceType, RoleInProcess, SyncType
+
+CONFIG = {
+    "Check": {"role": "special_param_validation", "resource_type": "io"},
+    "Fetch": {"role": "business_action", "resource_type": "external_api", "duration": "long"},
+    "Multiply": {"description": "a*b", "role": "BUSINESS_ACTION", "sync": "sync"},
+    "Broken": {"role": "boss"},
+}
+
+
+def test_index_builds_validated_interned_characteristics():
+    index = CharacteristicsIndex(CONFIG)
+    fc = index["Multiply"]
+    assert (fc.name, fc.description, fc.role, fc.sync, fc.resource_type, fc.duration) == (
+        "Multiply", "a*b", RoleInProcess.BUSINESS_ACTION, SyncType.SYNC, ResourceType.CPU, DurationClass.SHORT,
+    )
+    assert CharacteristicsIndex(CONFIG)["Multiply"] is fc
+    assert "Broken" not in index and "RoleInProcess" in index.errors["Broken"]
+    with pytest.raises(ValueError):
+        index["Broken"]
+    with pytest.raises(KeyError):
+        index["Nope"]
+
+
+def test_index_queries():
+    index = CharacteristicsIndex(CONFIG)
+    assert index.by_role(RoleInProcess.BUSINESS_ACTION) == ("Fetch", "Multiply")
+    assert index.by_role("special_param_validation") == ("Check",)
+    assert index.by_resource_type("external_api") == ("Fetch",)
+    assert index.by_duration(DurationClass.MEDIUM) == ()
+    assert index.select(role="business_action", duration="long") == ("Fetch",)
+    assert index.select() == ("Check", "Fetch", "Multiply")
+
+
+def test_registry_rebuilds_index_per_version(tmp_path):
+    cfg = tmp_path / "configFunctions.yaml"
+    cfg.write_text("Echo:\n  role: rollback\n", encoding="utf-8")
+    os.utime(cfg, ns=(1_000_000_000, 1_000_000_000))
+    reg = ConfigRegistry(cfg, check_interval=0)
+    index = reg.characteristics
+    assert reg.characteristics is index and index.by_role("rollback") == ("Echo",)
+    assert get_characteristics("Echo", registry=reg, description="fallback").description == "fallback"
+    assert get_characteristics("Other", registry=reg).role is RoleInProcess.BUSINESS_ACTION
+
+    cfg.write_text("Echo:\n  role: rebuild_response\n", encoding="utf-8")
+    os.utime(cfg, ns=(2_000_000_000, 2_000_000_000))
+    assert reg.characteristics.by_role("rebuild_response") == ("Echo",)
+    assert reg.characteristics is not index
@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+from configfuncs.dispatch import FunctionDispatcher
+from configfuncs.registry import ConfigRegistry
+
+FUNCS = '''
+CREATED = []
+
+
+class Upper:
+    def __init__(self):
+        CREATED.append(self)
+
+    def run(self, params):
+        return {"status": "success", "data": params.upper(), "meta": None}
+
+
+class Lower(Upper):
+    def run(self, params):
+        return {"status": "success", "data": params.lower(), "meta": None}
+'''
+
+
+@pytest.fixture()
+def dispatcher(tmp_path, monkeypatch):
+    (tmp_path / "dispatch_funcs.py").write_text(FUNCS, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    cfg = tmp_path / "configFunctions.yaml"
+    cfg.write_text("Case:\n  class: Upper\n  classModule: dispatch_funcs\n", encoding="utf-8")
+    os.utime(cfg, ns=(1_000_000_000, 1_000_000_000))
+    return FunctionDispatcher(ConfigRegistry(cfg, check_interval=0))
+
+
+def test_dispatcher_keeps_warm_instance(dispatcher):
+    import dispatch_funcs
+
+    assert dispatcher.run("Case", "abc")["data"] == "ABC"
+    assert dispatcher.run("Case", "def")["data"] == "DEF"
+    assert len(dispatch_funcs.CREATED) == 1
+    assert dispatcher.runner("Case") is dispatcher.runner("Case")
+
+
+def test_dispatcher_unknown_name(dispatcher):
+    with pytest.raises(KeyError):
+        dispatcher.run("Nope", "x")
+
+
+def test_dispatcher_rebuilds_on_config_version_change(dispatcher):
+    assert dispatcher.run("Case", "AbC")["data"] == "ABC"
+    cfg = dispatcher.registry.path
+    cfg.write_text("Case:\n  class: Lower\n  classModule: dispatch_funcs\n", encoding="utf-8")
+    os.utime(cfg, ns=(2_000_000_000, 2_000_000_000))
+    assert dispatcher.run("Case", "AbC")["data"] == "abc"
+
+
+def test_dispatcher_enables_cache_for_pure_entries(tmp_path):
+    cfg = tmp_path / "configFunctions.yaml"
+    cfg.write_text(
+        "Multiply:\n  class: MultiplyFunction\n  classModule: elementals.examples.multiply\n"
+        "  pure: true\n  cache_max_size: 4\n",
+        encoding="utf-8",
+    )
+    from elementals.params import ElementalParams
+
+    dispatcher = FunctionDispatcher(ConfigRegistry(cfg, check_interval=0))
+    for _ in range(3):
+        assert dispatcher.run("Multiply", ElementalParams(params={"a": 3, "b": 4}))["data"]["product"] == 12
+    assert dispatcher.cache_stats()["Multiply"]["hits"] == 2
+    assert dispatcher.instance("Multiply").cache.max_size == 4
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+from configfuncs.parallel import ParallelRunner
+from elementals.examples.lcm import LCMFunction
+from elementals.examples.multiply import MultiplyFunction
+from elementals.params import ElementalParams, Meta
+
+
+@pytest.fixture(scope="module")
+def runner():
+    with ParallelRunner(2, chunksize=7, warm=["Multiply", "LCM"]) as r:
+        yield r
+
+
+def test_workers_are_preforked(runner):
+    assert len(runner.worker_pids) == 2
+    assert os.getpid() not in runner.worker_pids
+    # the barrier resets, so a later rendezvous reaches the same warm workers
+    assert runner.prefork() == runner.worker_pids
+
+
+def test_results_in_input_order(runner):
+    items = []
+    for i in range(100):
+        items.append(("Multiply", {"a": i, "b": 2**70}))
+        items.append(("LCM", {"a": i + 1, "b": 6}))
+    items.append(("Multiply", {"a": 1}))
+    out = runner.run(items)
+    assert len(out) == len(items)
+    mul, lcm = MultiplyFunction(), LCMFunction()
+    expected = [
+        (mul if name == "Multiply" else lcm).run(ElementalParams(params=params))
+        for name, params in items
+    ]
+    assert out == expected
+    assert out[-1]["error"]["code"] == "missing_param"
+
+
+def test_map_streams_lazily_and_accepts_params_models(runner):
+    meta = Meta(call_id="m")
+    consumed = []
+
+    def items():
+        for i in range(50):
+            consumed.append(i)
+            yield ("Multiply", ElementalParams(params={"a": i, "b": 3}, meta=meta))
+
+    stream = runner.map(items())
+    first = next(stream)
+    assert first["data"]["product"] == 0 and first["meta"]["call_id"] == "m"
+    assert len(consumed) < 50  # bounded look-ahead, not the whole stream
+    assert [o["data"]["product"] for o in stream] == [i * 3 for i in range(1, 50)]
@@ -0,0 +1,146 @@
+import pytest
+
+from configfuncs.dispatch import FunctionDispatcher
+from configfuncs.pipeline import Pipeline
+from configfuncs.registry import ConfigRegistry
+from elementals.params import ElementalParams
+from elementals.savepoint import LayeredSavepoint
+
+FUNCS = '''
+import threading
+
+from elementals.base import ElementalFunction, FunctionCharacteristics
+from elementals.enums import RoleInProcess
+from elementals.responses import error_response, success_response
+
+CALLS = []
+BARRIER = threading.Barrier(2, timeout=5)
+
+
+class Step(ElementalFunction):
+    role = RoleInProcess.BUSINESS_ACTION
+
+    def __init__(self):
+        super().__init__(FunctionCharacteristics(type(self).__name__, "", self.role))
+
+    def run(self, params):
+        CALLS.append(type(self).__name__)
+        return success_response(params, dict(params.params))
+
+
+class NeedsA(Step):
+    role = RoleInProcess.SPECIAL_PARAM_VALIDATION
+
+    def run(self, params):
+        CALLS.append("NeedsA")
+        BARRIER.wait()
+        if "a" not in params.params:
+            return error_response(params, "missing_param", "a is required")
+        return success_response(params, {"valid": True})
+
+
+class NeedsB(NeedsA):
+    def run(self, params):
+        CALLS.append("NeedsB")
+        BARRIER.wait()
+        return success_response(params, {"valid": True})
+
+
+class Fail(Step):
+    def run(self, params):
+        CALLS.append(type(self).__name__)
+        return error_response(params, "boom", "action failed")
+
+
+class FailToComplete(Fail):
+    role = RoleInProcess.COMPLETE_INCOMPLETE_ACTION
+
+
+class Undo(Step):
+    role = RoleInProcess.ROLLBACK
+
+
+class Rebuild(Step):
+    role = RoleInProcess.REBUILD_RESPONSE
+'''
+
+NAMES = {
+    "NeedsA": "NeedsA", "NeedsB": "NeedsB", "Multiply": "MultiplyFunction",
+    "Fail": "Fail", "FailToComplete": "FailToComplete", "Undo": "Undo", "Rebuild": "Rebuild",
+}
+
+
+@pytest.fixture()
+def dispatcher(tmp_path, monkeypatch):
+    (tmp_path / "pipeline_funcs.py").write_text(FUNCS, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    import pipeline_funcs
+
+    pipeline_funcs.CALLS.clear()
+    pipeline_funcs.BARRIER.reset()
+    lines = []
+    for name, cls in NAMES.items():
+        module = "elementals.examples.multiply" if name == "Multiply" else "pipeline_funcs"
+        lines.append(f"{name}:\n  class: {cls}\n  classModule: {module}\n")
+    cfg = tmp_path / "configFunctions.yaml"
+    cfg.write_text("".join(lines), encoding="utf-8")
+    return FunctionDispatcher(ConfigRegistry(cfg, check_interval=0))
+
+
+def test_stages_run_in_role_order_with_wired_outputs(dispatcher):
+    import pipeline_funcs
+
+    with Pipeline({
+        "Rebuild": {"answer": "$savepoint.stages.Multiply.product"},
+        "Multiply": {"a": "$params.a", "b": "$savepoint.factor"},
+        "NeedsA": None,
+        "NeedsB": None,
+    }, dispatcher=dispatcher) as pipeline:
+        base = {"factor": 7}
+        result = pipeline.run(ElementalParams(params={"a": 6}, savepoint=base))
+    assert result.ok
+    assert result.response["data"] == {"answer": 42}
+    assert pipeline_funcs.CALLS[-1] == "Rebuild"
+    assert set(pipeline_funcs.CALLS[:2]) == {"NeedsA", "NeedsB"}  # ran concurrently (barrier)
+    assert result.savepoint.diff()["set"]["stages"]["Multiply"]["product"] == 42
+    assert base == {"factor": 7}
+
+
+def test_first_validation_error_short_circuits(dispatcher):
+    import pipeline_funcs
+
+    with Pipeline(["NeedsA", "NeedsB", "Multiply"], dispatcher=dispatcher) as pipeline:
+        result = pipeline.run(ElementalParams(params={"b": 1}))
+    assert not result.ok and result.failed_stage == "NeedsA"
+    assert result.response["error"]["code"] == "missing_param"
+    assert "Multiply" not in pipeline_funcs.CALLS
+
+
+def test_failed_action_runs_rollback_and_keeps_error(dispatcher):
+    import pipeline_funcs
+
+    sp = LayeredSavepoint({"k": 1})
+    pipeline = Pipeline(["Fail", "Undo", "Rebuild"], dispatcher=dispatcher)
+    result = pipeline.run(ElementalParams(params={}, savepoint=sp))
+    assert result.failed_stage == "Fail" and result.response["error"]["code"] == "boom"
+    assert pipeline_funcs.CALLS == ["Fail", "Undo"]
+    assert result.savepoint["stages"]["Fail"] == {"error": {"code": "boom", "message": "action failed"}}
+    assert "stages" not in sp
+
+
+def test_failed_completion_runs_rollback(dispatcher):
+    import pipeline_funcs
+
+    pipeline = Pipeline({"Multiply": {"a": "$params.a", "b": 2}, "FailToComplete": None,
+                         "Undo": None, "Rebuild": None}, dispatcher=dispatcher)
+    result = pipeline.run(ElementalParams(params={"a": 3}))
+    assert result.failed_stage == "FailToComplete" and result.response["error"]["code"] == "boom"
+    assert pipeline_funcs.CALLS == ["FailToComplete", "Undo"]
+    assert result.savepoint["stages"]["Multiply"]["product"] == 6
+
+
+def test_input_template_must_be_a_mapping(dispatcher):
+    with pytest.raises(TypeError, match="Multiply"):
+        Pipeline({"Multiply": "$params.a"}, dispatcher=dispatcher)
+    with pytest.raises(TypeError):
+        Pipeline([("Multiply", ["$params.a"])], dispatcher=dispatcher)
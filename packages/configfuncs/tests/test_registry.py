@@ -0,0 +1,112 @@
+import os
+
+import pytest
+
+from configfuncs.loader import load_config
+from configfuncs.registry import ConfigRegistry
+
+
+def write_cfg(path, text, mtime_ns=None):
+    path.write_text(text, encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_registry_caches_parsed_mapping(tmp_path):
+    cfg = tmp_path / "configFunctions.yaml"
+    write_cfg(cfg, "Echo:\n  class: EchoFunction\n")
+    reg = ConfigRegistry(cfg, check_interval=0)
+    first = reg.data
+    assert first == {"Echo": {"class": "EchoFunction"}}
+    assert reg.version == 1
+    # unchanged file: same object, no reload
+    assert reg.data is first
+    assert reg.version == 1
+
+
+def test_registry_reloads_on_content_change(tmp_path):
+    cfg = tmp_path / "configFunctions.yaml"
+    write_cfg(cfg, "Echo:\n  class: EchoFunction\n", mtime_ns=1_000_000_000)
+    reg = ConfigRegistry(cfg, check_interval=0)
+    assert "Multiply" not in reg.data
+    write_cfg(cfg, "Multiply:\n  class: MultiplyFunction\n", mtime_ns=2_000_000_000)
+    assert "Multiply" in reg.data
+    assert reg.version == 2
+
+
+def test_registry_touch_without_change_keeps_version(tmp_path):
+    cfg = tmp_path / "configFunctions.yaml"
+    write_cfg(cfg, "Echo:\n  class: EchoFunction\n", mtime_ns=1_000_000_000)
+    reg = ConfigRegistry(cfg, check_interval=0)
+    first = reg.data
+    os.utime(cfg, ns=(3_000_000_000, 3_000_000_000))
+    assert reg.data is first
+    assert reg.version == 1
+
+
+def test_registry_check_interval_throttles_stat(tmp_path):
+    cfg = tmp_path / "configFunctions.yaml"
+    write_cfg(cfg, "Echo:\n  class: EchoFunction\n", mtime_ns=1_000_000_000)
+    reg = ConfigRegistry(cfg, check_interval=3600)
+    reg.data
+    write_cfg(cfg, "Multiply:\n  class: MultiplyFunction\n", mtime_ns=2_000_000_000)
+    assert "Multiply" not in reg.data
+    assert reg.refresh() is True
+    assert "Multiply" in reg.data
+
+
+def test_registry_retries_after_parse_error(tmp_path):
+    cfg = tmp_path / "configFunctions.yaml"
+    write_cfg(cfg, "Echo: [unclosed\n", mtime_ns=1_000_000_000)
+    reg = ConfigRegistry(cfg, check_interval=0)
+    for _ in range(2):  # the failed parse is not remembered as "unchanged"
+        with pytest.raises(Exception):
+            reg.data
+    assert reg.version == 0
+    write_cfg(cfg, "Echo:\n  class: EchoFunction\n", mtime_ns=1_000_000_000)
+    assert reg.data == {"Echo": {"class": "EchoFunction"}}
+    assert reg.version == 1
+
+
+def test_load_config_with_explicit_path(tmp_path):
+    cfg = tmp_path / "configFunctions.yaml"
+    write_cfg(cfg, "LCM:\n  class: LCMFunction\n")
+    assert load_config(cfg) == {"LCM": {"class": "LCMFunction"}}
+    assert load_config(cfg) is load_config(cfg)
+
+
+def test_registry_prefers_current_snapshot(tmp_path, monkeypatch):
+    from configfuncs import registry, snapshot
+
+    cfg = tmp_path / "configFunctions.yaml"
+    write_cfg(cfg, "Echo:\n  class: EchoFunction\n", mtime_ns=1_000_000_000)
+    assert snapshot.write_snapshot(cfg) == tmp_path / snapshot.SNAPSHOT_FILE
+
+    def no_parse(raw):
+        raise AssertionError("YAML parsed despite a current snapshot")
+
+    monkeypatch.setattr(registry.ConfigRegistry, "_parse", staticmethod(no_parse))
+    reg = ConfigRegistry(cfg, check_interval=0)
+    assert reg.data == {"Echo": {"class": "EchoFunction"}}
+
+    # editing the YAML makes the snapshot stale: fall back to parsing
+    monkeypatch.undo()
+    write_cfg(cfg, "Multiply:\n  class: MultiplyFunction\n", mtime_ns=2_000_000_000)
+    assert reg.data == {"Multiply": {"class": "MultiplyFunction"}}
+    assert reg.version == 2
+
+
+def test_snapshot_validates_and_normalizes_enums(tmp_path):
+    from configfuncs import snapshot
+
+    cfg = tmp_path / "configFunctions.yaml"
+    write_cfg(cfg, "Echo:\n  class: EchoFunction\n  role: BUSINESS_ACTION\n  duration: short\n")
+    snapshot.write_snapshot(cfg)
+    st = os.stat(cfg)
+    digest, data = snapshot.read_snapshot(cfg, (st.st_mtime_ns, st.st_size))
+    assert data == {"Echo": {"class": "EchoFunction", "role": "business_action", "duration": "short"}}
+    assert snapshot.read_snapshot(cfg, (0, 0)) is None
+
+    write_cfg(cfg, "Echo:\n  role: boss\nBad: 3\n")
+    with pytest.raises(ValueError, match=r"Echo\.role(.|\n)*Bad: entry must be a mapping"):
+        snapshot.write_snapshot(cfg)
@@ -0,0 +1,104 @@
+import os
+import threading
+import time
+from typing import Any, Dict
+
+import pytest
+
+from configfuncs.scheduler import Scheduler, lane_for
+from elementals.base import ElementalFunction, FunctionCharacteristics
+from elementals.enums import DurationClass, ResourceType, RoleInProcess
+from elementals.params import ElementalParams
+
+
+def _characteristics(name, resource, duration=DurationClass.SHORT):
+    return FunctionCharacteristics(
+        name=name, description=name, role=RoleInProcess.BUSINESS_ACTION,
+        resource_type=resource, duration=duration,
+    )
+
+
+class PidFunction(ElementalFunction[Dict[str, Any]]):
+    def __init__(self):
+        super().__init__(_characteristics("Pid", ResourceType.CPU))
+
+    def run(self, params: ElementalParams) -> Dict[str, Any]:
+        return {"status": "success", "data": {"pid": os.getpid()}, "meta": None}
+
+
+class ApiFunction(ElementalFunction[Dict[str, Any]]):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self):
+        super().__init__(_characteristics("Api", ResourceType.EXTERNAL_API))
+
+    def run(self, params: ElementalParams) -> Dict[str, Any]:
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        time.sleep(0.02)
+        with cls.lock:
+            cls.active -= 1
+        return {"status": "success", "data": {"thread": threading.current_thread().name}, "meta": None}
+
+
+CONFIG = """
+Pid:
+  class: PidFunction
+  classModule: test_scheduler
+Api:
+  class: ApiFunction
+  classModule: test_scheduler
+"""
+
+
+@pytest.fixture()
+def config_path(tmp_path):
+    path = tmp_path / "configFunctions.yaml"
+    path.write_text(CONFIG, encoding="utf-8")
+    return path
+
+
+def test_lane_for_routes_by_resource_and_duration():
+    assert lane_for(_characteristics("a", ResourceType.CPU)) == "cpu"
+    assert lane_for(_characteristics("b", ResourceType.IO)) == "io"
+    assert lane_for(_characteristics("c", ResourceType.NETWORK)) == "io"
+    assert lane_for(_characteristics("d", ResourceType.EXTERNAL_API)) == "external_api"
+    assert lane_for(_characteristics("e", ResourceType.CPU, DurationClass.LONG)) == "cpu_long"
+    assert lane_for(_characteristics("f", ResourceType.IO, DurationClass.MEDIUM)) == "io"
+
+
+def test_cpu_work_runs_in_worker_processes(config_path):
+    with Scheduler(cpu_workers=2, config_path=config_path) as sched:
+        outs = [f.result(timeout=30) for f in [sched.submit("Pid") for _ in range(4)]]
+        metrics = sched.metrics()
+    assert all(o["data"]["pid"] != os.getpid() for o in outs)
+    assert metrics["cpu"]["completed"] == 4
+    assert metrics["cpu"]["queue_depth"] == 0
+
+
+def test_external_api_lane_is_concurrency_limited(config_path):
+    ApiFunction.peak = 0
+    with Scheduler(external_api_limit=2, config_path=config_path) as sched:
+        assert sched.lane("Api") == "external_api"
+        futures = [sched.submit("Api") for _ in range(8)]
+        outs = [f.result(timeout=10) for f in futures]
+        metrics = sched.metrics()["external_api"]
+    assert ApiFunction.peak <= 2
+    assert all(o["data"]["thread"].startswith("elementals-external_api") for o in outs)
+    assert metrics["completed"] == 8 and metrics["in_flight"] == 0
+    # 8 calls through 2 slots: later calls had to wait for a free slot
+    assert metrics["max_wait_ns"] >= 20_000_000
+
+
+def test_rejected_submit_is_not_counted(config_path):
+    with Scheduler(config_path=config_path) as sched:
+        sched.submit("Api").result(timeout=10)
+        sched._pool("external_api").shutdown()
+        with pytest.raises(RuntimeError):
+            sched.submit("Api")
+        metrics = sched.metrics()["external_api"]
+    assert metrics["submitted"] == 1 and metrics["in_flight"] == 0
@@ -0,0 +1,264 @@
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from configfuncs.dispatch import FunctionDispatcher
+from configfuncs.registry import ConfigRegistry
+from configfuncs.server import Server
+
+PACKAGES = Path(__file__).resolve().parents[2]
+CFG_SRC = str(PACKAGES / "configfuncs" / "src")
+EL_SRC = str(PACKAGES / "elementals" / "src")
+
+EXAMPLES = {
+    "Echo": "echo.EchoFunction",
+    "Multiply": "multiply.MultiplyFunction",
+    "Concat": "concat.ConcatFunction",
+    "LCM": "lcm.LCMFunction",
+}
+
+
+@pytest.fixture()
+def config(tmp_path):
+    cfg = tmp_path / "configFunctions.yaml"
+    cfg.write_text("".join(
+        f"{name}:\n  class: {path.split('.')[1]}\n  classModule: elementals.examples.{path.split('.')[0]}\n"
+        for name, path in EXAMPLES.items()
+    ), encoding="utf-8")
+    return cfg
+
+
+@pytest.fixture()
+def dispatcher(config):
+    return FunctionDispatcher(ConfigRegistry(config, check_interval=0))
+
+
+def request(method, path, body=None, close=False):
+    data = b"" if body is None else json.dumps(body).encode()
+    head = f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(data)}\r\n"
+    if close:
+        head += "Connection: close\r\n"
+    return head.encode() + b"\r\n" + data
+
+
+async def read_response(reader):
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while (line := await reader.readline()) != b"\r\n":
+        key, _, value = line.decode().partition(":")
+        headers[key.lower()] = value.strip()
+    body = await reader.readexactly(int(headers["content-length"]))
+    return status, headers, json.loads(body)
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, 10))
+
+
+def test_keep_alive_pipelining_and_errors(dispatcher):
+    async def main():
+        async with await Server(dispatcher).start("127.0.0.1", 0) as server:
+            host, port = server.addresses[0][len("http://"):].rsplit(":", 1)
+            reader, writer = await asyncio.open_connection(host, int(port))
+            # five pipelined requests in one write; replies come back in order
+            writer.write(
+                request("POST", "/run/Multiply", {"params": {"a": 6, "b": 7}})
+                + request("POST", "/run", {"function": "Concat", "params": {"text1": "a", "text2": "b"}})
+                + request("POST", "/run/Nope", {})
+                + request("POST", "/run/Multiply", {"params": {"a": "x"}})
+                + request("GET", "/health")
+            )
+            replies = [await read_response(reader) for _ in range(5)]
+            # the connection stays open until a Connection: close request
+            writer.write(request("POST", "/run/LCM", {"params": {"a": 4, "b": 6}}, close=True))
+            last = await read_response(reader)
+            assert await reader.read() == b""
+            writer.close()
+            return replies, last
+
+    replies, last = run(main())
+    assert [r[0] for r in replies] == [200, 200, 404, 200, 200]
+    assert replies[0][2]["data"]["product"] == 42
+    assert replies[1][2]["data"]["concat"] == "ab"
+    assert replies[2][2]["error"]["code"] == "unknown_function"
+    assert replies[3][2]["status"] == "error"
+    assert replies[4][2]["status"] == "ok" and sorted(replies[4][2]["functions"]) == sorted(EXAMPLES)
+    assert last[1]["connection"] == "close" and last[2]["data"]["lcm"] == 12
+
+
+def test_calls_arriving_together_share_one_run_batch(dispatcher, monkeypatch, tmp_path):
+    batches = []
+    cls = type(dispatcher.instance("Multiply"))
+    original = cls.run_batch
+    monkeypatch.setattr(cls, "run_batch", lambda self, batch, **kw: batches.append(len(batch)) or original(self, batch, **kw))
+    sock_path = str(tmp_path / "s.sock")
+
+    async def main():
+        async with await Server(dispatcher, batch_window=0.05).start(unix_path=sock_path) as server:
+            assert server.addresses == [f"unix:{sock_path}"]
+            conns = [await asyncio.open_unix_connection(sock_path) for _ in range(4)]
+            for i, (_, writer) in enumerate(conns):
+                writer.write(request("POST", "/run/Multiply", {"params": {"a": i, "b": 10}}))
+            singles = [await read_response(reader) for reader, _ in conns]
+            reader, writer = conns[0]
+            writer.write(request("POST", "/batch", [
+                {"function": "Multiply", "params": {"a": 2, "b": 3}},
+                {"function": "Echo", "params": {"x": 1}},
+                {"function": "Multiply", "params": {"a": 4, "b": 5}},
+                {"function": "Nope"},
+            ]))
+            batch = await read_response(reader)
+            for _, w in conns:
+                w.close()
+            return singles, batch
+
+    singles, (status, _, batch) = run(main())
+    assert [r[2]["data"]["product"] for r in singles] == [0, 10, 20, 30]
+    assert status == 200
+    assert [r["status"] for r in batch] == ["success", "success", "success", "error"]
+    assert batch[0]["data"]["product"] == 6 and batch[2]["data"]["product"] == 20
+    assert batch[1]["data"]["echo"] == {"x": 1}
+    assert batches == [4, 2]
+
+
+def test_failing_call_does_not_fail_its_batch(dispatcher):
+    async def main():
+        async with await Server(dispatcher).start() as server:  # no listeners: calls only
+            good = server.call({"function": "Multiply", "params": {"a": 2, "b": 3}})
+            bad = server.call({"function": "Multiply", "params": {"a": "x", "b": "y"}})
+            return [json.loads(body) for _, body in await asyncio.gather(good, bad)]
+
+    good, bad = run(main())
+    assert good["status"] == "success" and good["data"]["product"] == 6
+    assert bad["status"] == "error" and bad["error"]["code"] == "exception"
+
+
+@pytest.mark.parametrize("offload", [False, True])
+def test_unserializable_row_does_not_hang_its_batch(dispatcher, monkeypatch, offload):
+    from elementals import serialize
+    from elementals.responses import success_response
+
+    cls = type(dispatcher.instance("Echo"))
+
+    def run_echo(self, params):
+        data = {"echo": params.params}
+        if params.params.get("loop"):
+            data["self"] = data  # circular: the stdlib fallback raises ValueError
+        return success_response(params, data)
+
+    monkeypatch.setattr(cls, "run", run_echo)
+    previous = serialize.set_backend("json")
+    try:
+        async def main():
+            async with await Server(dispatcher, offload=offload).start() as server:
+                replies = [server.call({"function": "Echo", "params": {"loop": n == 1, "n": n}})
+                           for n in range(3)]
+                return await asyncio.gather(*replies)
+
+        replies = run(main())
+    finally:
+        serialize.set_backend(previous)
+    assert [status for status, _ in replies] == [200, 200, 200]
+    first, bad, last = (json.loads(body) for _, body in replies)
+    assert first["data"]["echo"]["n"] == 0 and last["data"]["echo"]["n"] == 2
+    assert bad["status"] == "error" and bad["error"]["code"] == "unserializable"
+
+
+def test_failed_offloaded_batch_answers_every_call(dispatcher, monkeypatch):
+    def broken(fn, batch):
+        raise RuntimeError("worker lost")
+
+    monkeypatch.setattr("configfuncs.server._run_group", broken)
+
+    async def main():
+        async with await Server(dispatcher, offload=True).start() as server:
+            replies = [server.call({"function": "Multiply", "params": {"a": n, "b": 2}}) for n in range(3)]
+            return await asyncio.gather(*replies)
+
+    replies = run(main())
+    assert [status for status, _ in replies] == [500, 500, 500]
+    assert all(json.loads(body)["error"]["message"] == "worker lost" for _, body in replies)
+
+
+def test_malformed_request_closes_connection(dispatcher):
+    async def main():
+        async with await Server(dispatcher).start("127.0.0.1", 0) as server:
+            host, port = server.addresses[0][len("http://"):].rsplit(":", 1)
+            reader, writer = await asyncio.open_connection(host, int(port))
+            writer.write(b"POST /run/Echo HTTP/1.1\r\nContent-Length: 2\r\n\r\n{]")
+            bad_json = await read_response(reader)
+            writer.write(b"garbage\r\n\r\n")
+            bad_request = await read_response(reader)
+            assert await reader.read() == b""
+            writer.close()
+            return bad_json, bad_request
+
+    bad_json, bad_request = run(main())
+    assert bad_json[0] == 400 and bad_json[2]["error"]["code"] == "invalid_json"
+    assert bad_request[0] == 400 and bad_request[1]["connection"] == "close"
+
+
+def test_record_errors_match_the_cli(dispatcher, monkeypatch):
+    from elementals import cli
+
+    monkeypatch.setattr("configfuncs.dispatch.get_dispatcher", lambda path=None: dispatcher)
+
+    async def main():
+        async with await Server(dispatcher).start() as server:
+            replies = [server.call([1]), server.call({"params": {}}, "Nope"),
+                       server.call({"params": "x"}, "Multiply")]
+            return await asyncio.gather(*replies)
+
+    replies = run(main())
+    assert [status for status, _ in replies] == [400, 404, 422]
+    for (_, body), record in zip(replies, [[1], {"function": "Nope"}, {"function": "Multiply", "params": "x"}]):
+        expected = cli.run_record(record)["error"]
+        del expected["details"]  # the CLI adds the input line number
+        assert json.loads(body)["error"] == expected
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="pre-fork needs os.fork")
+def test_prefork_workers_serve_tcp_and_unix(config, tmp_path):
+    sock_path = str(tmp_path / "w.sock")
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([CFG_SRC, EL_SRC])}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "configfuncs.server", "--port", "0", "--unix", sock_path,
+         "--workers", "2", "--config", str(config)],
+        stdout=subprocess.PIPE, env=env,
+    )
+    try:
+        line = proc.stdout.readline().decode()
+        assert line.startswith("serving on http://127.0.0.1:") and "(2 workers)" in line
+        port = int(line.split()[2].rsplit(":", 1)[1])
+
+        async def connect(opener, *args):
+            for _ in range(100):  # workers bind their SO_REUSEPORT sockets after the banner
+                try:
+                    return await opener(*args)
+                except ConnectionRefusedError:
+                    await asyncio.sleep(0.05)
+            raise AssertionError("server did not start")
+
+        async def main():
+            pids = set()
+            for opener, args in [(asyncio.open_connection, ("127.0.0.1", port)),
+                                 (asyncio.open_unix_connection, (sock_path,))] * 4:
+                reader, writer = await connect(opener, *args)
+                writer.write(request("GET", "/health") + request("POST", "/run/LCM", {"params": {"a": 3, "b": 5}}))
+                pids.add((await read_response(reader))[2]["pid"])
+                assert (await read_response(reader))[2]["data"]["lcm"] == 15
+                writer.close()
+            return pids
+
+        pids = run(main())
+        assert proc.pid not in pids
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        assert proc.wait(10) == 0
+    assert not os.path.exists(sock_path)
@@ -1 +1,36 @@
-from .base import ElementalFunction, FunctionCharacteristics
+"""Elemental functions: small, configurable units of business logic.
+
+Public names are resolved lazily (PEP 562), so `import elementals` does not pull in
+pydantic or the function machinery until one of them is first used.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .base import ElementalFunction, FunctionCharacteristics
+    from .params import ElementalParams, Meta
+    from .responses import ElementalResponse
+
+_LAZY = {
+    "ElementalFunction": ".base",
+    "FunctionCharacteristics": ".base",
+    "ElementalParams": ".params",
+    "Meta": ".params",
+    "ElementalResponse": ".responses",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(list(globals()) + __all__)
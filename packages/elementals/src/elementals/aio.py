@@ -0,0 +1,73 @@
+"""Asyncio runtime for elemental functions.
+
+Native-async functions (those overriding `arun`) are awaited directly on the event
+loop, so thousands of IO-bound calls can be in flight per worker. Every other
+function, including one configured `sync: async` that only implements `run`, is
+pushed to a bounded thread pool so it never blocks the loop; a per-loop semaphore
+caps how many calls may queue for that pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from .base import ElementalFunction
+from .params import ElementalParams
+
+
+def is_native_async(fn: ElementalFunction[Any]) -> bool:
+    """True if `fn` overrides arun() and can be awaited directly instead of offloaded.
+
+    `sync: async` alone is not enough: the inherited arun() would hand run_dict() to
+    the loop's default executor, bypassing the bounded pool and its semaphore.
+    """
+    return type(fn).arun is not ElementalFunction.arun
+
+
+class AsyncExecutor:
+    """Await native-async functions, offload sync ones to a bounded thread pool.
+
+    - max_workers: threads for sync functions (default min(32, cpu_count + 4))
+    - max_pending: sync calls allowed in flight per event loop (default 4 * max_workers);
+      further callers wait on the loop instead of growing the pool's queue
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, *, max_pending: Optional[int] = None):
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.max_pending = max_pending or self.max_workers * 4
+        self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix="elementals-aio")
+        self._limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _limit(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        sem = self._limits.get(loop)
+        if sem is None:
+            sem = self._limits[loop] = asyncio.Semaphore(self.max_pending)
+        return sem
+
+    async def run(self, fn: ElementalFunction[Any], params: ElementalParams) -> Dict[str, Any]:
+        """Run `fn` without blocking the event loop and return its response dict."""
+        if is_native_async(fn):
+            return await fn.arun(params)
+        loop = asyncio.get_running_loop()
+        async with self._limit(loop):
+            return await loop.run_in_executor(self._pool, fn.run_dict, params)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+
+_default: Optional[AsyncExecutor] = None
+
+
+def get_executor() -> AsyncExecutor:
+    """Return the process-wide AsyncExecutor."""
+    global _default
+    if _default is None:
+        _default = AsyncExecutor()
+    return _default
@@ -1,9 +1,13 @@
+import asyncio
 from dataclasses import dataclass
-from typing import Any, Dict, Generic, Type, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
 from pydantic import BaseModel
+from . import instrument, serialize
+from .batch import BatchInput, BatchView
+from .cache import ResultCache
 from .enums import RoleInProcess, SyncType, ResourceType, DurationClass
-from .params import ElementalParams
-from .responses import ElementalResponse
+from .params import ElementalParams, Meta
+from .responses import CompactResponse, ElementalResponse, compact_responses
 
 TOut = TypeVar("TOut")
 
@@ -20,10 +24,20 @@ class ElementalFunction(Generic[TOut]):
     """Base class for all elemental functions."""
     characteristics: FunctionCharacteristics
     ResponseModel: Type[ElementalResponse[TOut]] = ElementalResponse
+    cache: Optional[ResultCache] = None
 
     def __init__(self, characteristics: FunctionCharacteristics):
         self.characteristics = characteristics
 
+    def enable_cache(self, cache: ResultCache) -> ResultCache:
+        """Memoize run() on this instance through `cache`; only for functions pure in `params`."""
+        if self.cache is not None:
+            raise RuntimeError(f"{self.characteristics.name}: result cache already enabled")
+        self.cache = cache
+        # the instance attribute shadows run() on purpose; wrap() keeps its signature
+        self.run = cache.wrap(self.run)  # type: ignore[assignment]
+        return cache
+
     def run(self, params: ElementalParams) -> Dict[str, Any]:
         """Override in subclasses to return a plain dict in ElementalResponse shape."""
         raise NotImplementedError("Subclasses must implement `run` to return a dict.")
@@ -33,11 +47,49 @@ class ElementalFunction(Generic[TOut]):
 
         This preserves the existing run() contract while providing a standardized
         dict payload that callers can serialize or inspect without Pydantic models.
+        When instrumentation hooks are registered, the call is timed as a "run_dict" span.
         """
-        result = self.run(params)
+        if instrument.hooks:
+            with instrument.span("run_dict", **instrument.function_tags(self.characteristics)):
+                result = self.run(params)
+        else:
+            result = self.run(params)
         # If a Pydantic model is returned by legacy implementations, convert to dict.
         if isinstance(result, BaseModel):
             return result.model_dump()
-        if isinstance(result, dict):
+        if isinstance(result, (dict, CompactResponse)):
             return result
         raise TypeError(f"run() must return a dict, got: {type(result)!r}")
+
+    def run_bytes(self, params: ElementalParams) -> bytes:
+        """Execute and return the response as compact JSON bytes (elementals.serialize).
+
+        Responses built with success_response()/error_response() are CompactResponse
+        objects for this call, so they are encoded without an intermediate dict.
+        Functions that can write their JSON directly override this.
+        """
+        with compact_responses():
+            result = self.run_dict(params)
+        return serialize.dumps(result)
+
+    async def arun(self, params: ElementalParams) -> Dict[str, Any]:
+        """Coroutine form of run_dict(); native-async functions override this.
+
+        Functions that override arun() are awaited directly by
+        elementals.aio.AsyncExecutor; the others go through its bounded thread pool.
+        A declared `sync: async` does not change that: without an arun() override there
+        is nothing to await, only run(). This default keeps the loop free by running
+        run_dict() in the loop's default executor.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.run_dict, params)
+
+    def run_batch(self, batch: BatchInput, *, meta: Optional[Meta] = None) -> List[Dict[str, Any]]:
+        """Run over many inputs, returning one response dict per row, in order.
+
+        `batch` is a sequence of ElementalParams or a columnar mapping such as
+        {"a": [...], "b": [...]}; `meta` is attached to every columnar row. This default
+        loops over run(); numeric functions override it with vectorized kernels but must
+        return exactly what run() would for each row.
+        """
+        return [self.run(p) for p in BatchView(batch, meta=meta).iter_params()]
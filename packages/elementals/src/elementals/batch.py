@@ -0,0 +1,106 @@
+"""Helpers for running an ElementalFunction over many inputs at once.
+
+A batch is either a sequence of ElementalParams (row form) or a mapping of
+parameter name -> equal-length sequence/array (columnar form, e.g. {"a": [...],
+"b": [...]}). NumPy is optional: kernels check `numpy_or_none()` and fall back
+to pure Python when it is not installed.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Union
+
+from .params import ElementalParams, Meta
+from .responses import meta_dump
+
+_UNLOADED: Any = object()
+# numpy module (None if not installed); imported on first numpy_or_none() call so that
+# importing elementals stays cheap. Tests set it to None to force the Python kernels.
+np: Any = _UNLOADED
+
+BatchInput = Union[Sequence[ElementalParams], Mapping[str, Sequence[Any]]]
+
+# Below this many rows the NumPy round trip costs more than a Python loop.
+VECTOR_MIN_ROWS = 32
+# Integers are only vectorized inside this bound so int64 results cannot overflow.
+INT_BOUND = 2**31
+
+
+def numpy_or_none() -> Any:
+    """Return the numpy module if available, else None (imported on first call)."""
+    global np
+    if np is _UNLOADED:
+        try:  # optional dependency, see the `numpy` extra
+            import numpy
+
+            np = numpy
+        except ImportError:  # pragma: no cover - exercised only without numpy
+            np = None
+    return np
+
+
+def is_small_int(value: Any) -> bool:
+    """True for plain ints (not bools) whose products fit in int64."""
+    return type(value) is int and -INT_BOUND < value < INT_BOUND
+
+
+def _as_list(values: Any) -> List[Any]:
+    tolist = getattr(values, "tolist", None)
+    if tolist is not None:  # numpy arrays (or array.array): python scalars, like row inputs
+        return tolist()
+    return list(values)
+
+
+class BatchView:
+    """Uniform row/column access over a batch input.
+
+    - `column(name)` returns a list with one value per row (None where absent)
+    - `params(i)` returns the ElementalParams for row i (built lazily for columnar input)
+    - `meta(i)` returns the serialized meta for row i's response
+    """
+
+    def __init__(self, batch: BatchInput, *, meta: Optional[Meta] = None):
+        self._rows: Optional[List[ElementalParams]] = None
+        self._columns: Dict[str, List[Any]] = {}
+        self._meta = meta
+        if isinstance(batch, Mapping):
+            self._columns = {name: _as_list(values) for name, values in batch.items()}
+            lengths = {len(values) for values in self._columns.values()}
+            if len(lengths) > 1:
+                raise ValueError("All columns in a columnar batch must have the same length")
+            self.size = lengths.pop() if lengths else 0
+        else:
+            self._rows = list(batch)
+            self.size = len(self._rows)
+
+    @property
+    def columnar(self) -> bool:
+        return self._rows is None
+
+    def column(self, name: str) -> List[Any]:
+        if self._rows is not None:
+            return [p.params.get(name) for p in self._rows]
+        values = self._columns.get(name)
+        return values if values is not None else [None] * self.size
+
+    def params(self, i: int) -> ElementalParams:
+        if self._rows is not None:
+            return self._rows[i]
+        row = {name: values[i] for name, values in self._columns.items()}
+        return ElementalParams(params=row, meta=self._meta)
+
+    def iter_params(self) -> Iterator[ElementalParams]:
+        for i in range(self.size):
+            yield self.params(i)
+
+    def meta(self, i: int) -> Optional[Dict[str, Any]]:
+        if self._rows is not None:
+            return meta_dump(self._rows[i].meta)
+        return meta_dump(self._meta)
+
+    def complete(self, results: List[Any], run: Callable[[ElementalParams], Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fill rows a vectorized kernel left as None by calling `run` on them."""
+        for i, result in enumerate(results):
+            if result is None:
+                results[i] = run(self.params(i))
+        return results
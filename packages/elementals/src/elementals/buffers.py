@@ -0,0 +1,158 @@
+"""Zero-copy binary payloads and text/byte ropes.
+
+Large strings and blobs travel through `ElementalParams.params` by reference. Values of
+a Dict[str, Any] are not copied by validation, by resolve_path or by the response
+builders, so a `bytes`, `bytearray`, `memoryview` or mmap-backed buffer that goes in
+comes out as the same object. This module adds the pieces around that:
+
+- `Buffer`: an annotated type for Pydantic models that accepts those buffer objects
+  as-is and dumps them as base64 in JSON mode
+- `map_file(path)`: a read-only, mmap-backed memoryview of a file
+- `Rope`: an immutable chain of text or byte segments that is only joined on demand
+  (`str()`, `tobytes()`), or written out segment by segment with `write_to()`
+"""
+
+from __future__ import annotations
+
+import base64
+import mmap
+from typing import IO, Annotated, Any, Iterable, Iterator, List, Tuple, TypeGuard, Union
+
+BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+BufferLike = Union[bytes, bytearray, memoryview, mmap.mmap]
+Segment = Union[str, BufferLike]
+
+
+def is_buffer(value: Any) -> TypeGuard[BufferLike]:
+    return isinstance(value, BUFFER_TYPES)
+
+
+def as_memoryview(value: BufferLike) -> memoryview:
+    """A memoryview over `value` without copying (returns memoryviews unchanged)."""
+    return value if isinstance(value, memoryview) else memoryview(value)
+
+
+def b64(value: BufferLike) -> str:
+    """Base64 text of a buffer, as used for JSON output."""
+    return base64.b64encode(value).decode("ascii")
+
+
+def map_file(path: str) -> memoryview:
+    """Read-only memoryview of the file at `path`, backed by mmap (pages load on access)."""
+    with open(path, "rb") as f:
+        try:
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except ValueError:  # empty files cannot be mapped
+            return memoryview(b"")
+
+
+class _BufferSchema:
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> Any:
+        from pydantic_core import core_schema
+
+        return core_schema.is_instance_schema(
+            BUFFER_TYPES,
+            serialization=core_schema.plain_serializer_function_ser_schema(b64, when_used="json"),
+        )
+
+
+# Pydantic field type: buffer objects pass through validation and model_dump() uncopied.
+Buffer = Annotated[Any, _BufferSchema]
+
+
+def _seg_len(segment: Segment) -> int:
+    return segment.nbytes if isinstance(segment, memoryview) else len(segment)
+
+
+def _byte_len(segment: Segment) -> int:
+    # len() of a mixed rope must match tobytes(): count text segments encoded
+    return len(segment.encode("utf-8")) if isinstance(segment, str) else _seg_len(segment)
+
+
+class Rope:
+    """Immutable chain of text or byte segments; nothing is concatenated until asked.
+
+    Nested ropes are flattened and empty segments dropped. A rope is text if every
+    segment is a str. `len()` counts characters for text ropes and bytes otherwise, with
+    text segments counted as UTF-8, so it equals `len(rope.tobytes())`.
+    """
+
+    __slots__ = ("parts",)
+
+    def __init__(self, parts: Iterable[Union[Segment, "Rope"]] = ()) -> None:
+        flat: List[Segment] = []
+        for part in parts:
+            if isinstance(part, Rope):
+                flat.extend(part.parts)
+            elif isinstance(part, str) or is_buffer(part):
+                if _seg_len(part):
+                    flat.append(part)
+            else:
+                kind = type(part).__name__
+                raise TypeError(f"Rope segments must be str or bytes-like, got {kind}")
+        self.parts: Tuple[Segment, ...] = tuple(flat)
+
+    @property
+    def is_text(self) -> bool:
+        return all(isinstance(p, str) for p in self.parts)
+
+    def __iter__(self) -> Iterator[Segment]:
+        return iter(self.parts)
+
+    def __len__(self) -> int:
+        if self.is_text:
+            return sum(_seg_len(p) for p in self.parts)
+        return sum(_byte_len(p) for p in self.parts)
+
+    def __add__(self, other: Union[Segment, "Rope"]) -> "Rope":
+        return Rope((self, other))
+
+    def __radd__(self, other: Segment) -> "Rope":
+        return Rope((other, self))
+
+    def __str__(self) -> str:
+        return self.text()
+
+    def __repr__(self) -> str:
+        return f"Rope({len(self.parts)} parts, len={len(self)})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Rope):
+            other = other.text() if other.is_text else other.tobytes()
+        if isinstance(other, str):
+            return self.is_text and self.text() == other
+        if is_buffer(other):
+            return self.tobytes() == bytes(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def text(self, encoding: str = "utf-8") -> str:
+        """Join into one str (byte segments are decoded)."""
+        return "".join(p if isinstance(p, str) else str(p, encoding) for p in self.parts)
+
+    def tobytes(self, encoding: str = "utf-8") -> bytes:
+        """Join into one bytes object (text segments are encoded)."""
+        return b"".join(p.encode(encoding) if isinstance(p, str) else p for p in self.parts)
+
+    def write_to(self, fp: IO[bytes], encoding: str = "utf-8") -> int:
+        """Write every segment to the binary file `fp` in order; returns bytes written."""
+        written = 0
+        for p in self.parts:
+            data = p.encode(encoding) if isinstance(p, str) else p
+            fp.write(data)
+            written += _seg_len(data)
+        return written
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> Any:
+        from pydantic_core import core_schema
+
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda r: r.text() if r.is_text else b64(r.tobytes()), when_used="json",
+            ),
+        )
@@ -0,0 +1,147 @@
+"""Opt-in result memoization for pure elemental functions.
+
+A function whose response depends only on `params` (Multiply, LCM, Concat) can be
+declared pure in configFunctions.yaml:
+
+  Multiply:
+    ...
+    pure: true
+    cache_max_size: 4096   # entries, LRU-evicted (default 1024)
+    cache_ttl: 60          # seconds; omit for no expiry
+    cache_keys: [a, b]     # params keys that make up the key (default: all)
+
+The key is a blake2b hash of the canonical JSON of the selected params; `meta`,
+`savepoint` and the other ElementalParams fields are not part of it. The cache keeps a
+private deep copy of each response, and every hit gets its own copy with the caller's
+meta, so callers may mutate what they receive. Params that are not JSON-serializable
+bypass the cache.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+from .params import ElementalParams
+from .responses import meta_dump
+
+DEFAULT_MAX_SIZE = 1024
+
+Run = Callable[[ElementalParams], Dict[str, Any]]
+
+
+def cache_key(params: Mapping[str, Any], keys: Optional[Sequence[str]] = None) -> Optional[bytes]:
+    """Canonical hash of `params` (restricted to `keys`), or None if it cannot be encoded."""
+    if keys is not None:
+        params = {k: params.get(k) for k in keys}
+    try:
+        text = json.dumps(params, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _own(stored: Dict[str, Any], params: ElementalParams) -> Dict[str, Any]:
+    """A caller-owned response from a stored entry, carrying the caller's meta."""
+    out = copy.deepcopy(stored)
+    out["meta"] = meta_dump(params.meta)
+    return out
+
+
+class ResultCache:
+    """Thread-safe, size-bounded LRU cache of response dicts with an optional TTL."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl: Optional[float] = None,
+                 keys: Optional[Sequence[str]] = None):
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.keys = tuple(keys) if keys is not None else None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if not expires or expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: bytes, value: Dict[str, Any]) -> None:
+        expires = time.monotonic() + self.ttl if self.ttl else 0.0
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters snapshot: hits, misses, evictions, size and max_size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+    def wrap(self, run: Run) -> Run:
+        """Return `run` memoized on params; hits carry the caller's meta."""
+        keys = self.keys
+
+        def cached_run(params: ElementalParams) -> Dict[str, Any]:
+            key = cache_key(params.params, keys)
+            if key is None:
+                return run(params)
+            hit = self.get(key)
+            if hit is not None:
+                return _own(hit, params)
+            result = run(params)
+            if isinstance(result, Mapping):
+                # stored without meta and detached from the response handed back
+                try:
+                    stored = copy.deepcopy({k: v for k, v in result.items() if k != "meta"})
+                except TypeError:  # e.g. memoryview data: not copyable, so not cached
+                    return result
+                self.put(key, stored)
+            return result
+
+        cached_run.__wrapped__ = run  # type: ignore[attr-defined]
+        return cached_run
+
+
+def cache_from_config(entry: Mapping[str, Any]) -> Optional[ResultCache]:
+    """Build the ResultCache declared by a configFunctions.yaml entry, or None if not pure."""
+    if not entry.get("pure"):
+        return None
+    keys = entry.get("cache_keys")
+    return ResultCache(
+        max_size=int(entry.get("cache_max_size") or DEFAULT_MAX_SIZE),
+        ttl=float(entry["cache_ttl"]) if entry.get("cache_ttl") else None,
+        keys=list(keys) if keys is not None else None,
+    )
@@ -0,0 +1,175 @@
+"""Command line runner for configured elemental functions.
+
+  elementals run --stream [--input FILE] [--output FILE]
+
+reads newline-delimited records such as
+  {"function": "Multiply", "params": {"a": 2, "b": 3}, "savepoint": {}}
+and writes one run_dict() result per line. Records flow through generators and
+a buffered writer, so memory stays bounded however large the input is; when the
+consumer stops reading, the blocked write stops the reader too (backpressure).
+Without --stream the input is a single JSON record or a list of records.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from . import serialize
+
+WRITE_BUFFER = 1 << 20
+RECORD_FIELDS = ("params", "savepoint", "process", "environment", "meta")
+
+
+def encode(result: Dict[str, Any]) -> bytes:
+    """Encode one result as a compact JSON line."""
+    return serialize.dumps(result) + b"\n"
+
+
+def record_error(code: str, message: str, line: Optional[int] = None) -> Dict[str, Any]:
+    """Error response for a record that could not run (`line` goes into details)."""
+    error: Dict[str, Any] = {"code": code, "message": message}
+    if line is not None:
+        error["details"] = {"line": line}
+    return {"status": "error", "error": error, "data": None, "meta": None}
+
+
+def iter_records(lines: Iterable[bytes]) -> Iterator[Tuple[int, Any]]:
+    """Yield (line_number, record or parse error message) for each non-blank line."""
+    for n, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            yield n, json.loads(line)
+        except ValueError as e:
+            yield n, e
+
+
+class RecordError(ValueError):
+    """A record that cannot be run; `code` is the error code for its response."""
+
+    def __init__(self, code: str, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+def prepare_record(record: Any, *, name: Optional[str] = None, dispatcher: Any = None) -> Tuple[Any, Any]:
+    """(warm function, ElementalParams) for a record such as {"function": ..., "params": ...}.
+
+    `name` overrides the record's "function"; `dispatcher` defaults to the shared one.
+    Raises RecordError with code invalid_record, unknown_function or invalid_params.
+    Shared by this CLI and configfuncs.server.
+    """
+    from configfuncs.dispatch import get_dispatcher  # lazy import to avoid cycles
+    from .params import ElementalParams
+
+    name = name or (record.get("function") if isinstance(record, dict) else None)
+    if not isinstance(record, dict) or not isinstance(name, str):
+        raise RecordError("invalid_record", "Each record must be an object with a 'function' name.")
+    try:
+        fn = (dispatcher or get_dispatcher()).instance(name)
+    except KeyError as e:
+        raise RecordError("unknown_function", str(e.args[0] if e.args else e)) from None
+    try:
+        ep = ElementalParams(**{k: record[k] for k in RECORD_FIELDS if record.get(k) is not None})
+    except ValidationError as e:
+        raise RecordError("invalid_params", str(e)) from None
+    return fn, ep
+
+
+def _prepare(record: Any, line: int) -> Any:
+    """(function, ElementalParams) for a record, or an error response dict."""
+    if isinstance(record, Exception):
+        return record_error("invalid_record", f"Invalid JSON: {record}", line)
+    try:
+        return prepare_record(record)
+    except RecordError as e:
+        return record_error(e.code, str(e), line)
+
+
+def run_record(record: Any, line: int = 0) -> Dict[str, Any]:
+    """Run one record through the shared dispatcher, returning a response dict."""
+    prepared = _prepare(record, line)
+    if isinstance(prepared, dict):
+        return prepared
+    fn, ep = prepared
+    try:
+        return fn.run_dict(ep)
+    except Exception as e:  # one failing record must not end a long replay
+        return record_error("exception", str(e), line)
+
+
+def run_record_bytes(record: Any, line: int = 0) -> bytes:
+    """Like run_record(), but returns the encoded JSON line (via run_bytes())."""
+    prepared = _prepare(record, line)
+    if isinstance(prepared, dict):
+        return encode(prepared)
+    fn, ep = prepared
+    try:
+        return fn.run_bytes(ep) + b"\n"
+    except Exception as e:
+        return encode(record_error("exception", str(e), line))
+
+
+def run_stream(lines: Iterable[bytes], out: IO[bytes], *, flush_every: int = 0) -> int:
+    """Run every NDJSON record in `lines`, writing results to `out`. Returns the record count."""
+    count = 0
+    for line, record in iter_records(lines):
+        out.write(run_record_bytes(record, line))
+        count += 1
+        if flush_every and count % flush_every == 0:
+            out.flush()
+    out.flush()
+    return count
+
+
+def _run_document(inp: IO[bytes], out: IO[bytes]) -> int:
+    doc = json.loads(inp.read() or b"null")
+    records: List[Any] = doc if isinstance(doc, list) else [doc]
+    results = [run_record(r, i) for i, r in enumerate(records, 1)]
+    payload = results if isinstance(doc, list) else results[0]
+    out.write(json.dumps(payload, default=serialize.default, indent=2).encode("utf-8") + b"\n")
+    out.flush()
+    return len(results)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(prog="elementals", description="Run configured elemental functions")
+    sub = p.add_subparsers(dest="command", required=True)
+    run = sub.add_parser("run", help="Run function records from a file or stdin")
+    run.add_argument("--stream", action="store_true", help="Read/write newline-delimited JSON records")
+    run.add_argument("--input", default="-", help="Input file (default: stdin)")
+    run.add_argument("--output", default="-", help="Output file (default: stdout)")
+    run.add_argument("--flush-every", type=int, default=0,
+                     help="Flush output every N records (default: only when the buffer fills)")
+    args = p.parse_args(argv)
+
+    inp = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    out = (
+        open(sys.stdout.fileno(), "wb", buffering=WRITE_BUFFER, closefd=False)
+        if args.output == "-" else open(args.output, "wb", buffering=WRITE_BUFFER)
+    )
+    try:
+        if args.stream:
+            run_stream(inp, out, flush_every=args.flush_every)
+        else:
+            _run_document(inp, out)
+    except BrokenPipeError:
+        # consumer went away (e.g. `| head`); nothing left to write to
+        return 1
+    finally:
+        if inp is not sys.stdin.buffer:
+            inp.close()
+        try:
+            out.close()
+        except BrokenPipeError:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
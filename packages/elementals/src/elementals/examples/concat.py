@@ -1,42 +1,31 @@
 from typing import Any, Dict
-from ..base import ElementalFunction, FunctionCharacteristics
-from ..enums import RoleInProcess, SyncType, ResourceType, DurationClass
+from ..base import ElementalFunction
+from ..buffers import Rope, is_buffer
 from ..params import ElementalParams
-from configfuncs.loader import load_config
+from ..responses import error_response, success_response
+from configfuncs.loader import get_characteristics
+
+
+def _is_blob(value: Any) -> bool:
+    return is_buffer(value) or isinstance(value, Rope)
+
+
+def _segment(value: Any) -> Any:
+    return value if isinstance(value, str) or _is_blob(value) else str(value)
 
 
 class ConcatFunction(ElementalFunction[Dict[str, Any]]):
     def __init__(self):
-        cfg = load_config().get("Concat", {})
-        name = cfg.get("name", "Concat")
-        desc = cfg.get("description", "Receives two texts and returns them along with their concatenation.")
-        role = RoleInProcess(cfg.get("role", RoleInProcess.BUSINESS_ACTION.value))
-        sync = SyncType(cfg.get("sync", SyncType.SYNC.value))
-        resource = ResourceType(cfg.get("resource_type", ResourceType.CPU.value))
-        duration = DurationClass(cfg.get("duration", DurationClass.SHORT.value))
-
-        super().__init__(FunctionCharacteristics(
-            name=name,
-            description=desc,
-            role=role,
-            sync=sync,
-            resource_type=resource,
-            duration=duration,
-        ))
+        super().__init__(get_characteristics("Concat", description="Receives two texts and returns them along with their concatenation."))
 
     def run(self, params: ElementalParams) -> Dict[str, Any]:
         t1 = params.params.get("text1")
         t2 = params.params.get("text2")
         if t1 is None or t2 is None:
-            return {
-                "status": "error",
-                "error": {"code": "missing_param", "message": "Both 'text1' and 'text2' must be provided."},
-                "data": None,
-                "meta": (params.meta.model_dump() if params.meta else None),
-            }
-        concat = f"{t1}{t2}"
-        return {
-            "status": "success",
-            "data": {"text1": t1, "text2": t2, "concat": concat},
-            "meta": (params.meta.model_dump() if params.meta else None),
-        }
+            return error_response(params, "missing_param", "Both 'text1' and 'text2' must be provided.")
+        if params.params.get("rope") or _is_blob(t1) or _is_blob(t2):
+            # rope mode: chain the inputs instead of copying them into a new string
+            concat: Any = Rope((_segment(t1), _segment(t2)))
+        else:
+            concat = f"{t1}{t2}"
+        return success_response(params, {"text1": t1, "text2": t2, "concat": concat})
@@ -1,35 +1,20 @@
 from typing import Any, Dict
-from ..base import ElementalFunction, FunctionCharacteristics
-from ..enums import RoleInProcess, SyncType, ResourceType, DurationClass
+from ..base import ElementalFunction
 from ..params import ElementalParams
-from ..responses import ElementalResponse
-from configfuncs.loader import load_config
+from ..responses import ElementalResponse, success_response
+from ..savepoint import savepoint_diff
+from configfuncs.loader import get_characteristics
 
 class EchoFunction(ElementalFunction[Dict[str, Any]]):
     def __init__(self):
-        cfg = load_config().get("Echo", {})
-        name = cfg.get("name", "Echo")
-        desc = cfg.get("description", "Echoes input parameters.")
-        role = RoleInProcess(cfg.get("role", RoleInProcess.BUSINESS_ACTION.value))
-        sync = SyncType(cfg.get("sync", SyncType.SYNC.value))
-        resource = ResourceType(cfg.get("resource_type", ResourceType.CPU.value))
-        duration = DurationClass(cfg.get("duration", DurationClass.SHORT.value))
-
-        super().__init__(FunctionCharacteristics(
-            name=name,
-            description=desc,
-            role=role,
-            sync=sync,
-            resource_type=resource,
-            duration=duration,
-        ))
+        super().__init__(get_characteristics("Echo", description="Echoes input parameters."))
 
     def run(self, params: ElementalParams) -> Dict[str, Any]:
-        return {
-            "status": "success",
-            "data": {"echo": params.params, "savepoint": params.savepoint},
-            "meta": (params.meta.model_dump() if params.meta else None),
-        }
+        diff = savepoint_diff(params.savepoint)
+        if diff is not None:
+            # layered savepoint: echo only the changes, not the whole (possibly huge) view
+            return success_response(params, {"echo": params.params, "savepoint_diff": diff})
+        return success_response(params, {"echo": params.params, "savepoint": params.savepoint})
 
 if __name__ == "__main__":
     fn = EchoFunction()
@@ -1,49 +1,45 @@
-from typing import Any, Dict
-from ..base import ElementalFunction, FunctionCharacteristics
-from ..enums import RoleInProcess, SyncType, ResourceType, DurationClass
-from ..params import ElementalParams
-from configfuncs.loader import load_config
+from typing import Any, Dict, List, Optional
+from ..base import ElementalFunction
+from ..batch import VECTOR_MIN_ROWS, BatchInput, BatchView, is_small_int, numpy_or_none
+from ..params import ElementalParams, Meta
+from ..responses import error_response, success_response
+from configfuncs.loader import get_characteristics
 import math
 
+def _lcm(a: List[int], b: List[int]) -> List[int]:
+    """Element-wise lcm over small, not-both-zero int columns."""
+    np = numpy_or_none()
+    if np is None or len(a) < VECTOR_MIN_ROWS:
+        return [abs(x * y) // math.gcd(x, y) for x, y in zip(a, b)]
+    return np.lcm(np.array(a, dtype=np.int64), np.array(b, dtype=np.int64)).tolist()
+
+
 class LCMFunction(ElementalFunction[Dict[str, Any]]):
     def __init__(self):
-        cfg = load_config().get("LCM", {})
-        name = cfg.get("name", "LCM")
-        desc = cfg.get("description", "Calculate the least common multiple of two numbers")
-        role = RoleInProcess(cfg.get("role", RoleInProcess.BUSINESS_ACTION.value))
-        sync = SyncType(cfg.get("sync", SyncType.SYNC.value))
-        resource = ResourceType(cfg.get("resource_type", ResourceType.CPU.value))
-        duration = DurationClass(cfg.get("duration", DurationClass.SHORT.value))
-        super().__init__(FunctionCharacteristics(
-            name=name,
-            description=desc,
-            role=role,
-            sync=sync,
-            resource_type=resource,
-            duration=duration,
-        ))
+        super().__init__(get_characteristics("LCM", description="Calculate the least common multiple of two numbers"))
 
     def run(self, params: ElementalParams) -> Dict[str, Any]:
         a = params.params.get("a")
         b = params.params.get("b")
         if a is None or b is None:
-            return {
-                "status": "error",
-                "error": {"code": "missing_param", "message": "Parameters 'a' and 'b' are required."},
-                "data": None,
-                "meta": (params.meta.model_dump() if params.meta else None),
-            }
+            return error_response(params, "missing_param", "Parameters 'a' and 'b' are required.")
         try:
             lcm = abs(a * b) // math.gcd(a, b)
-            return {
-                "status": "success",
-                "data": {"lcm": lcm},
-                "meta": (params.meta.model_dump() if params.meta else None),
-            }
+            return success_response(params, {"lcm": lcm})
         except Exception as e:
-            return {
-                "status": "error",
-                "error": {"code": "exception", "message": str(e)},
-                "data": None,
-                "meta": (params.meta.model_dump() if params.meta else None),
-            }
+            return error_response(params, "exception", str(e))
+
+    def run_batch(self, batch: BatchInput, *, meta: Optional[Meta] = None) -> List[Dict[str, Any]]:
+        """Vectorized run() for small int rows; other rows (including lcm(0, 0),
+        which run() reports as an exception) fall back to run().
+        """
+        view = BatchView(batch, meta=meta)
+        a_col, b_col = view.column("a"), view.column("b")
+        rows = [
+            i for i, (a, b) in enumerate(zip(a_col, b_col))
+            if is_small_int(a) and is_small_int(b) and (a or b)
+        ]
+        results: List[Any] = [None] * view.size
+        for i, lcm in zip(rows, _lcm([a_col[i] for i in rows], [b_col[i] for i in rows])):
+            results[i] = {"status": "success", "data": {"lcm": lcm}, "meta": view.meta(i)}
+        return view.complete(results, self.run)
@@ -1,42 +1,56 @@
-from typing import Any, Dict
-from ..base import ElementalFunction, FunctionCharacteristics
-from ..enums import RoleInProcess, SyncType, ResourceType, DurationClass
-from ..params import ElementalParams
-from configfuncs.loader import load_config
+from typing import Any, Dict, List, Optional
+from ..base import ElementalFunction
+from ..batch import VECTOR_MIN_ROWS, BatchInput, BatchView, is_small_int, numpy_or_none
+from ..params import ElementalParams, Meta
+from ..responses import error_response, success_response
+from configfuncs.loader import get_characteristics
+
+def _multiply(a: List[Any], b: List[Any]) -> List[Any]:
+    """Element-wise a*b over same-typed columns (all small ints or all floats)."""
+    np = numpy_or_none()
+    if np is None or len(a) < VECTOR_MIN_ROWS:
+        return [x * y for x, y in zip(a, b)]
+    dtype = np.int64 if type(a[0]) is int else np.float64
+    # float overflow gives inf/nan silently in Python; numpy would warn per batch
+    with np.errstate(over="ignore", invalid="ignore"):
+        return np.multiply(np.array(a, dtype=dtype), np.array(b, dtype=dtype)).tolist()
+
 
 class MultiplyFunction(ElementalFunction[Dict[str, Any]]):
     def __init__(self):
-        cfg = load_config().get("Multiply", {})
-        # Map YAML values to enum instances with sensible defaults
-        name = cfg.get("name", "Multiply")
-        desc = cfg.get("description", "Receives two numbers and returns them along with their multiplication.")
-        role = RoleInProcess(cfg.get("role", RoleInProcess.BUSINESS_ACTION.value))
-        sync = SyncType(cfg.get("sync", SyncType.SYNC.value))
-        resource = ResourceType(cfg.get("resource_type", ResourceType.CPU.value))
-        duration = DurationClass(cfg.get("duration", DurationClass.SHORT.value))
-
-        super().__init__(FunctionCharacteristics(
-            name=name,
-            description=desc,
-            role=role,
-            sync=sync,
-            resource_type=resource,
-            duration=duration,
-        ))
+        super().__init__(get_characteristics("Multiply", description="Receives two numbers and returns them along with their multiplication."))
 
     def run(self, params: ElementalParams) -> Dict[str, Any]:
         a = params.params.get("a")
         b = params.params.get("b")
         if a is None or b is None:
-            return {
-                "status": "error",
-                "error": {"code": "missing_param", "message": "Both 'a' and 'b' must be provided."},
-                "data": None,
-                "meta": (params.meta.model_dump() if params.meta else None),
-            }
+            return error_response(params, "missing_param", "Both 'a' and 'b' must be provided.")
         result = a * b
-        return {
-            "status": "success",
-            "data": {"a": a, "b": b, "product": result},
-            "meta": (params.meta.model_dump() if params.meta else None),
-        }
+        return success_response(params, {"a": a, "b": b, "product": result})
+
+    def run_batch(self, batch: BatchInput, *, meta: Optional[Meta] = None) -> List[Dict[str, Any]]:
+        """Vectorized run(): int*int and float*float rows each go through one kernel call.
+
+        Any other row (missing or mixed-type operands, big ints, ...) falls back to run().
+        Vectorized rows bypass a result cache installed by enable_cache(); only the
+        fallback rows are looked up and stored.
+        """
+        view = BatchView(batch, meta=meta)
+        a_col, b_col = view.column("a"), view.column("b")
+        ints: List[int] = []
+        floats: List[int] = []
+        for i, (a, b) in enumerate(zip(a_col, b_col)):
+            if is_small_int(a) and is_small_int(b):
+                ints.append(i)
+            elif type(a) is float and type(b) is float:
+                floats.append(i)
+        results: List[Any] = [None] * view.size
+        for rows in (ints, floats):
+            products = _multiply([a_col[i] for i in rows], [b_col[i] for i in rows])
+            for i, product in zip(rows, products):
+                results[i] = {
+                    "status": "success",
+                    "data": {"a": a_col[i], "b": b_col[i], "product": product},
+                    "meta": view.meta(i),
+                }
+        return view.complete(results, self.run)
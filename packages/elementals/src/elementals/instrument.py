@@ -0,0 +1,174 @@
+"""Pluggable per-stage timing for the elementals hot paths.
+
+Instrumented stages: "run_dict" (ElementalFunction.run_dict), "run_function" with its
+"config", "params" and "run" sub-stages (configfuncs.loader.run_function), "resolve_path"
+and "resolve_template" (utils.param_paths). Each stage runs inside a Span that records
+its nanosecond duration and tags; spans nest through a context variable, so a child
+inherits its parent's tags (e.g. the function name/role/resource_type of the enclosing
+run_dict) and works across threads and asyncio tasks.
+
+With no hooks registered, `hooks` is an empty tuple and the hot paths skip all of this
+after a single truthiness check. Register a Hook (e.g. HistogramExporter) to observe.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Optional, Tuple
+
+# Registered hooks; hot paths test `if instrument.hooks:` before doing any work.
+hooks: Tuple["Hook", ...] = ()
+
+_current: ContextVar[Optional["Span"]] = ContextVar("elementals_span", default=None)
+_hooks_lock = threading.Lock()
+
+
+class Hook:
+    """Base class for instrumentation hooks; override either method."""
+
+    def pre(self, span: "Span") -> None:
+        """Called when a span starts (duration_ns is not set yet)."""
+
+    def post(self, span: "Span") -> None:
+        """Called when a span ends, with duration_ns and error set."""
+
+
+class Span:
+    """One timed stage. Use via `span(stage, **tags)`."""
+
+    __slots__ = ("stage", "tags", "parent", "start_ns", "duration_ns", "error", "_token", "_hooks")
+
+    def __init__(self, stage: str, tags: Dict[str, Any]):
+        self.stage = stage
+        self.tags = tags
+        self.parent: Optional[Span] = None
+        self.start_ns = 0
+        self.duration_ns = 0
+        self.error: Optional[BaseException] = None
+        self._token: Optional[Token[Optional[Span]]] = None
+        self._hooks: Tuple[Hook, ...] = ()
+
+    def __repr__(self) -> str:
+        return f"Span({self.stage!r}, {self.tags!r}, duration_ns={self.duration_ns})"
+
+    def __enter__(self) -> "Span":
+        parent = self.parent = _current.get()
+        if parent is not None and parent.tags:
+            self.tags = {**parent.tags, **self.tags}
+        self._token = _current.set(self)
+        self._hooks = hooks
+        for hook in self._hooks:
+            hook.pre(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Optional[BaseException], tb: Any) -> None:
+        self.duration_ns = time.perf_counter_ns() - self.start_ns
+        self.error = exc
+        if self._token is not None:
+            _current.reset(self._token)
+        for hook in self._hooks:
+            hook.post(self)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NOOP = _NoopSpan()
+
+
+def span(stage: str, **tags: Any) -> Any:
+    """Context manager timing `stage`; a shared no-op when no hooks are registered."""
+    if not hooks:
+        return _NOOP
+    return Span(stage, tags)
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def function_tags(characteristics: Any) -> Dict[str, Any]:
+    """Span tags describing a function: name, role and resource_type."""
+    return {
+        "name": characteristics.name,
+        "role": characteristics.role.value,
+        "resource_type": characteristics.resource_type.value,
+    }
+
+
+def add_hook(hook: Hook) -> Hook:
+    global hooks
+    with _hooks_lock:
+        hooks = hooks + (hook,)
+    return hook
+
+
+def remove_hook(hook: Hook) -> None:
+    global hooks
+    with _hooks_lock:
+        hooks = tuple(h for h in hooks if h is not hook)
+
+
+def clear_hooks() -> None:
+    global hooks
+    with _hooks_lock:
+        hooks = ()
+
+
+class HistogramExporter(Hook):
+    """In-memory log2 histograms of span durations, keyed by (stage, function name)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+
+    def post(self, span: Span) -> None:
+        key = (span.stage, span.tags.get("name"))
+        ns = span.duration_ns
+        bucket = max(0, ns - 1).bit_length()  # durations in (2**(b-1), 2**b]
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = {
+                    "count": 0, "errors": 0, "total_ns": 0, "min_ns": ns, "max_ns": ns, "buckets": {},
+                }
+            stats["count"] += 1
+            stats["errors"] += span.error is not None
+            stats["total_ns"] += ns
+            stats["min_ns"] = min(stats["min_ns"], ns)
+            stats["max_ns"] = max(stats["max_ns"], ns)
+            stats["buckets"][bucket] = stats["buckets"].get(bucket, 0) + 1
+
+    def snapshot(self) -> Dict[Tuple[str, Optional[str]], Dict[str, Any]]:
+        """Copy of the per-(stage, name) stats; bucket b counts durations <= 2**b ns."""
+        with self._lock:
+            return {k: {**v, "buckets": dict(v["buckets"])} for k, v in self._stats.items()}
+
+    def percentile(self, stage: str, q: float, name: Optional[str] = None) -> int:
+        """Upper bound (ns) of the bucket holding the q-th percentile (0 < q <= 100)."""
+        with self._lock:
+            stats = self._stats.get((stage, name))
+            if stats is None:
+                raise KeyError((stage, name))
+            rank = math.ceil(stats["count"] * q / 100)
+            seen = 0
+            for bucket in sorted(stats["buckets"]):
+                seen += stats["buckets"][bucket]
+                if seen >= rank:
+                    return min(1 << bucket, stats["max_ns"])
+            return stats["max_ns"]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
@@ -1,12 +1,69 @@
-from typing import Any, Dict, Optional
+import copy
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union
 from datetime import datetime, timezone
 from pydantic import BaseModel, Field
+from .savepoint import LayeredSavepoint
+
+_object_setattr = object.__setattr__
 
 class Meta(BaseModel):
     call_id: Optional[str] = None
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     config: Dict[str, Any] = {}
 
+    # not fields: excluded from validation, equality, copies and pickles
+    __slots__ = ("_dump", "_dump_of", "_json", "_json_of")
+    if TYPE_CHECKING:  # declared for type checkers only, so pydantic sees no private attrs
+        _dump: Dict[str, Any]
+        _dump_of: Tuple[Any, ...]
+        _json: bytes
+        _json_of: Tuple[Tuple[Any, ...], Callable[[Any], bytes]]
+
+    def dump_cached(self) -> Dict[str, Any]:
+        """model_dump() computed once per Meta instance.
+
+        The cache is keyed on the field values, so reassigning a field (or
+        model_copy(update=...)) invalidates it; in-place mutation of `config` does not.
+        The returned dict is the cache itself: responses get dump_copy() instead.
+        """
+        values = tuple(self.__dict__.values())
+        try:
+            if values == self._dump_of:
+                return self._dump
+        except AttributeError:
+            pass
+        dump = self.model_dump()
+        _object_setattr(self, "_dump", dump)
+        _object_setattr(self, "_dump_of", values)
+        return dump
+
+    def dump_copy(self) -> Dict[str, Any]:
+        """A private copy of dump_cached() for one response; mutating it leaves the cache intact."""
+        dump = self.dump_cached()
+        config = dump["config"]
+        return {**dump, "config": copy.deepcopy(config) if config else {}}
+
+    def json_cached(self, encode: Optional[Callable[[Any], bytes]] = None) -> bytes:
+        """dump_cached() encoded by `encode` (default: the elementals.serialize backend).
+
+        Cached the same way as dump_cached(), per encoder, so the bytes always match
+        what that encoder would produce for the meta dict inside a whole response.
+        """
+        if encode is None:
+            from .serialize import get_encoder  # lazy import to avoid cycles
+
+            encode = get_encoder()
+        key = (tuple(self.__dict__.values()), encode)
+        try:
+            if key == self._json_of:
+                return self._json
+        except AttributeError:
+            pass
+        encoded = encode(self.dump_cached())
+        _object_setattr(self, "_json", encoded)
+        _object_setattr(self, "_json_of", key)
+        return encoded
+
 class ProcessInfo(BaseModel):
     process_id: str
     version: int = 1
@@ -19,9 +76,45 @@ class Environment(BaseModel):
     region: Optional[str] = None
     max_retries: int = 0
 
+def _as_model(model: Any, value: Any) -> Any:
+    if value is None or isinstance(value, model):
+        return value
+    return model.model_validate(value)
+
+
 class ElementalParams(BaseModel):
     params: Dict[str, Any] = {}
-    savepoint: Dict[str, Any] = {}
+    # a LayeredSavepoint is kept as-is (not copied); plain dicts validate as before
+    savepoint: Union[LayeredSavepoint, Dict[str, Any]] = {}
     process: Optional[ProcessInfo] = None
     environment: Optional[Environment] = None
     meta: Optional[Meta] = None
+
+    @classmethod
+    def trusted(
+        cls,
+        params: Optional[Dict[str, Any]] = None,
+        savepoint: Optional[Union[LayeredSavepoint, Dict[str, Any]]] = None,
+        process: Any = None,
+        environment: Any = None,
+        meta: Any = None,
+    ) -> "ElementalParams":
+        """Build without validating `params`/`savepoint`, for callers holding trusted data.
+
+        The dicts are stored as given (no copy, no type checks) and no default factories
+        run. Nested models should be passed as instances; plain dicts are still validated
+        into ProcessInfo/Environment/Meta. Like model_construct(), but without its
+        per-field default handling, which makes it cheaper than validation.
+        """
+        ep = cls.__new__(cls)
+        _object_setattr(ep, "__dict__", {
+            "params": params if params is not None else {},
+            "savepoint": savepoint if savepoint is not None else {},
+            "process": _as_model(ProcessInfo, process),
+            "environment": _as_model(Environment, environment),
+            "meta": _as_model(Meta, meta),
+        })
+        _object_setattr(ep, "__pydantic_fields_set__", {"params", "savepoint", "process", "environment", "meta"})
+        _object_setattr(ep, "__pydantic_extra__", None)
+        _object_setattr(ep, "__pydantic_private__", None)
+        return ep
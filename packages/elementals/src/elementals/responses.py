@@ -1,5 +1,11 @@
-from typing import Any, Dict, Generic, Optional, TypeVar
+import json
+import os
+from collections.abc import Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Generic, Iterator, Optional, Tuple, TypeVar
 from pydantic import BaseModel, Field
+from .params import ElementalParams, Meta
 
 T = TypeVar("T")
 
@@ -13,3 +19,123 @@ class ElementalResponse(BaseModel, Generic[T]):
     data: Optional[T] = None
     error: Optional[ErrorItem] = None
     meta: Optional[Dict[str, Any]] = None
+
+
+def meta_dump(meta: Optional[Meta]) -> Optional[Dict[str, Any]]:
+    """Serialized meta for a response: a per-call copy of the Meta's cached dump."""
+    return meta.dump_copy() if meta is not None else None
+
+
+_SUCCESS_KEYS = ("status", "data", "meta")
+_ERROR_KEYS = ("status", "error", "data", "meta")
+
+
+class CompactResponse(Mapping):
+    """Slotted response with the same read API (and equality) as the response dicts.
+
+    Only the payload references are stored; the "meta" item is the Meta's cached dump,
+    produced on access. to_json() writes the JSON bytes directly, reusing the Meta's
+    cached encoding, so no intermediate response dict is built.
+    """
+
+    __slots__ = ("status", "data", "error", "_meta")
+
+    def __init__(self, status: str, data: Any = None, error: Optional[Dict[str, Any]] = None,
+                 meta: Optional[Meta] = None):
+        self.status = status
+        self.data = data
+        self.error = error
+        self._meta = meta
+
+    @property
+    def meta(self) -> Optional[Dict[str, Any]]:
+        return meta_dump(self._meta)
+
+    def _keys(self) -> Tuple[str, ...]:
+        return _ERROR_KEYS if self.status == "error" else _SUCCESS_KEYS
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "status":
+            return self.status
+        if key == "data":
+            return self.data
+        if key == "meta":
+            return meta_dump(self._meta)
+        if key == "error" and self.status == "error":
+            return self.error
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def __repr__(self) -> str:
+        return f"CompactResponse({dict(self)!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def to_json(self, default: Optional[Callable[[Any], Any]] = None,
+                encode: Optional[Callable[[Any], bytes]] = None) -> bytes:
+        """Compact JSON bytes, as `encode` would produce for the equivalent dict.
+
+        `encode` (obj -> bytes) defaults to the elementals.serialize backend; passing only
+        `default` uses json.dumps with that hook instead. Meta is encoded the same way.
+        """
+        if encode is None:
+            if default is None:
+                from .serialize import get_encoder  # lazy import to avoid cycles
+
+                encode = get_encoder()
+            else:
+                def encode(value: Any) -> bytes:
+                    return json.dumps(value, separators=(",", ":"), default=default).encode("utf-8")
+        meta = self._meta.json_cached(encode) if self._meta is not None else b"null"
+        data = encode(self.data)
+        if self.status == "error":
+            error = encode(self.error)
+            return b'{"status":"error","error":' + error + b',"data":' + data + b',"meta":' + meta + b"}"
+        return b'{"status":"' + self.status.encode("utf-8") + b'","data":' + data + b',"meta":' + meta + b"}"
+
+
+# The builders return CompactResponse instead of dicts while this is set; see set_compact().
+_compact = os.environ.get("ELEMENTALS_COMPACT_RESPONSES", "").lower() in ("1", "true", "yes")
+# Per-call override used by ElementalFunction.run_bytes(); see compact_responses().
+_compact_call: ContextVar[bool] = ContextVar("elementals_compact_call", default=False)
+
+
+def set_compact(enabled: bool) -> bool:
+    """Switch success_response()/error_response() to CompactResponse; returns the old setting."""
+    global _compact
+    previous, _compact = _compact, bool(enabled)
+    return previous
+
+
+@contextmanager
+def compact_responses() -> Iterator[None]:
+    """Build CompactResponse objects in this context (thread/task) only."""
+    token = _compact_call.set(True)
+    try:
+        yield
+    finally:
+        _compact_call.reset(token)
+
+
+def success_response(params: ElementalParams, data: Any) -> Dict[str, Any]:
+    """Build a success response dict in ElementalResponse shape."""
+    if _compact or _compact_call.get():
+        return CompactResponse("success", data, None, params.meta)  # type: ignore[return-value]
+    return {"status": "success", "data": data, "meta": meta_dump(params.meta)}
+
+
+def error_response(params: ElementalParams, code: str, message: str,
+                   details: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build an error response dict in ElementalResponse shape."""
+    error: Dict[str, Any] = {"code": code, "message": message}
+    if details is not None:
+        error["details"] = details
+    if _compact or _compact_call.get():
+        return CompactResponse("error", None, error, params.meta)  # type: ignore[return-value]
+    return {"status": "error", "error": error, "data": None, "meta": meta_dump(params.meta)}
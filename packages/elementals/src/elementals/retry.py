@@ -0,0 +1,188 @@
+"""In-process retries driven by Environment.max_retries.
+
+RetryExecutor re-runs a function whose response is a retryable error, up to
+`params.environment.max_retries` extra attempts. Between attempts it waits with
+exponential backoff and full jitter: a random delay in [0, min(max_delay, base_delay * 2**n)].
+
+Whether an error is retryable is decided by an optional RETRY_ANALYSIS-role function.
+It is called with params
+  {"function": <name>, "attempt": <n>, "max_retries": <m>, "error": <error dict>}
+and answers with data {"retry": bool, "delay": <seconds, optional>}. Without an
+analyzer (or when it fails), errors whose code is in `retryable_codes` are retried.
+Exceptions raised by the function count as code "exception".
+
+Every response gets meta["retry"] = {"attempts", "latency_ms", "delays_ms"}. Use
+`arun()` from async code: its backoff is an asyncio.sleep, so no worker thread is held
+while waiting. `run()` is the blocking equivalent for sync callers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .aio import AsyncExecutor, get_executor
+from .base import ElementalFunction
+from .enums import RoleInProcess
+from .params import ElementalParams
+from .responses import error_response
+
+DEFAULT_RETRYABLE_CODES = frozenset({"exception", "timeout", "unavailable"})
+
+
+class RetryExecutor:
+    """Run elemental functions with backoff retries; see the module docstring.
+
+    - analyzer: optional RETRY_ANALYSIS function consulted for every error
+    - base_delay / max_delay: backoff bounds in seconds
+    - retryable_codes: error codes retried when there is no analyzer verdict
+    - max_retries: override for params.environment.max_retries
+    """
+
+    def __init__(
+        self,
+        analyzer: Optional[ElementalFunction[Any]] = None,
+        *,
+        base_delay: float = 0.05,
+        max_delay: float = 2.0,
+        retryable_codes: Iterable[str] = DEFAULT_RETRYABLE_CODES,
+        max_retries: Optional[int] = None,
+        executor: Optional[AsyncExecutor] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        if analyzer is not None and analyzer.characteristics.role is not RoleInProcess.RETRY_ANALYSIS:
+            raise ValueError(f"{analyzer.characteristics.name} is not a {RoleInProcess.RETRY_ANALYSIS.value} function")
+        self.analyzer = analyzer
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retryable_codes: FrozenSet[str] = frozenset(retryable_codes)
+        self.max_retries = max_retries
+        self._executor = executor
+        self._rng = rng or random.Random()
+
+    def _retries(self, params: ElementalParams) -> int:
+        if self.max_retries is not None:
+            return self.max_retries
+        env = params.environment
+        return env.max_retries if env is not None else 0
+
+    def backoff(self, attempt: int) -> float:
+        """Jittered delay (seconds) before retry number `attempt` (1-based)."""
+        return self._rng.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+    def _analysis(self, fn: ElementalFunction[Any], params: ElementalParams, error: Dict[str, Any],
+                  attempt: int, retries: int) -> ElementalParams:
+        return ElementalParams.trusted(
+            {"function": fn.characteristics.name, "attempt": attempt, "max_retries": retries, "error": error},
+            params.savepoint, params.process, params.environment, params.meta,
+        )
+
+    def _verdict(self, verdict: Optional[Dict[str, Any]], error: Dict[str, Any]) -> Tuple[bool, Optional[float]]:
+        """(retry?, analyzer-suggested delay) from the analyzer's response, if usable."""
+        if verdict is not None and verdict.get("status") == "success":
+            data = verdict.get("data")
+            if isinstance(data, dict) and "retry" in data:
+                return bool(data["retry"]), data.get("delay")
+        return error.get("code") in self.retryable_codes, None
+
+    def _decide(self, fn: ElementalFunction[Any], params: ElementalParams, response: Dict[str, Any],
+                attempt: int, retries: int) -> Tuple[bool, Optional[float]]:
+        error = response.get("error") or {}
+        verdict = None
+        if self.analyzer is not None:
+            try:
+                verdict = self.analyzer.run_dict(self._analysis(fn, params, error, attempt, retries))
+            except Exception:
+                verdict = None  # a failing analyzer gives no verdict: use retryable_codes
+        return self._verdict(verdict, error)
+
+    async def _adecide(self, executor: AsyncExecutor, fn: ElementalFunction[Any], params: ElementalParams,
+                       response: Dict[str, Any], attempt: int, retries: int) -> Tuple[bool, Optional[float]]:
+        # the analyzer goes through the executor too, so it never blocks the loop
+        error = response.get("error") or {}
+        verdict = None
+        if self.analyzer is not None:
+            analysis = self._analysis(fn, params, error, attempt, retries)
+            try:
+                verdict = await executor.run(self.analyzer, analysis)
+            except Exception:
+                verdict = None  # a failing analyzer gives no verdict: use retryable_codes
+        return self._verdict(verdict, error)
+
+    @staticmethod
+    def _guarded(fn: ElementalFunction[Any], params: ElementalParams) -> Dict[str, Any]:
+        try:
+            return fn.run_dict(params)
+        except Exception as e:
+            return error_response(params, "exception", str(e))
+
+    @staticmethod
+    def _annotate(response: Dict[str, Any], attempts: int, start: int, delays: List[float]) -> Dict[str, Any]:
+        # the response may be cached or held by the caller: copy, never mutate
+        meta = dict(response.get("meta") or {})
+        meta["retry"] = {
+            "attempts": attempts,
+            "latency_ms": (time.perf_counter_ns() - start) / 1e6,
+            "delays_ms": [d * 1e3 for d in delays],
+        }
+        return {**response, "meta": meta}
+
+    def _delay(self, decision: Tuple[bool, Optional[float]], attempt: int) -> Optional[float]:
+        retry, delay = decision
+        if not retry:
+            return None
+        return float(delay) if delay is not None else self.backoff(attempt)
+
+    @staticmethod
+    def _final(response: Dict[str, Any], attempt: int, retries: int) -> bool:
+        return response.get("status") != "error" or attempt > retries
+
+    def _next_delay(self, fn: ElementalFunction[Any], params: ElementalParams,
+                    response: Dict[str, Any], attempt: int, retries: int) -> Optional[float]:
+        """Delay before the next attempt, or None to stop with `response`."""
+        if self._final(response, attempt, retries):
+            return None
+        return self._delay(self._decide(fn, params, response, attempt, retries), attempt)
+
+    def run(self, fn: ElementalFunction[Any], params: ElementalParams) -> Dict[str, Any]:
+        """Blocking form: sleeps between attempts on the calling thread."""
+        start = time.perf_counter_ns()
+        retries = self._retries(params)
+        delays: List[float] = []
+        attempt = 0
+        while True:
+            attempt += 1
+            response = self._guarded(fn, params)
+            delay = self._next_delay(fn, params, response, attempt, retries)
+            if delay is None:
+                return self._annotate(response, attempt, start, delays)
+            delays.append(delay)
+            time.sleep(delay)
+
+    async def arun(self, fn: ElementalFunction[Any], params: ElementalParams,
+                   executor: Optional[AsyncExecutor] = None) -> Dict[str, Any]:
+        """Async form: attempts go through the AsyncExecutor; backoff is asyncio.sleep.
+
+        `executor`, when given, is used for this call instead of the constructor's.
+        """
+        executor = executor or self._executor or get_executor()
+        start = time.perf_counter_ns()
+        retries = self._retries(params)
+        delays: List[float] = []
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await executor.run(fn, params)
+            except Exception as e:
+                response = error_response(params, "exception", str(e))
+            delay = None
+            if not self._final(response, attempt, retries):
+                decision = await self._adecide(executor, fn, params, response, attempt, retries)
+                delay = self._delay(decision, attempt)
+            if delay is None:
+                return self._annotate(response, attempt, start, delays)
+            delays.append(delay)
+            await asyncio.sleep(delay)
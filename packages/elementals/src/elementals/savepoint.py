@@ -0,0 +1,176 @@
+"""Layered, copy-on-write savepoints.
+
+A process savepoint grows with every step. Passing it around as a plain dict means
+Pydantic copies it on validation and responses echo it in full. LayeredSavepoint keeps
+the savepoint as a base snapshot that is never mutated plus a stack of per-step deltas:
+
+    sp = LayeredSavepoint(base)       # base is shared, never copied or mutated
+    sp["order"] = {"id": 7}           # writes go to the current step's delta
+    del sp["draft"]                   # deletions are recorded as tombstones
+    sp.diff()                         # {"set": {"order": {"id": 7}}, "unset": ["draft"]}
+    sp = sp.next_step()               # freeze this step's delta, start a new one
+
+Reads (including "$savepoint..." path resolution) look through the layers top-down
+without materializing the merged dict. Copy-on-write is per top-level key: to change a
+nested value, assign a new value for its key rather than mutating it in place.
+
+A diff is {"set": {key: value}, "unset": [key, ...]} relative to the base; the caller
+holding the base rebuilds the savepoint with apply_diff() or LayeredSavepoint.apply().
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Optional, Tuple
+
+# tombstone for a key deleted in a delta layer
+_DELETED: Any = object()
+_MISSING: Any = object()
+
+# next_step() squashes the frozen deltas into one once there are more than this many,
+# keeping lookups O(MAX_LAYERS) however many steps a process runs
+MAX_LAYERS = 16
+
+Diff = Dict[str, Any]
+
+
+class LayeredSavepoint(MutableMapping[str, Any]):
+    """Mapping view of a base savepoint plus per-step deltas; writes touch only the top delta."""
+
+    __slots__ = ("_base", "_layers", "_delta")
+
+    def __init__(self, base: Optional[Mapping[str, Any]] = None,
+                 layers: Tuple[Dict[str, Any], ...] = ()):
+        self._base: Mapping[str, Any] = base if base is not None else {}
+        self._layers = layers
+        self._delta: Dict[str, Any] = {}
+
+    # -- reads -------------------------------------------------------------
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._delta.get(key, _MISSING)
+        if value is _MISSING:
+            for layer in reversed(self._layers):
+                value = layer.get(key, _MISSING)
+                if value is not _MISSING:
+                    break
+            else:
+                value = self._base.get(key, _MISSING)
+        if value is _MISSING or value is _DELETED:
+            return default
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _MISSING) is not _MISSING  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[str]:
+        seen = set()
+        for layer in (self._delta, *reversed(self._layers), self._base):
+            for key, value in layer.items():
+                if key not in seen:
+                    seen.add(key)
+                    if value is not _DELETED:
+                        yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"LayeredSavepoint(base={len(self._base)} keys, layers={len(self._layers) + 1}, diff={self.diff()!r})"
+
+    # -- copy-on-write writes ---------------------------------------------
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._delta[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._delta[key] = _DELETED
+
+    # -- steps and diffs -----------------------------------------------------
+
+    @property
+    def base(self) -> Mapping[str, Any]:
+        return self._base
+
+    def _merged_delta(self) -> Dict[str, Any]:
+        merged: Dict[str, Any] = {}
+        for layer in (*self._layers, self._delta):
+            merged.update(layer)
+        return merged
+
+    def next_step(self) -> "LayeredSavepoint":
+        """New view over the same base with this step's delta frozen beneath a fresh one."""
+        # freeze a copy: this view stays writable and must not leak into the new one
+        layers = self._layers + (dict(self._delta),) if self._delta else self._layers
+        if len(layers) > MAX_LAYERS:
+            layers = (self._merged_delta(),)
+        return LayeredSavepoint(self._base, layers)
+
+    def diff(self) -> Diff:
+        """Changes relative to the base, as {"set": {...}, "unset": [...]}."""
+        set_: Dict[str, Any] = {}
+        unset: List[str] = []
+        for key, value in self._merged_delta().items():
+            if value is _DELETED:
+                if key in self._base:
+                    unset.append(key)
+            elif self._base.get(key, _MISSING) is not value:
+                set_[key] = value
+        return {"set": set_, "unset": unset}
+
+    def apply(self, diff: Diff) -> "LayeredSavepoint":
+        """New view with `diff` (e.g. from a step's response) pushed as a frozen layer."""
+        layer: Dict[str, Any] = dict(diff.get("set") or {})
+        for key in diff.get("unset") or ():
+            layer[key] = _DELETED
+        sp = self.next_step()
+        if layer:
+            sp._layers = sp._layers + (layer,)
+        return sp
+
+    def materialize(self) -> Dict[str, Any]:
+        """The merged savepoint as a new plain dict."""
+        out = dict(self._base)
+        for key, value in self._merged_delta().items():
+            if value is _DELETED:
+                out.pop(key, None)
+            else:
+                out[key] = value
+        return out
+
+    def rebase(self) -> "LayeredSavepoint":
+        """New view whose base is the materialized savepoint (drops every delta)."""
+        return LayeredSavepoint(self.materialize())
+
+    # -- pydantic integration ----------------------------------------------
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> Any:
+        from pydantic_core import core_schema
+
+        # accept instances as-is (no copy); dump as the merged plain dict
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda sp: sp.materialize()),
+        )
+
+
+def apply_diff(savepoint: Mapping[str, Any], diff: Diff) -> Dict[str, Any]:
+    """Return a plain dict: `savepoint` with `diff` applied (the input is not mutated)."""
+    out = dict(savepoint)
+    out.update(diff.get("set") or {})
+    for key in diff.get("unset") or ():
+        out.pop(key, None)
+    return out
+
+
+def savepoint_diff(savepoint: Mapping[str, Any]) -> Optional[Diff]:
+    """The diff carried by a layered savepoint, or None for a plain mapping."""
+    return savepoint.diff() if isinstance(savepoint, LayeredSavepoint) else None
@@ -0,0 +1,132 @@
+"""JSON encoding of run_dict() results, using orjson when it is installed.
+
+`dumps(result)` returns compact UTF-8 JSON bytes. The backend is chosen once, on first
+use:
+
+- "orjson": used when the optional dependency is installed (see the `orjson` extra).
+  Values it cannot encode natively go through `default()`. Payloads it rejects, such
+  as ints beyond 64 bits from LCM, are re-encoded with the stdlib.
+- "json": the stdlib encoder with the same `default()`.
+
+ELEMENTALS_JSON=json|orjson forces one. set_backend() also accepts any callable
+obj -> bytes. Both backends handle datetimes (ISO 8601), the str-Enums in
+elementals.enums, Pydantic models, mappings such as LayeredSavepoint, ropes and
+buffers (base64). A CompactResponse is written piece by piece around its cached
+meta JSON, so no response dict is built.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Mapping, Optional, Union
+
+from pydantic import BaseModel
+
+from .buffers import Rope, b64, is_buffer
+from .responses import CompactResponse
+
+Encoder = Callable[[Any], bytes]
+
+_UNLOADED: Any = object()
+# orjson module (None if not installed); imported on first orjson_or_none() call
+orjson: Any = _UNLOADED
+
+
+def orjson_or_none() -> Any:
+    """Return the orjson module if available, else None (imported on first call)."""
+    global orjson
+    if orjson is _UNLOADED:
+        try:  # optional dependency, see the `orjson` extra
+            import orjson as module
+
+            orjson = module
+        except ImportError:  # pragma: no cover - exercised only without orjson
+            orjson = None
+    return orjson
+
+
+def default(value: Any) -> Any:
+    """JSON form of values the encoders do not handle natively."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Mapping):  # e.g. LayeredSavepoint, CompactResponse
+        return dict(value)
+    if isinstance(value, Rope):
+        return value.text() if value.is_text else b64(value.tobytes())
+    if is_buffer(value):
+        return b64(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Stdlib backend."""
+    return json.dumps(obj, default=default, separators=(",", ":")).encode("utf-8")
+
+
+def orjson_dumps(obj: Any) -> bytes:
+    """orjson backend; falls back to the stdlib for payloads orjson rejects."""
+    module = orjson_or_none()
+    try:
+        return module.dumps(obj, default=default, option=module.OPT_NON_STR_KEYS)
+    except module.JSONEncodeError:
+        return json_dumps(obj)
+
+
+BACKENDS: Dict[str, Encoder] = {"json": json_dumps, "orjson": orjson_dumps}
+
+_encoder: Optional[Encoder] = None
+
+
+def _default_encoder() -> Encoder:
+    name = os.environ.get("ELEMENTALS_JSON", "").strip().lower()
+    if name:
+        if name not in BACKENDS:
+            raise ValueError(f"ELEMENTALS_JSON must be one of {sorted(BACKENDS)}, got {name!r}")
+        if name == "orjson" and orjson_or_none() is None:
+            raise ImportError("ELEMENTALS_JSON=orjson but orjson is not installed")
+        return BACKENDS[name]
+    return orjson_dumps if orjson_or_none() is not None else json_dumps
+
+
+def get_encoder() -> Encoder:
+    global _encoder
+    if _encoder is None:
+        _encoder = _default_encoder()
+    return _encoder
+
+
+def set_backend(backend: Union[str, Encoder, None]) -> Optional[Encoder]:
+    """Use `backend` (a BACKENDS name or an obj -> bytes callable) for dumps().
+
+    None restores the automatic choice. Returns the previous encoder.
+    """
+    global _encoder
+    previous = _encoder
+    if isinstance(backend, str):
+        if backend not in BACKENDS:
+            raise ValueError(f"unknown JSON backend {backend!r} (expected one of {sorted(BACKENDS)})")
+        if backend == "orjson" and orjson_or_none() is None:
+            raise ImportError("orjson is not installed")
+        backend = BACKENDS[backend]
+    _encoder = backend
+    return previous
+
+
+def backend_name() -> str:
+    encoder = get_encoder()
+    return next((name for name, fn in BACKENDS.items() if fn is encoder), getattr(encoder, "__name__", "custom"))
+
+
+def dumps(result: Any) -> bytes:
+    """Compact JSON bytes for a response (dict or CompactResponse) or any other value."""
+    encoder = get_encoder()
+    if isinstance(result, CompactResponse):
+        return result.to_json(encode=encoder)
+    return encoder(result)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union
-from pydantic import BaseModel
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Union
 
+from .. import instrument
 from ..params import ElementalParams
+from .path_engine import MISSING as _MISSING
+from .path_engine import PATH_CACHE_SIZE, CompiledPath
+from .path_engine import compile_path as _compile_path
 
 
 PathLike = str
@@ -14,89 +18,15 @@ def _is_path_expr(value: Any) -> bool:
     return isinstance(value, str) and value.strip().startswith("$")
 
 
-def _tokenize(path: str) -> List[Union[str, int]]:
-    """Tokenize a dotted/bracket path like "params.a[0].b" -> ["params", "a", 0, "b"]."""
-    raw = path.lstrip("$").strip()
-    if not raw:
-        return []
-    tokens: List[Union[str, int]] = []
-    # split on '.' first, then extract bracketed indices
-    for part in raw.split('.'):
-        if not part:
-            continue
-        buf = ""
-        i = 0
-        while i < len(part):
-            ch = part[i]
-            if ch == '[':
-                # flush accumulated buf as a key token
-                if buf:
-                    tokens.append(buf)
-                    buf = ""
-                # find closing ']'
-                j = part.find(']', i + 1)
-                if j == -1:
-                    # unmatched bracket, treat rest as text
-                    buf += part[i:]
-                    break
-                idx_text = part[i + 1:j].strip()
-                # try parse int index, else treat as key
-                if idx_text.isdigit() or (idx_text.startswith('-') and idx_text[1:].isdigit()):
-                    tokens.append(int(idx_text))
-                else:
-                    tokens.append(idx_text)
-                i = j + 1
-                continue
-            else:
-                buf += ch
-                i += 1
-        if buf:
-            tokens.append(buf)
-    return tokens
-
-
-_MISSING = object()
-
-
-def _get_child(obj: Any, key: Union[str, int]) -> Any:
-    """Get next child by key or index from dict/list/BaseModel/obj attributes.
-
-    Returns _MISSING if the path cannot be resolved at this step.
-    """
-    if obj is None:
-        return _MISSING
-    # pydantic model: prefer attribute access
-    if isinstance(obj, BaseModel):
-        # model_dump for non-leaf is handled by caller; here we traverse
-        try:
-            if isinstance(key, int):
-                # cannot index a model
-                return _MISSING
-            return getattr(obj, key)
-        except AttributeError:
-            data = obj.model_dump()  # fallback to dict
-            return data.get(key, _MISSING)
-    # dict-like
-    if isinstance(obj, dict):
-        return obj.get(key, _MISSING)
-    # list/tuple
-    if isinstance(obj, (list, tuple)):
-        if isinstance(key, int) and -len(obj) <= key < len(obj):
-            return obj[key]
-        return _MISSING
-    # generic object: try attribute then item access
-    if isinstance(key, int):
-        try:
-            return obj[key]  # type: ignore[index]
-        except Exception:
-            return _MISSING
-    try:
-        return getattr(obj, key)
-    except Exception:
-        return _MISSING
-
-
-def resolve_path(params: ElementalParams, path: PathLike, *, default: Any = _MISSING, dump_models: bool = True) -> Any:
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def compile_path(path: PathLike) -> CompiledPath:
+    """Return the interned CompiledPath for a "$"-prefixed path expression."""
+    if not _is_path_expr(path):
+        raise ValueError("Path expressions must start with '$'")
+    return _compile_path(path)
+
+
+def resolve_path(params: ElementalParams, path: Union[PathLike, CompiledPath], *, default: Any = _MISSING, dump_models: bool = True) -> Any:
     """Resolve a "$"-prefixed path against ElementalParams.
 
     Examples:
@@ -106,19 +36,83 @@ def resolve_path(params: ElementalParams, path: PathLike, *, default: Any = _MIS
 
     If the path cannot be resolved, returns `default` if provided, else raises KeyError.
     If dump_models is True and the resolved value is a BaseModel, returns model_dump().
+    `path` may also be a CompiledPath; strings are compiled once and interned.
     """
-    if not _is_path_expr(path):
+    if isinstance(path, str):
+        path = compile_path(path)
+    elif not isinstance(path, CompiledPath):
         raise ValueError("Path expressions must start with '$'")
-    current: Any = params
-    for token in _tokenize(path):
-        current = _get_child(current, token)
-        if current is _MISSING:
-            if default is _MISSING:
-                raise KeyError(f"Path not found: {path}")
-            return default
-    if dump_models and isinstance(current, BaseModel):
-        return current.model_dump()
-    return current
+    if instrument.hooks:
+        with instrument.span("resolve_path", path=path.path):
+            return path.resolve(params, default=default, dump_models=dump_models)
+    return path.resolve(params, default=default, dump_models=dump_models)
+
+
+_ON_MISSING = ("none", "keep", "error")
+
+Renderer = Callable[[Any], Any]
+
+
+def _compile_node(value: Any, on_missing: str, dump_models: bool) -> Optional[Renderer]:
+    """Return a renderer for a template node, or None if the node is static."""
+    if isinstance(value, dict):
+        entries = [(k, _compile_node(v, on_missing, dump_models), v) for k, v in value.items()]
+        if all(fn is None for _, fn, _ in entries):
+            return None
+        frozen = tuple(entries)
+        return lambda params: {k: (v if fn is None else fn(params)) for k, fn, v in frozen}
+    if isinstance(value, (list, tuple)):
+        items = tuple((_compile_node(v, on_missing, dump_models), v) for v in value)
+        if all(fn is None for fn, _ in items):
+            return None
+        if isinstance(value, list):
+            return lambda params: [(v if fn is None else fn(params)) for fn, v in items]
+        return lambda params: tuple((v if fn is None else fn(params)) for fn, v in items)
+    if _is_path_expr(value):
+        resolve = compile_path(value).resolve
+        if on_missing == "error":
+            return lambda params: resolve(params, dump_models=dump_models)
+        default = value if on_missing == "keep" else None
+        return lambda params: resolve(params, default=default, dump_models=dump_models)
+    return None
+
+
+class TemplatePlan:
+    """A template compiled once by `compile_template` and rendered many times.
+
+    Static subtrees (no "$" paths inside) are returned as-is and shared between
+    renders; only containers that hold path expressions are rebuilt.
+    """
+
+    __slots__ = ("template", "on_missing", "dump_models", "_render")
+
+    def __init__(self, template: Any, *, on_missing: str = "none", dump_models: bool = True):
+        if on_missing not in _ON_MISSING:
+            raise ValueError("on_missing must be one of: none, keep, error")
+        self.template = template
+        self.on_missing = on_missing
+        self.dump_models = dump_models
+        self._render = _compile_node(template, on_missing, dump_models)
+
+    @property
+    def is_static(self) -> bool:
+        return self._render is None
+
+    def render(self, params: ElementalParams) -> Any:
+        """Evaluate the precompiled paths against `params`."""
+        if self._render is None:
+            return self.template
+        if instrument.hooks:
+            with instrument.span("resolve_template"):
+                return self._render(params)
+        return self._render(params)
+
+    __call__ = render
+
+
+def compile_template(template: Any, *, on_missing: str = "none", dump_models: bool = True) -> TemplatePlan:
+    """Compile a template for repeated rendering; see `resolve_template` for the options."""
+    return TemplatePlan(template, on_missing=on_missing, dump_models=dump_models)
 
 
 def resolve_template(template: Any, params: ElementalParams, *, on_missing: str = "none", dump_models: bool = True) -> Any:
@@ -131,39 +125,24 @@ def resolve_template(template: Any, params: ElementalParams, *, on_missing: str
         - "keep": keep the original string path
         - "error": raise KeyError
     - dump_models: if a resolved value is a BaseModel, return model_dump().
+
+    Static subtrees are shared with the template, not copied. When the same template is
+    applied repeatedly, compile it once with `compile_template` instead.
     """
-    def _resolve(value: Any) -> Any:
-        if isinstance(value, dict):
-            return {k: _resolve(v) for k, v in value.items()}
-        if isinstance(value, list):
-            return [_resolve(v) for v in value]
-        if isinstance(value, tuple):
-            return tuple(_resolve(v) for v in value)
-        if _is_path_expr(value):
-            if on_missing == "keep":
-                default = value
-            elif on_missing == "none":
-                default = None
-            elif on_missing == "error":
-                default = _MISSING
-            else:
-                raise ValueError("on_missing must be one of: none, keep, error")
-            try:
-                return resolve_path(params, value, default=default, dump_models=dump_models)
-            except KeyError:
-                # only occurs when on_missing == "error"
-                raise
-        return value
-
-    return _resolve(template)
-
-
-def apply_path_map(path_map: Dict[str, Any], params: ElementalParams, *, on_missing: str = "none", dump_models: bool = True) -> Dict[str, Any]:
+    return compile_template(template, on_missing=on_missing, dump_models=dump_models).render(params)
+
+
+def apply_path_map(path_map: Union[Dict[str, Any], TemplatePlan], params: ElementalParams, *, on_missing: str = "none", dump_models: bool = True) -> Dict[str, Any]:
     """Alias for resolve_template when you know the root is a dict.
 
     Useful for mapping a flat or nested dict of output fields to ElementalParams paths.
+    A precompiled TemplatePlan may be passed instead of a dict; its own on_missing and
+    dump_models settings then apply.
     """
-    result = resolve_template(path_map, params, on_missing=on_missing, dump_models=dump_models)
+    if isinstance(path_map, TemplatePlan):
+        result = path_map.render(params)
+    else:
+        result = resolve_template(path_map, params, on_missing=on_missing, dump_models=dump_models)
     if not isinstance(result, dict):
         raise TypeError("path_map must resolve to a dict")
     return result
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any, List, Mapping, Tuple, Union
+
+from pydantic import BaseModel
+
+
+Token = Union[str, int]
+
+# Sentinel for "this hop could not be resolved"; never leaks out of the public APIs.
+MISSING: Any = object()
+
+PATH_CACHE_SIZE = 1024
+
+# one segment of a dot-separated part: plain text, a closed [index], or an unmatched "[..."
+_SEGMENT = re.compile(r"([^\[]+)|\[([^\]]*)\]|(\[.*)")
+
+
+def tokenize(path: str) -> List[Token]:
+    """Tokenize a dotted/bracket path like "$params.a[0].b" -> ["params", "a", 0, "b"].
+
+    - a leading "$" is ignored; empty dot segments are skipped
+    - bracket contents that look like (optionally negative) integers become int tokens,
+      anything else becomes a key token
+    - an unmatched "[" keeps the rest of the segment as a key token
+    """
+    raw = path.lstrip("$").strip()
+    if not raw:
+        return []
+    tokens: List[Token] = []
+    for part in raw.split("."):
+        if not part:
+            continue
+        for key, index, rest in _SEGMENT.findall(part):
+            if key:
+                tokens.append(key)
+            elif rest:
+                tokens.append(rest)
+            else:
+                index = index.strip()
+                if index.isdigit() or (index.startswith("-") and index[1:].isdigit()):
+                    tokens.append(int(index))
+                else:
+                    tokens.append(index)
+    return tokens
+
+
+def get_child(obj: Any, key: Token) -> Any:
+    """Get next child by key or index from Mapping/list/BaseModel/obj attributes.
+
+    Returns MISSING if the path cannot be resolved at this step.
+    """
+    if obj is None:
+        return MISSING
+    # pydantic model: prefer attribute access
+    if isinstance(obj, BaseModel):
+        if isinstance(key, int):
+            # cannot index a model
+            return MISSING
+        try:
+            return getattr(obj, key)
+        except AttributeError:
+            return obj.model_dump().get(key, MISSING)
+    # dict-like (dicts, MappingProxyType, layered views, ...)
+    if isinstance(obj, Mapping):
+        return obj.get(key, MISSING)
+    # list/tuple, negative indexes count from the end
+    if isinstance(obj, (list, tuple)):
+        if isinstance(key, int) and -len(obj) <= key < len(obj):
+            return obj[key]
+        return MISSING
+    # generic object: item access for indexes, attribute access for keys
+    if isinstance(key, int):
+        try:
+            return obj[key]
+        except Exception:
+            return MISSING
+    try:
+        return getattr(obj, key)
+    except Exception:
+        return MISSING
+
+
+class CompiledPath:
+    """A path tokenized once and reusable across calls.
+
+    Hops over plain dicts and lists are handled inline; anything else (BaseModel,
+    other mappings and objects) goes through `get_child`.
+    """
+
+    __slots__ = ("path", "tokens")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.tokens: Tuple[Token, ...] = tuple(tokenize(path))
+
+    def __repr__(self) -> str:
+        return f"CompiledPath({self.path!r})"
+
+    def lookup(self, root: Any) -> Any:
+        """Return the value at this path under `root`, or MISSING."""
+        current = root
+        for token in self.tokens:
+            cls = type(current)
+            if cls is dict:
+                current = current.get(token, MISSING)
+            elif cls is list and type(token) is int:
+                if -len(current) <= token < len(current):
+                    current = current[token]
+                else:
+                    return MISSING
+            else:
+                current = get_child(current, token)
+            if current is MISSING:
+                return MISSING
+        return current
+
+    def resolve(self, params: Any, *, default: Any = MISSING, dump_models: bool = True) -> Any:
+        """Resolve against `params`; raises KeyError on a miss unless `default` is given.
+
+        If dump_models is True and the resolved value is a BaseModel, returns model_dump().
+        """
+        # same walk as lookup(), inlined: this is the hottest call in template rendering
+        current = params
+        for token in self.tokens:
+            cls = type(current)
+            if cls is dict:
+                current = current.get(token, MISSING)
+            elif cls is list and type(token) is int:
+                current = current[token] if -len(current) <= token < len(current) else MISSING
+            else:
+                current = get_child(current, token)
+            if current is MISSING:
+                if default is MISSING:
+                    raise KeyError(f"Path not found: {self.path}")
+                return default
+        if dump_models and isinstance(current, BaseModel):
+            return current.model_dump()
+        return current
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def compile_path(path: str) -> CompiledPath:
+    """Return the interned CompiledPath for `path` (LRU-bounded by PATH_CACHE_SIZE)."""
+    return CompiledPath(path)
@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict
+
+from configfuncs.loader import arun_function
+from elementals.aio import AsyncExecutor, is_native_async
+from elementals.base import ElementalFunction, FunctionCharacteristics
+from elementals.enums import ResourceType, RoleInProcess, SyncType
+from elementals.examples.multiply import MultiplyFunction
+from elementals.params import ElementalParams
+
+
+class SleepFunction(ElementalFunction[Dict[str, Any]]):
+    def __init__(self):
+        super().__init__(FunctionCharacteristics(
+            name="Sleep",
+            description="Waits without blocking the loop.",
+            role=RoleInProcess.BUSINESS_ACTION,
+            sync=SyncType.ASYNC,
+            resource_type=ResourceType.IO,
+        ))
+
+    async def arun(self, params: ElementalParams) -> Dict[str, Any]:
+        await asyncio.sleep(params.params["delay"])
+        return {"status": "success", "data": {"thread": threading.get_ident()}, "meta": None}
+
+
+class ThreadFunction(ElementalFunction[Dict[str, Any]]):
+    def __init__(self):
+        super().__init__(FunctionCharacteristics(
+            name="Thread", description="Reports its thread.", role=RoleInProcess.BUSINESS_ACTION,
+        ))
+
+    def run(self, params: ElementalParams) -> Dict[str, Any]:
+        time.sleep(params.params.get("delay", 0))
+        return {"status": "success", "data": {"thread": threading.get_ident()}, "meta": None}
+
+
+def test_native_async_functions_run_concurrently_on_the_loop():
+    fn = SleepFunction()
+    executor = AsyncExecutor(max_workers=1)
+    assert is_native_async(fn)
+
+    async def main():
+        start = time.perf_counter()
+        outs = await asyncio.gather(
+            *(executor.run(fn, ElementalParams(params={"delay": 0.05})) for _ in range(1000))
+        )
+        return time.perf_counter() - start, outs
+
+    elapsed, outs = asyncio.run(main())
+    assert len(outs) == 1000
+    assert {o["data"]["thread"] for o in outs} == {threading.get_ident()}
+    assert elapsed < 2.0
+    executor.shutdown()
+
+
+def test_sync_functions_are_offloaded_to_the_bounded_pool():
+    fn = ThreadFunction()
+    executor = AsyncExecutor(max_workers=2, max_pending=2)
+    assert not is_native_async(fn)
+
+    async def main():
+        ticker = []
+
+        async def tick():
+            for _ in range(5):
+                ticker.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        outs, _ = await asyncio.gather(
+            asyncio.gather(*(executor.run(fn, ElementalParams(params={"delay": 0.02})) for _ in range(6))),
+            tick(),
+        )
+        return outs, ticker
+
+    outs, ticker = asyncio.run(main())
+    assert all(o["data"]["thread"] != threading.get_ident() for o in outs)
+    assert len(ticker) == 5  # the loop kept running while sync work was in the pool
+    executor.shutdown()
+
+
+def test_declared_async_without_arun_uses_the_bounded_pool():
+    class DeclaredAsync(ThreadFunction):
+        def __init__(self):
+            ElementalFunction.__init__(self, FunctionCharacteristics(
+                name="DeclaredAsync", description="", role=RoleInProcess.BUSINESS_ACTION, sync=SyncType.ASYNC,
+            ))
+
+    fn = DeclaredAsync()
+    executor = AsyncExecutor(max_workers=1)
+    assert not is_native_async(fn)
+    out = asyncio.run(executor.run(fn, ElementalParams()))
+    assert out["data"]["thread"] != threading.get_ident()
+    assert executor._pool._threads  # ran on the executor's own pool
+    executor.shutdown()
+
+
+def test_default_arun_does_not_block():
+    out = asyncio.run(MultiplyFunction().arun(ElementalParams(params={"a": 2, "b": 3})))
+    assert out["data"]["product"] == 6
+
+
+def test_arun_function_via_yaml():
+    out = asyncio.run(arun_function("Multiply", params={"a": 2, "b": 5}))
+    assert out["status"] == "success"
+    assert out["data"]["product"] == 10
@@ -0,0 +1,87 @@
+import math
+import warnings
+
+import pytest
+
+from elementals import batch as batch_mod
+from elementals.examples.concat import ConcatFunction
+from elementals.examples.lcm import LCMFunction
+from elementals.examples.multiply import MultiplyFunction
+from elementals.params import ElementalParams, Meta
+
+MIXED_ROWS = [
+    {"a": 3, "b": 4},
+    {"a": -7, "b": 6},
+    {"a": 0, "b": 9},
+    {"a": 0, "b": 0},
+    {"a": 1.5, "b": 2.0},
+    {"a": 2, "b": 0.5},
+    {"a": 2**40, "b": 2**40},
+    {"a": True, "b": 3},
+    {"a": "ab", "b": 3},
+    {"a": 5},
+    {"b": None},
+] * 8  # enough rows to cross VECTOR_MIN_ROWS
+
+
+@pytest.fixture(params=["numpy", "python"])
+def kernels(request, monkeypatch):
+    if request.param == "numpy":
+        if batch_mod.numpy_or_none() is None:
+            pytest.skip("numpy not installed")
+    else:
+        monkeypatch.setattr(batch_mod, "np", None)
+    return request.param
+
+
+@pytest.mark.parametrize("fn_cls", [MultiplyFunction, LCMFunction])
+def test_run_batch_matches_run_per_row(fn_cls, kernels):
+    fn = fn_cls()
+    rows = [ElementalParams(params=r, meta=Meta(call_id=str(i))) for i, r in enumerate(MIXED_ROWS)]
+    expected = [fn.run(p) for p in rows]
+    got = fn.run_batch(rows)
+    assert got == expected
+    for e, g in zip(expected, got):
+        if e["status"] == "success":
+            data_key = "product" if "product" in e["data"] else "lcm"
+            assert type(g["data"][data_key]) is type(e["data"][data_key])
+
+
+@pytest.mark.parametrize("fn_cls", [MultiplyFunction, LCMFunction])
+def test_run_batch_columnar(fn_cls, kernels):
+    fn = fn_cls()
+    a = list(range(-50, 50))
+    b = [x * 3 + 1 for x in range(100)]
+    meta = Meta(call_id="batch")
+    expected = [fn.run(ElementalParams(params={"a": x, "b": y}, meta=meta)) for x, y in zip(a, b)]
+    assert fn.run_batch({"a": a, "b": b}, meta=meta) == expected
+    if kernels == "numpy":
+        np = batch_mod.numpy_or_none()
+        assert fn.run_batch({"a": np.array(a), "b": np.array(b)}, meta=meta) == expected
+
+
+def test_vectorized_float_overflow_does_not_warn(kernels):
+    fn = MultiplyFunction()
+    rows = [{"a": 1e300, "b": 1e300}, {"a": math.inf, "b": 0.0}] * batch_mod.VECTOR_MIN_ROWS
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        got = fn.run_batch([ElementalParams(params=r) for r in rows])
+    assert got[0]["data"]["product"] == math.inf and math.isnan(got[1]["data"]["product"])
+
+
+def test_run_batch_columnar_missing_column_reports_per_row():
+    out = MultiplyFunction().run_batch({"a": [1, 2]})
+    assert [r["error"]["code"] for r in out] == ["missing_param", "missing_param"]
+
+
+def test_run_batch_columnar_length_mismatch():
+    with pytest.raises(ValueError):
+        MultiplyFunction().run_batch({"a": [1, 2], "b": [1]})
+
+
+def test_default_run_batch_loops_over_run():
+    fn = ConcatFunction()
+    out = fn.run_batch({"text1": ["a", "b"], "text2": ["c", None]})
+    assert out[0]["data"]["concat"] == "ac"
+    assert out[1]["error"]["code"] == "missing_param"
+    assert fn.run_batch([]) == []
@@ -0,0 +1,60 @@
+import io
+import json
+
+from pydantic import BaseModel
+
+from elementals.buffers import Buffer, Rope, map_file
+from elementals.cli import encode
+from elementals.examples.concat import ConcatFunction
+from elementals.params import ElementalParams
+from elementals.utils.param_paths import resolve_path
+
+
+def test_buffers_pass_through_uncopied(tmp_path):
+    blob = tmp_path / "doc.bin"
+    blob.write_bytes(b"%PDF-" + b"x" * 4096)
+    view = map_file(str(blob))
+    raw = bytearray(b"abc")
+    ep = ElementalParams(params={"doc": view, "raw": raw})
+    assert ep.params["doc"] is view and ep.params["raw"] is raw
+    assert resolve_path(ep, "$params.doc") is view
+    assert ep.model_dump()["params"]["doc"] is view
+    assert bytes(view[:5]) == b"%PDF-"
+
+
+def test_buffer_field_type():
+    class Doc(BaseModel):
+        body: Buffer
+
+    view = memoryview(b"hi")
+    doc = Doc(body=view)
+    assert doc.body is view
+    assert doc.model_dump()["body"] is view
+    assert json.loads(doc.model_dump_json()) == {"body": "aGk="}
+
+
+def test_rope_joins_on_demand():
+    rope = Rope(["ab", "", Rope(["cd"])]) + "e"
+    assert rope.parts == ("ab", "cd", "e") and rope.is_text
+    assert str(rope) == "abcde" == rope and len(rope) == 5
+    mixed = Rope([b"ab", memoryview(b"cd"), "é"])
+    assert not mixed.is_text and mixed.tobytes() == "abcdé".encode()
+    assert len(mixed) == len(mixed.tobytes()) == 6
+    out = io.BytesIO()
+    assert mixed.write_to(out) == len(mixed.tobytes())
+    assert out.getvalue() == mixed.tobytes()
+
+
+def test_concat_rope_mode():
+    fn = ConcatFunction()
+    big = "x" * 100_000
+    out = fn.run(ElementalParams(params={"text1": big, "text2": "!", "rope": True}))
+    rope = out["data"]["concat"]
+    assert rope.parts[0] is big and rope == big + "!"
+    assert json.loads(encode(out))["data"]["concat"] == big + "!"
+
+    view = memoryview(b"head-")
+    out = fn.run(ElementalParams(params={"text1": view, "text2": b"tail"}))
+    assert out["data"]["concat"].parts[0] is view
+    assert out["data"]["concat"] == b"head-tail"
+    assert fn.run(ElementalParams(params={"text1": "A", "text2": 1}))["data"]["concat"] == "A1"
@@ -0,0 +1,60 @@
+import pytest
+
+from elementals.cache import ResultCache, cache_from_config, cache_key
+from elementals.examples.concat import ConcatFunction
+from elementals.examples.multiply import MultiplyFunction
+from elementals.params import ElementalParams, Meta
+
+
+def test_cache_key_is_canonical():
+    assert cache_key({"a": 1, "b": 2}) == cache_key({"b": 2, "a": 1})
+    assert cache_key({"a": 1}) != cache_key({"a": 1.0}) != cache_key({"a": True})
+    assert cache_key({"a": 1, "x": 9}, ["a"]) == cache_key({"a": 1, "x": 8}, ["a"])
+    assert cache_key({"a": object()}) is None
+
+
+def test_hits_echo_callers_meta():
+    fn = MultiplyFunction()
+    cache = fn.enable_cache(ResultCache(max_size=8))
+    first = fn.run(ElementalParams(params={"a": 6, "b": 7}, meta=Meta(call_id="one")))
+    second = fn.run_dict(ElementalParams(params={"a": 6, "b": 7}, meta=Meta(call_id="two")))
+    third = fn.run(ElementalParams(params={"a": 6, "b": 7}))
+    assert first["data"] == second["data"] == third["data"] == {"a": 6, "b": 7, "product": 42}
+    assert first["meta"]["call_id"] == "one"
+    assert second["meta"]["call_id"] == "two"
+    assert third["meta"] is None
+    assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 0, "size": 1, "max_size": 8}
+
+
+def test_cached_data_is_not_shared_with_callers():
+    fn = MultiplyFunction()
+    fn.enable_cache(ResultCache(max_size=8))
+    first = fn.run(ElementalParams(params={"a": 2, "b": 3}))
+    first["data"]["product"] = -1
+    second = fn.run(ElementalParams(params={"a": 2, "b": 3}))
+    second["data"]["product"] = -2
+    assert fn.run(ElementalParams(params={"a": 2, "b": 3}))["data"]["product"] == 6
+
+
+def test_lru_eviction_and_ttl(monkeypatch):
+    cache = ResultCache(max_size=2, ttl=10)
+    fn = ConcatFunction()
+    fn.enable_cache(cache)
+    for t in ("a", "b", "a", "c"):
+        fn.run(ElementalParams(params={"text1": t, "text2": "!"}))
+    assert cache.stats()["evictions"] == 1
+    assert cache_key({"text1": "b", "text2": "!"}) not in cache._entries
+
+    import elementals.cache as mod
+    now = mod.time.monotonic()
+    monkeypatch.setattr(mod.time, "monotonic", lambda: now + 11)
+    fn.run(ElementalParams(params={"text1": "a", "text2": "!"}))
+    assert cache.stats()["misses"] == 4
+
+
+def test_cache_from_config():
+    assert cache_from_config({"name": "Multiply"}) is None
+    cache = cache_from_config({"pure": True, "cache_max_size": 16, "cache_ttl": 5, "cache_keys": ["a", "b"]})
+    assert (cache.max_size, cache.ttl, cache.keys) == (16, 5.0, ("a", "b"))
+    with pytest.raises(ValueError):
+        ResultCache(max_size=0)
@@ -0,0 +1,70 @@
+import io
+import json
+import os
+import subprocess
+import sys
+
+from elementals.cli import main, run_stream
+
+RECORDS = [
+    {"function": "Multiply", "params": {"a": 2, "b": 3}},
+    {"function": "Echo", "params": {"x": 1}, "savepoint": {"s": 2}, "meta": {"call_id": "c"}},
+    {"function": "Nope", "params": {}},
+    {"function": "Concat", "params": {"text1": "a"}},
+    {"function": "Multiply", "params": "not-a-dict"},
+]
+
+
+def ndjson(records):
+    return b"".join(json.dumps(r).encode() + b"\n" for r in records)
+
+
+def test_run_stream_writes_one_result_per_record():
+    lines = io.BytesIO(ndjson(RECORDS) + b"\n{broken\n")
+    out = io.BytesIO()
+    assert run_stream(lines, out) == 6
+    results = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert results[0]["data"]["product"] == 6
+    assert results[1]["data"] == {"echo": {"x": 1}, "savepoint": {"s": 2}}
+    assert results[1]["meta"]["call_id"] == "c" and isinstance(results[1]["meta"]["timestamp"], str)
+    assert results[2]["error"]["code"] == "unknown_function"
+    assert results[3]["error"]["code"] == "missing_param"
+    assert results[4]["error"]["code"] == "invalid_params"
+    assert results[5]["error"]["code"] == "invalid_record"
+    assert results[5]["error"]["details"]["line"] == 7
+
+
+def test_record_that_raises_does_not_stop_the_stream():
+    from elementals.cli import run_record
+
+    bad = {"function": "Multiply", "params": {"a": "x", "b": "y"}}
+    out = io.BytesIO()
+    assert run_stream(io.BytesIO(ndjson([RECORDS[0], bad, RECORDS[0]])), out) == 3
+    results = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [r["status"] for r in results] == ["success", "error", "success"]
+    assert results[1]["error"]["code"] == "exception" and results[1]["error"]["details"]["line"] == 2
+    assert run_record(bad, 5)["error"]["code"] == "exception"
+
+
+def test_main_with_files(tmp_path):
+    src, dst = tmp_path / "in.ndjson", tmp_path / "out.ndjson"
+    src.write_bytes(ndjson(RECORDS[:2]))
+    assert main(["run", "--stream", "--input", str(src), "--output", str(dst)]) == 0
+    assert len(dst.read_bytes().splitlines()) == 2
+
+
+def test_module_entry_point_reads_stdin():
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    proc = subprocess.run(
+        [sys.executable, "-m", "elementals", "run", "--stream"],
+        input=ndjson([{"function": "LCM", "params": {"a": 4, "b": 6}}] * 3),
+        capture_output=True, env=env, check=True,
+    )
+    assert [json.loads(line)["data"]["lcm"] for line in proc.stdout.splitlines()] == [12, 12, 12]
+
+
+def test_document_mode(tmp_path):
+    src, dst = tmp_path / "in.json", tmp_path / "out.json"
+    src.write_text(json.dumps(RECORDS[:1]))
+    main(["run", "--input", str(src), "--output", str(dst)])
+    assert json.loads(dst.read_text())[0]["data"]["product"] == 6
@@ -0,0 +1,50 @@
+"""Cold-start import cost, measured with `python -X importtime` in a fresh interpreter."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PACKAGES = Path(__file__).resolve().parents[2]
+EL_SRC = str(PACKAGES / "elementals" / "src")
+CFG_SRC = str(PACKAGES / "configfuncs" / "src")
+
+
+def importtime(statement):
+    """Run `statement` in a fresh interpreter; return {module: cumulative_us}."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([EL_SRC, CFG_SRC]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_package_imports_are_lazy():
+    modules = importtime("import elementals, configfuncs")
+    for heavy in ("pydantic", "yaml", "numpy", "elementals.base", "configfuncs.loader"):
+        assert heavy not in modules, heavy
+
+
+def test_base_import_defers_numpy_and_yaml():
+    modules = importtime("import elementals.base, configfuncs.loader")
+    assert "numpy" not in modules
+    assert "yaml" not in modules
+    assert "pydantic" in modules
+
+
+def test_lazy_attributes_resolve():
+    import configfuncs
+    import elementals
+    from elementals.base import ElementalFunction
+
+    assert elementals.ElementalFunction is ElementalFunction
+    assert configfuncs.run_function.__module__ == "configfuncs.loader"
+    assert "ElementalParams" in dir(elementals)
@@ -0,0 +1,67 @@
+import pytest
+
+from configfuncs.loader import run_function
+from elementals import instrument
+from elementals.examples.multiply import MultiplyFunction
+from elementals.params import ElementalParams
+from elementals.utils.param_paths import resolve_path, resolve_template
+
+
+class Recorder(instrument.Hook):
+    def __init__(self):
+        self.spans = []
+
+    def post(self, span):
+        self.spans.append(span)
+
+
+@pytest.fixture
+def exporter():
+    hook = instrument.add_hook(instrument.HistogramExporter())
+    yield hook
+    instrument.clear_hooks()
+
+
+def test_span_is_noop_without_hooks():
+    assert instrument.hooks == ()
+    assert instrument.span("run_dict", name="x") is instrument._NOOP
+    assert MultiplyFunction().run_dict(ElementalParams(params={"a": 2, "b": 3}))["data"]["product"] == 6
+
+
+def test_run_dict_span_tagged_with_function(exporter):
+    fn = MultiplyFunction()
+    for i in range(5):
+        fn.run_dict(ElementalParams(params={"a": i, "b": 2}))
+    stats = exporter.snapshot()[("run_dict", "Multiply")]
+    assert stats["count"] == 5 and stats["errors"] == 0
+    assert sum(stats["buckets"].values()) == 5
+    assert stats["min_ns"] <= exporter.percentile("run_dict", 50, "Multiply") <= stats["max_ns"]
+
+
+def test_run_function_sub_stages(exporter):
+    assert run_function("Multiply", params={"a": 2, "b": 5})["data"]["product"] == 10
+    keys = set(exporter.snapshot())
+    assert {("run_function", "Multiply"), ("config", "Multiply"),
+            ("params", "Multiply"), ("run", "Multiply")} <= keys
+
+
+def test_nested_spans_inherit_tags():
+    rec = instrument.add_hook(Recorder())
+    try:
+        with instrument.span("outer", name="Concat", role="transformer"):
+            resolve_path({"a": {"b": 1}}, "$.a.b")
+            resolve_template({"x": "$.a"}, {"a": 1})
+    finally:
+        instrument.clear_hooks()
+    inner = {s.stage: s for s in rec.spans}
+    assert inner["resolve_path"].tags == {"name": "Concat", "role": "transformer", "path": "$.a.b"}
+    assert inner["resolve_template"].tags["name"] == "Concat"
+    assert inner["resolve_path"].parent is inner["outer"]
+    assert instrument.current_span() is None
+
+
+def test_span_records_errors(exporter):
+    with pytest.raises(ValueError):
+        with instrument.span("boom", name="x"):
+            raise ValueError("bad")
+    assert exporter.snapshot()[("boom", "x")]["errors"] == 1
@@ -3,7 +3,13 @@ from typing import Any, Dict
 import pytest
 
 from elementals.params import ElementalParams, ProcessInfo, Environment, Meta
-from elementals.utils.param_paths import resolve_path, resolve_template, apply_path_map
+from elementals.utils.param_paths import (
+    apply_path_map,
+    compile_path,
+    compile_template,
+    resolve_path,
+    resolve_template,
+)
 
 
 def sample_params() -> ElementalParams:
@@ -70,3 +76,55 @@ def test_apply_path_map_alias():
     # environment is a model, should be dumped to dict
     assert isinstance(out["env"], dict)
     assert out["env"]["name"] == "qa"
+
+
+def test_compile_path_is_interned_and_reusable():
+    p = sample_params()
+    acc = compile_path("$params.items[1].val")
+    assert compile_path("$params.items[1].val") is acc
+    assert acc.tokens == ("params", "items", 1, "val")
+    assert acc.resolve(p) == 20
+    assert acc.resolve(ElementalParams(params={"items": [{}, {"val": 7}]})) == 7
+    assert resolve_path(p, acc) == 20
+
+
+def test_compiled_path_fast_and_fallback_hops():
+    p = ElementalParams(params={"rows": [[1, 2], [3, 4]], "pair": (5, 6)}, environment=Environment())
+    assert compile_path("$params.rows[-1][0]").resolve(p) == 3
+    assert compile_path("$params.pair[1]").resolve(p) == 6
+    assert compile_path("$environment.name").resolve(p) == "dev"
+    assert compile_path("$environment").resolve(p, dump_models=False) is p.environment
+
+
+def test_compiled_path_missing():
+    p = sample_params()
+    acc = compile_path("$params.items[5].val")
+    assert acc.resolve(p, default="d") == "d"
+    with pytest.raises(KeyError):
+        acc.resolve(p)
+    with pytest.raises(ValueError):
+        compile_path("params.a")
+
+
+def test_compile_template_shares_static_subtrees():
+    static = {"kind": "product", "tags": ["x", "y"]}
+    plan = compile_template({"static": static, "value": "$savepoint.last.product"})
+    first = plan.render(sample_params())
+    second = plan.render(ElementalParams(savepoint={"last": {"product": 1}}))
+    assert first == {"static": static, "value": 40}
+    assert second["value"] == 1
+    assert first["static"] is static and second["static"] is static
+    assert not plan.is_static
+    assert compile_template(static).render(sample_params()) is static
+
+
+def test_compile_template_on_missing_and_apply_path_map():
+    p = sample_params()
+    assert compile_template(["$params.nope"], on_missing="keep")(p) == ["$params.nope"]
+    with pytest.raises(KeyError):
+        compile_template({"x": ("$params.nope",)}, on_missing="error")(p)
+    with pytest.raises(ValueError):
+        compile_template({}, on_missing="bogus")
+    plan = compile_template({"a": "$params.a", "env": "$environment"})
+    out = apply_path_map(plan, p)
+    assert out["a"] == 2 and out["env"]["region"] == "eu"
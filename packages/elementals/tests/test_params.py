@@ -0,0 +1,22 @@
+from elementals.params import ElementalParams, Environment, Meta, ProcessInfo
+
+
+def test_trusted_matches_validated_surface():
+    meta = Meta(call_id="c")
+    payload = {"a": 1, "nested": {"b": [1, 2]}}
+    trusted = ElementalParams.trusted(payload, {"step": 1}, ProcessInfo(process_id="p"), None, meta)
+    validated = ElementalParams(params=payload, savepoint={"step": 1}, process={"process_id": "p"}, meta=meta)
+    assert trusted == validated
+    assert trusted.model_dump() == validated.model_dump()
+    assert trusted.params is payload  # stored as given, no copy
+    assert trusted.meta is meta
+
+
+def test_trusted_defaults_and_nested_dicts():
+    ep = ElementalParams.trusted(environment={"name": "qa"}, meta={"call_id": "x"})
+    assert ep.params == {} and ep.savepoint == {}
+    assert ep.process is None
+    assert isinstance(ep.environment, Environment) and ep.environment.name == "qa"
+    assert isinstance(ep.meta, Meta) and ep.meta.call_id == "x"
+    copied = ep.model_copy(update={"params": {"z": 1}})
+    assert copied.params == {"z": 1} and copied.environment is ep.environment
@@ -0,0 +1,100 @@
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
+
+from elementals.params import ElementalParams, Environment, ProcessInfo
+from elementals.utils import param_paths, pathmap
+from elementals.utils.path_engine import tokenize
+
+
+def sample_params() -> ElementalParams:
+    return ElementalParams(
+        params={
+            "a": 1,
+            "items": [{"id": 10}, {"id": 20}, {"id": 30}],
+            "grid": [[1, 2], [3, 4]],
+            "pair": ("x", "y"),
+            "frozen": MappingProxyType({"k": "v"}),
+            "obj": SimpleNamespace(name="ns", tags=["t0"]),
+            "text": "abc",
+            "zero": 0,
+            "none": None,
+        },
+        savepoint={"step": {"n": 3}},
+        process=ProcessInfo(process_id="p-1"),
+        environment=Environment(name="qa"),
+    )
+
+
+FOUND = [
+    ("$params.a", 1),
+    ("$params.items[1].id", 20),
+    ("$params.items[-1].id", 30),
+    ("$params.grid[1][0]", 3),
+    ("$params.grid[-1][-1]", 4),
+    ("$params.pair[0]", "x"),
+    ("$params.pair[-1]", "y"),
+    ("$params.frozen.k", "v"),
+    ("$params.obj.name", "ns"),
+    ("$params.obj.tags[0]", "t0"),
+    ("$params.text[1]", "b"),
+    ("$params.zero", 0),
+    ("$params.none", None),
+    ("$params.items[ 0 ].id", 10),
+    ("$savepoint.step.n", 3),
+    ("$process.process_id", "p-1"),
+    ("$environment.name", "qa"),
+]
+
+MISSES = [
+    "$params.nope",
+    "$params.items[3].id",
+    "$params.items[-4].id",
+    "$params.items.id",
+    "$params.a.b",
+    "$params.none.x",
+    "$params.frozen.nope",
+    "$params.obj.nope",
+    "$params.pair[2]",
+    "$params.items[0",
+    "$process.nope",
+    "$meta.call_id",
+]
+
+
+@pytest.mark.parametrize("path,expected", FOUND)
+def test_both_apis_agree_on_found_values(path, expected):
+    p = sample_params()
+    assert param_paths.resolve_path(p, path) == expected
+    assert pathmap.resolve_path(p, path) == expected
+    assert pathmap.resolve_path(p, path[1:]) == expected
+
+
+@pytest.mark.parametrize("path", MISSES)
+def test_each_api_keeps_its_missing_semantics(path):
+    p = sample_params()
+    with pytest.raises(KeyError):
+        param_paths.resolve_path(p, path)
+    assert param_paths.resolve_path(p, path, default="d") == "d"
+    assert pathmap.resolve_path(p, path) is None
+
+
+def test_models_dumped_only_by_param_paths():
+    p = sample_params()
+    assert param_paths.resolve_path(p, "$environment") == p.environment.model_dump()
+    assert pathmap.resolve_path(p, "$environment") is p.environment
+
+
+@pytest.mark.parametrize(
+    "path,tokens",
+    [
+        ("$params.a[0].b", ["params", "a", 0, "b"]),
+        ("params..a", ["params", "a"]),
+        ("$a[-2]", ["a", -2]),
+        ("$a[key]b", ["a", "key", "b"]),
+        ("$a[0", ["a", "[0"]),
+        ("$", []),
+    ],
+)
+def test_tokenize(path, tokens):
+    assert tokenize(path) == tokens
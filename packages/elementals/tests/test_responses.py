@@ -0,0 +1,74 @@
+from elementals.examples.multiply import MultiplyFunction
+from elementals.params import ElementalParams, Meta
+from elementals.responses import error_response, meta_dump, success_response
+
+
+def test_builders_match_response_shape():
+    meta = Meta(call_id="c1")
+    p = ElementalParams(params={}, meta=meta)
+    assert success_response(p, {"x": 1}) == {"status": "success", "data": {"x": 1}, "meta": meta.model_dump()}
+    assert error_response(p, "bad", "nope") == {
+        "status": "error",
+        "error": {"code": "bad", "message": "nope"},
+        "data": None,
+        "meta": meta.model_dump(),
+    }
+    assert error_response(ElementalParams(), "bad", "nope", {"k": 1})["error"]["details"] == {"k": 1}
+    assert success_response(ElementalParams(), 1)["meta"] is None
+
+
+def test_meta_serialized_once_per_instance():
+    meta = Meta(call_id="c1", config={"tier": {"name": "gold"}})
+    fn = MultiplyFunction()
+    outs = [fn.run(ElementalParams(params={"a": i, "b": 2}, meta=meta)) for i in range(3)]
+    assert meta.dump_cached() is meta.dump_cached()
+    assert outs[0]["meta"] == outs[1]["meta"] == meta.model_dump()
+    # each response owns its meta dict: mutating one does not leak into later calls
+    outs[0]["meta"]["call_id"] = "tampered"
+    outs[1]["meta"]["config"]["tier"]["name"] = "tampered"
+    again = fn.run(ElementalParams(params={"a": 1, "b": 2}, meta=meta))
+    assert again["meta"] == meta.model_dump() and meta.call_id == "c1"
+
+
+def test_meta_cache_invalidated_on_field_change():
+    meta = Meta(call_id="c1")
+    first = meta_dump(meta)
+    meta.call_id = "c2"
+    assert meta_dump(meta)["call_id"] == "c2"
+    assert first["call_id"] == "c1"
+    copied = meta.model_copy(update={"call_id": "c3"})
+    assert meta_dump(copied)["call_id"] == "c3"
+    assert copied == Meta(call_id="c3", timestamp=meta.timestamp)
+
+
+def test_compact_response_matches_dict_builders():
+    import json
+
+    from elementals.responses import CompactResponse, set_compact
+
+    def _iso(value):
+        return value.isoformat()
+
+    meta = Meta(call_id="c1")
+    p = ElementalParams(params={}, meta=meta)
+    plain_ok, plain_err = success_response(p, {"x": [1, 2]}), error_response(p, "bad", "nope", {"k": 1})
+    previous = set_compact(True)
+    try:
+        ok, err = success_response(p, {"x": [1, 2]}), error_response(p, "bad", "nope", {"k": 1})
+        multiplied = MultiplyFunction().run(ElementalParams(params={"a": 2, "b": 3}, meta=meta))
+    finally:
+        set_compact(previous)
+    assert isinstance(ok, CompactResponse) and isinstance(multiplied, CompactResponse)
+    assert ok == plain_ok and err == plain_err
+    assert list(err) == list(plain_err) and ok.to_dict() == plain_ok
+    assert ok["meta"] == meta_dump(meta) and multiplied["data"]["product"] == 6
+    assert json.loads(ok.to_json(default=_iso)) == json.loads(json.dumps(plain_ok, default=_iso))
+    assert err.to_json(default=_iso) == json.dumps(plain_err, default=_iso, separators=(",", ":")).encode()
+    assert "error" not in ok and CompactResponse("success").to_json() == b'{"status":"success","data":null,"meta":null}'
+
+
+def test_meta_json_cache_invalidated_on_field_change():
+    meta = Meta(call_id="c1")
+    assert meta.json_cached() is meta.json_cached()
+    meta.call_id = "c2"
+    assert b'"call_id":"c2"' in meta.json_cached()
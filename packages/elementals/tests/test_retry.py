@@ -0,0 +1,158 @@
+import asyncio
+import random
+import threading
+from typing import Any, Dict
+
+import pytest
+
+from configfuncs.loader import arun_function
+from elementals.aio import AsyncExecutor
+from elementals.base import ElementalFunction, FunctionCharacteristics
+from elementals.enums import RoleInProcess
+from elementals.params import ElementalParams, Environment, Meta
+from elementals.responses import error_response, success_response
+from elementals.retry import RetryExecutor
+
+
+class Flaky(ElementalFunction[Dict[str, Any]]):
+    """Fails `failures` times (alternating error code and exception), then succeeds."""
+
+    def __init__(self, failures: int, code: str = "exception"):
+        super().__init__(FunctionCharacteristics("Flaky", "", RoleInProcess.BUSINESS_ACTION))
+        self.failures = failures
+        self.code = code
+        self.calls = 0
+
+    def run(self, params: ElementalParams) -> Dict[str, Any]:
+        self.calls += 1
+        if self.calls <= self.failures:
+            if self.calls % 2:
+                raise RuntimeError("flaky")
+            return error_response(params, self.code, "try again")
+        return success_response(params, {"calls": self.calls})
+
+
+class OnlyTimeouts(ElementalFunction[Dict[str, Any]]):
+    def __init__(self, role=RoleInProcess.RETRY_ANALYSIS):
+        super().__init__(FunctionCharacteristics("OnlyTimeouts", "", role))
+        self.seen = []
+
+    def run(self, params: ElementalParams) -> Dict[str, Any]:
+        self.seen.append(params.params)
+        return success_response(params, {"retry": params.params["error"]["code"] == "timeout", "delay": 0})
+
+
+def ep(max_retries, meta=None):
+    return ElementalParams(params={}, environment=Environment(max_retries=max_retries), meta=meta)
+
+
+def test_retries_up_to_max_retries_and_records_meta():
+    retry = RetryExecutor(base_delay=0.001, rng=random.Random(1))
+    meta = Meta(call_id="c1")
+    out = retry.run(Flaky(2), ep(3, meta))
+    assert out["status"] == "success" and out["data"] == {"calls": 3}
+    assert out["meta"]["call_id"] == "c1"
+    assert out["meta"]["retry"]["attempts"] == 3
+    assert len(out["meta"]["retry"]["delays_ms"]) == 2
+    assert "retry" not in meta.dump_cached()  # shared meta dump is not mutated
+
+    out = retry.run(Flaky(5), ep(1))
+    assert out["error"]["code"] == "exception" and out["meta"]["retry"]["attempts"] == 2
+    assert retry.run(Flaky(1), ElementalParams())["meta"]["retry"]["attempts"] == 1
+
+
+def test_backoff_is_exponential_with_jitter_and_capped():
+    retry = RetryExecutor(base_delay=0.1, max_delay=0.3, rng=random.Random(7))
+    for attempt, cap in [(1, 0.1), (2, 0.2), (3, 0.3), (8, 0.3)]:
+        assert all(0 <= retry.backoff(attempt) <= cap for _ in range(50))
+
+
+def test_analyzer_decides_what_is_retryable():
+    analyzer = OnlyTimeouts()
+    retry = RetryExecutor(analyzer, base_delay=0.001)
+    out = retry.run(Flaky(2, code="timeout"), ep(5))
+    assert out["status"] == "error" and out["error"]["code"] == "exception"  # exceptions not retried
+    assert analyzer.seen[0]["function"] == "Flaky" and analyzer.seen[0]["attempt"] == 1
+    with pytest.raises(ValueError):
+        RetryExecutor(OnlyTimeouts(RoleInProcess.BUSINESS_ACTION))
+
+
+class Down(OnlyTimeouts):
+    def run(self, params: ElementalParams) -> Dict[str, Any]:
+        self.seen.append(params.params)
+        raise RuntimeError("analyzer down")
+
+
+def test_failing_analyzer_falls_back_to_retryable_codes():
+    analyzer = Down()
+    retry = RetryExecutor(analyzer, base_delay=0.001)
+    out = retry.run(Flaky(2, code="timeout"), ep(3))
+    assert out["status"] == "success" and out["meta"]["retry"]["attempts"] == 3
+    assert len(analyzer.seen) == 2
+
+    out = retry.run(Flaky(2, code="bad_input"), ep(3))
+    assert out["error"]["code"] == "bad_input" and out["meta"]["retry"]["attempts"] == 2
+
+
+def test_async_failing_analyzer_falls_back_to_retryable_codes():
+    analyzer = Down()
+    retry = RetryExecutor(analyzer, base_delay=0.001)
+    out = asyncio.run(retry.arun(Flaky(2, code="timeout"), ep(3)))
+    assert out["status"] == "success" and out["meta"]["retry"]["attempts"] == 3
+    assert len(analyzer.seen) == 2
+
+    out = asyncio.run(retry.arun(Flaky(2, code="bad_input"), ep(3)))
+    assert out["error"]["code"] == "bad_input" and out["meta"]["retry"]["attempts"] == 2
+
+
+def test_async_retries_sleep_on_the_loop():
+    retry = RetryExecutor(base_delay=0.001)
+
+    async def main():
+        return await asyncio.gather(*(retry.arun(Flaky(2), ep(2)) for _ in range(20)))
+
+    outs = asyncio.run(main())
+    assert all(o["status"] == "success" and o["meta"]["retry"]["attempts"] == 3 for o in outs)
+
+
+def test_async_analyzer_runs_off_the_loop():
+    class ThreadRecorder(OnlyTimeouts):
+        def run(self, params: ElementalParams) -> Dict[str, Any]:
+            self.seen.append(threading.get_ident())
+            return success_response(params, {"retry": True, "delay": 0})
+
+    analyzer = ThreadRecorder()
+    out = asyncio.run(RetryExecutor(analyzer).arun(Flaky(2, code="timeout"), ep(3)))
+    assert out["status"] == "success" and len(analyzer.seen) == 2
+    assert threading.get_ident() not in analyzer.seen
+
+
+def test_arun_function_with_retry():
+    out = asyncio.run(arun_function(
+        "LCM", params={"a": 0, "b": 0}, environment={"max_retries": 2},
+        retry=RetryExecutor(base_delay=0.001),
+    ))
+    # lcm(0, 0) raises ZeroDivisionError inside run(): reported as "exception" after 3 attempts
+    assert out["error"]["code"] == "exception"
+    assert out["meta"]["retry"]["attempts"] == 3
+
+
+def test_arun_function_with_retry_uses_the_given_executor():
+    class Recording(AsyncExecutor):
+        def __init__(self):
+            super().__init__()
+            self.calls = 0
+
+        async def run(self, fn, params):
+            self.calls += 1
+            return await super().run(fn, params)
+
+    executor = Recording()
+    try:
+        out = asyncio.run(arun_function(
+            "LCM", params={"a": 0, "b": 0}, environment={"max_retries": 1},
+            executor=executor, retry=RetryExecutor(base_delay=0.001),
+        ))
+    finally:
+        executor.shutdown()
+    assert out["meta"]["retry"]["attempts"] == 2 and executor.calls == 2
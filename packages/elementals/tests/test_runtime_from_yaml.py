@@ -26,3 +26,9 @@ def test_run_concat_via_yaml_helper():
     out = run_function("Concat", params={"text1": "A", "text2": "B"})
     assert out["status"] == "success"
     assert out["data"]["concat"] == "AB"
+
+
+def test_run_multiply_via_yaml_helper_trusted():
+    out = run_function("Multiply", params={"a": 2, "b": 5}, trusted=True)
+    assert out["status"] == "success"
+    assert out["data"]["product"] == 10
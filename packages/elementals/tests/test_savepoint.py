@@ -0,0 +1,72 @@
+import pytest
+
+from elementals.examples.echo import EchoFunction
+from elementals.params import ElementalParams
+from elementals.savepoint import MAX_LAYERS, LayeredSavepoint, apply_diff
+from elementals.utils.param_paths import resolve_path
+
+
+def base():
+    return {"order": {"id": 1, "lines": [{"sku": "a"}, {"sku": "b"}]}, "draft": True, "step": 0}
+
+
+def test_writes_are_copy_on_write():
+    b = base()
+    sp = LayeredSavepoint(b)
+    sp["step"] = 1
+    sp["note"] = "x"
+    del sp["draft"]
+    assert b == base()
+    assert dict(sp) == {"order": b["order"], "step": 1, "note": "x"}
+    assert "draft" not in sp and len(sp) == 3
+    with pytest.raises(KeyError):
+        del sp["draft"]
+    assert sp.diff() == {"set": {"step": 1, "note": "x"}, "unset": ["draft"]}
+    assert sp.materialize() == apply_diff(b, sp.diff())
+
+
+def test_steps_layer_deltas():
+    sp = LayeredSavepoint(base())
+    sp["step"] = 1
+    sp = sp.next_step()
+    sp["step"] = 2
+    sp["draft"] = False
+    assert sp["step"] == 2 and sp.diff()["set"] == {"step": 2, "draft": False}
+    for i in range(MAX_LAYERS * 2):
+        sp["step"] = i
+        sp = sp.next_step()
+    assert len(sp._layers) <= MAX_LAYERS
+    assert sp["step"] == MAX_LAYERS * 2 - 1 and sp["draft"] is False
+
+    applied = LayeredSavepoint(base()).apply({"set": {"step": 9}, "unset": ["draft"]})
+    assert dict(applied) == {"order": base()["order"], "step": 9}
+    assert applied.rebase().base == dict(applied)
+
+
+def test_next_step_freezes_a_copy_of_the_delta():
+    sp = LayeredSavepoint(base())
+    sp["a"] = 1
+    nxt = sp.next_step()
+    sp["y"] = 2
+    del sp["a"]
+    assert nxt.get("y") is None and nxt["a"] == 1
+    assert nxt.diff() == {"set": {"a": 1}, "unset": []}
+
+
+def test_params_keep_view_and_paths_read_through():
+    sp = LayeredSavepoint(base())
+    sp["extra"] = {"k": [10, 20]}
+    ep = ElementalParams(params={}, savepoint=sp)
+    assert ep.savepoint is sp
+    assert resolve_path(ep, "$savepoint.order.lines[-1].sku") == "b"
+    assert resolve_path(ep, "$savepoint.extra.k[1]") == 20
+    assert ep.model_dump()["savepoint"] == sp.materialize()
+    assert ElementalParams.trusted(savepoint=sp).savepoint is sp
+    assert type(ElementalParams(savepoint={"a": 1}).savepoint) is dict
+
+
+def test_echo_returns_only_the_diff():
+    sp = LayeredSavepoint(base())
+    sp["step"] = 5
+    out = EchoFunction().run(ElementalParams(params={"a": 1}, savepoint=sp))
+    assert out["data"] == {"echo": {"a": 1}, "savepoint_diff": {"set": {"step": 5}, "unset": []}}
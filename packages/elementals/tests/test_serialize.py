@@ -0,0 +1,89 @@
+import json
+from datetime import date, datetime, timezone
+
+import pytest
+
+from elementals import serialize
+from elementals.buffers import Rope
+from elementals.enums import RoleInProcess
+from elementals.examples.echo import EchoFunction
+from elementals.examples.lcm import LCMFunction
+from elementals.examples.multiply import MultiplyFunction
+from elementals.params import ElementalParams, Meta
+from elementals.responses import CompactResponse, success_response
+from elementals.savepoint import LayeredSavepoint
+
+
+@pytest.fixture(params=["json", "orjson"])
+def backend(request):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    previous = serialize.set_backend(request.param)
+    yield request.param
+    serialize.set_backend(previous)
+
+
+def test_dumps_handles_framework_types(backend):
+    when = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    value = {
+        "when": when,
+        "role": RoleInProcess.ROLLBACK,
+        "meta": Meta(call_id="c1", timestamp=when),
+        "sp": LayeredSavepoint({"a": 1}),
+        "rope": Rope(["ab", "c"]),
+        "blob": memoryview(b"\x00\x01"),
+        "big": 2**70,
+    }
+    assert serialize.backend_name() == backend
+    assert json.loads(serialize.dumps(value)) == {
+        "when": "2024-05-01T12:30:00+00:00",
+        "role": "rollback",
+        "meta": {"call_id": "c1", "timestamp": "2024-05-01T12:30:00Z", "config": {}},
+        "sp": {"a": 1},
+        "rope": "abc",
+        "blob": "AAE=",
+        "big": 2**70,
+    }
+    with pytest.raises(TypeError):
+        serialize.dumps({"x": object()})
+
+
+def test_run_bytes_matches_run_dict(backend):
+    meta = Meta(call_id="c1")
+    params = ElementalParams(params={"msg": "hi", "n": [1, 2]}, meta=meta)
+    fn = EchoFunction()
+    assert json.loads(fn.run_bytes(params)) == json.loads(json.dumps(fn.run_dict(params), default=serialize.default))
+    lcm = LCMFunction().run_bytes(ElementalParams(params={"a": 2**61 - 1, "b": 2**31 - 1}, meta=meta))
+    assert json.loads(lcm)["data"]["lcm"] == (2**61 - 1) * (2**31 - 1)
+
+
+def test_run_bytes_encodes_meta_like_dumps(backend):
+    meta = Meta(call_id="c1", config={"day": date(2024, 5, 1), "role": RoleInProcess.ROLLBACK})
+    params = ElementalParams(params={"a": 2, "b": 3}, meta=meta)
+    fn = MultiplyFunction()
+    assert fn.run_bytes(params) == serialize.dumps(fn.run_dict(params))
+    assert json.loads(fn.run_bytes(params))["meta"]["config"] == {"day": "2024-05-01", "role": "rollback"}
+
+
+def test_run_bytes_builds_compact_responses_only_for_the_call():
+    p = ElementalParams(params={}, meta=Meta(call_id="c1"))
+    seen = []
+
+    class Probe(EchoFunction):
+        def run(self, params):
+            seen.append(success_response(params, 1))
+            return seen[-1]
+
+    Probe().run_bytes(p)
+    assert isinstance(seen[0], CompactResponse)
+    assert type(success_response(p, 1)) is dict
+
+
+def test_custom_backend():
+    previous = serialize.set_backend(lambda obj: b"custom")
+    try:
+        assert serialize.dumps({"a": 1}) == b"custom"
+    finally:
+        serialize.set_backend(previous)
+    with pytest.raises(ValueError):
+        serialize.set_backend("yaml")
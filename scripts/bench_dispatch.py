@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+"""
+Microbenchmark: per-call overhead of run_function() vs. the instantiate-per-call path.
+
+Usage (from repo root; needs customerfunctions/configFunctions.yaml in a parent folder):
+  python scripts/bench_dispatch.py --number 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for sub in ("elementals", "configfuncs"):
+    sys.path.insert(0, os.path.join(ROOT, "packages", sub, "src"))
+
+from configfuncs.loader import get_function_instance, run_function  # noqa: E402
+from elementals.params import ElementalParams  # noqa: E402
+
+
+def per_call_instance() -> None:
+    fn = get_function_instance("Multiply")
+    fn.run(ElementalParams(params={"a": 3, "b": 4}))
+
+
+def dispatched() -> None:
+    run_function("Multiply", params={"a": 3, "b": 4})
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__)
+    p.add_argument("--number", type=int, default=20000)
+    p.add_argument("--repeat", type=int, default=5)
+    args = p.parse_args()
+    for label, fn in (("instance per call", per_call_instance), ("dispatcher", dispatched)):
+        best = min(timeit.repeat(fn, number=args.number, repeat=args.repeat))
+        print(f"{label:<20} {best / args.number * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""
+Microbenchmark: validated ElementalParams(...) vs. ElementalParams.trusted(...).
+
+Usage (from repo root; the run_function rows need customerfunctions/configFunctions.yaml):
+  python scripts/bench_params.py --number 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for sub in ("elementals", "configfuncs"):
+    sys.path.insert(0, os.path.join(ROOT, "packages", sub, "src"))
+
+from configfuncs.loader import run_function  # noqa: E402
+from elementals.params import ElementalParams, Environment, Meta, ProcessInfo  # noqa: E402
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__)
+    p.add_argument("--number", type=int, default=50000)
+    p.add_argument("--repeat", type=int, default=5)
+    args = p.parse_args()
+    meta = Meta(call_id="bench")
+    process = ProcessInfo(process_id="p-1")
+    env = Environment()
+    small = {"a": 3, "b": 4}
+    wide = {f"k{i}": i for i in range(200)}
+    savepoint = {f"step{i}": {"out": i} for i in range(50)}
+    cases = {
+        "small/validated": lambda: ElementalParams(params=small, meta=meta),
+        "small/trusted": lambda: ElementalParams.trusted(small, None, None, None, meta),
+        "wide/validated": lambda: ElementalParams(
+            params=wide, savepoint=savepoint, process=process, environment=env, meta=meta),
+        "wide/trusted": lambda: ElementalParams.trusted(wide, savepoint, process, env, meta),
+        "run_function/validated": lambda: run_function("Multiply", params=small, meta=meta),
+        "run_function/trusted": lambda: run_function("Multiply", params=small, meta=meta, trusted=True),
+    }
+    for label, call in cases.items():
+        best = min(timeit.repeat(call, number=args.number, repeat=args.repeat))
+        print(f"{label:<24} {best / args.number * 1e9:8.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+Microbenchmark: param_paths.resolve_path vs. pathmap.resolve_path on the same paths.
+
+Usage (from repo root):
+  python scripts/bench_paths.py --number 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "packages", "elementals", "src"))
+
+from elementals.params import ElementalParams, ProcessInfo  # noqa: E402
+from elementals.utils import param_paths, pathmap  # noqa: E402
+
+PATHS = [
+    "$params.a",
+    "$params.items[1].val",
+    "$savepoint.deep.l1.l2.l3.l4",
+    "$process.process_id",
+    "$params.nope",
+]
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__)
+    p.add_argument("--number", type=int, default=100000)
+    p.add_argument("--repeat", type=int, default=5)
+    args = p.parse_args()
+    ep = ElementalParams(
+        params={"a": 1, "items": [{"val": 1}, {"val": 2}]},
+        savepoint={"deep": {"l1": {"l2": {"l3": {"l4": 4}}}}},
+        process=ProcessInfo(process_id="p-1"),
+    )
+    for path in PATHS:
+        for label, call in (
+            ("param_paths", lambda: param_paths.resolve_path(ep, path, default=None)),
+            ("pathmap", lambda: pathmap.resolve_path(ep, path)),
+        ):
+            best = min(timeit.repeat(call, number=args.number, repeat=args.repeat))
+            print(f"{label:<12} {path:<30} {best / args.number * 1e9:8.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ Usage (from repo root):
 
 This will:
   - Append an entry to packages/configfuncs/src/configfuncs/configFunctions.yaml
+  - Regenerate the config snapshot next to it (configfuncs.snapshot)
   - Create packages/elementals/src/elementals/examples/sum.py
   - Create packages/elementals/tests/test_sum.py
 """
@@ -15,6 +16,7 @@ from __future__ import annotations
 
 import argparse
 import re
+import sys
 from pathlib import Path
 from typing import Dict
 
@@ -25,6 +27,9 @@ YAML_PATH = REPO_ROOT.parent / "customerfunctions" / "configFunctions.yaml"
 EXAMPLES_DIR = REPO_ROOT / "packages" / "elementals" / "src" / "elementals" / "examples"
 TESTS_DIR = REPO_ROOT / "packages" / "elementals" / "tests"
 
+for sub in ("elementals", "configfuncs"):
+    sys.path.insert(0, str(REPO_ROOT / "packages" / sub / "src"))
+
 
 def to_snake(name: str) -> str:
     s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
@@ -52,40 +57,28 @@ def save_yaml(data: Dict) -> None:
         yaml.safe_dump(data, f, sort_keys=True, allow_unicode=True)
 
 
+def save_snapshot() -> None:
+    """Recompile the snapshot so it is not left stale by the YAML we just wrote."""
+    from configfuncs.snapshot import write_snapshot
+
+    print(f"[write] {write_snapshot(YAML_PATH)}")
+
+
 TEMPLATE_MODULE = """from typing import Any, Dict
-from ..base import ElementalFunction, FunctionCharacteristics
-from ..enums import RoleInProcess, SyncType, ResourceType, DurationClass
+from ..base import ElementalFunction
 from ..params import ElementalParams
-from configfuncs.loader import load_config
+from ..responses import error_response, success_response
+from configfuncs.loader import get_characteristics
 
 
 class {ClassName}Function(ElementalFunction[Dict[str, Any]]):
     def __init__(self):
-        cfg = load_config().get("{ConfigName}", {{}})
-        name = cfg.get("name", "{DefaultName}")
-        desc = cfg.get("description", "{DefaultDesc}")
-        role = RoleInProcess(cfg.get("role", RoleInProcess.BUSINESS_ACTION.value))
-        sync = SyncType(cfg.get("sync", SyncType.SYNC.value))
-        resource = ResourceType(cfg.get("resource_type", ResourceType.CPU.value))
-        duration = DurationClass(cfg.get("duration", DurationClass.SHORT.value))
-
-        super().__init__(FunctionCharacteristics(
-            name=name,
-            description=desc,
-            role=role,
-            sync=sync,
-            resource_type=resource,
-            duration=duration,
-        ))
+        super().__init__(get_characteristics("{ConfigName}", description="{DefaultDesc}"))
 
     def run(self, params: ElementalParams) -> Dict[str, Any]:
-        # TODO: implement logic; for now return a not_implemented error
-        return {{
-            "status": "error",
-            "error": {{"code": "not_implemented", "message": "Function not implemented yet"}},
-            "data": None,
-            "meta": (params.meta.model_dump() if params.meta else None),
-        }}
+        # TODO: implement logic and return success_response(params, {{...}});
+        # for now return a not_implemented error
+        return error_response(params, "not_implemented", "Function not implemented yet")
 """
 
 
@@ -134,6 +127,7 @@ def main() -> None:
     })
     data[cfg_name] = entry
     save_yaml(data)
+    save_snapshot()
 
     # 2) Create module file
     EXAMPLES_DIR.mkdir(parents=True, exist_ok=True)
@@ -144,7 +138,6 @@ def main() -> None:
         content = TEMPLATE_MODULE.format(
             ClassName=class_name,
             ConfigName=cfg_name,
-            DefaultName=cfg_name,
             DefaultDesc=args.description,
         )
         module_path.write_text(content, encoding="utf-8")